@@ -1,12 +1,20 @@
 """Streamlit UI for the Autonomous Job Search Agent."""
 from __future__ import annotations
 
-import csv
+import copy
 import os
+import re
+import shutil
 import sys
 from pathlib import Path
 
 import streamlit as st
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YLoader
 
 ROOT = Path(__file__).resolve().parent
 sys.path.insert(0, str(ROOT))
@@ -26,7 +34,7 @@ log = get_logger(__name__)
 
 # ── Constants ────────────────────────────────────────────────────────────
 
-COMMON_SKILLS: list[str] = [
+COMMON_SKILLS: tuple[str, ...] = (
     "Python", "Java", "JavaScript", "TypeScript", "React", "Node.js",
     "Angular", "Vue.js", "SQL", "NoSQL", "MongoDB", "PostgreSQL", "MySQL",
     "Redis", "Docker", "Kubernetes", "AWS", "GCP", "Azure", "Terraform",
@@ -39,13 +47,13 @@ COMMON_SKILLS: list[str] = [
     "UI/UX", "Communication", "Leadership", "Project Management",
     "Stakeholder Management", "RPA", "AI Automation",
     "Incident Response", "Root Cause Analysis", "SRE",
-]
+)
 
-CITIES: list[str] = [
+CITIES: tuple[str, ...] = (
     "Bangalore", "Mumbai", "Delhi", "Hyderabad", "Pune", "Chennai",
     "Kolkata", "Gurgaon", "Noida", "Ahmedabad", "Jaipur", "Lucknow",
     "Chandigarh", "Kochi", "Indore", "Remote",
-]
+)
 
 _GLASS_CSS = """
 <style>
@@ -91,16 +99,6 @@ _GLASS_CSS = """
 h1, h2, h3 {
     color: #1a1a2e;
 }
-/* role card */
-.role-card {
-    padding: 1rem 1.25rem;
-    background: rgba(255,255,255,0.65);
-    backdrop-filter: blur(10px);
-    -webkit-backdrop-filter: blur(10px);
-    border: 1px solid rgba(74,144,217,0.25);
-    border-radius: 12px;
-    box-shadow: 0 4px 16px rgba(0,0,0,0.05);
-}
 /* review blocks */
 .review-original {
     padding: 0.5rem 0.75rem; background: rgba(231,76,60,0.08);
@@ -118,16 +116,33 @@ h1, h2, h3 {
 # ── Helpers ──────────────────────────────────────────────────────────────
 
 
+# KEY=value assignment lines; comments and blank lines never match.
+_ENV_RE = re.compile(r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$", re.M)
+
+
+@st.cache_data(show_spinner=False)
+def _read_env_file(path: str, mtime: float) -> dict[str, str]:
+    """Parse a .env file; cached per (path, mtime) so reruns skip the disk."""
+    return dict(_ENV_RE.findall(Path(path).read_text(encoding="utf-8")))
+
+
 def _load_env() -> dict[str, str]:
     env_path = ROOT / ".env"
-    values: dict[str, str] = {}
-    if env_path.exists():
-        for line in env_path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                k, _, v = line.partition("=")
-                values[k.strip()] = v.strip()
-    return values
+    try:
+        mtime = env_path.stat().st_mtime
+    except FileNotFoundError:
+        return {}
+    return _read_env_file(str(env_path), mtime)
+
+
+@st.cache_data(show_spinner=False)
+def _parse_env_template(path: str, mtime: float) -> list[tuple[str | None, str]]:
+    """Split .env.example into (key, raw_line) rows; key is None for comments/blanks."""
+    rows: list[tuple[str | None, str]] = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        m = _ENV_RE.match(line)
+        rows.append((m.group(1) if m else None, line))
+    return rows
 
 
 def _save_env(values: dict[str, str]) -> None:
@@ -137,41 +152,84 @@ def _save_env(values: dict[str, str]) -> None:
     lines: list[str] = []
     written: set[str] = set()
 
-    if template_path.exists():
-        for line in template_path.read_text(encoding="utf-8").splitlines():
-            stripped = line.strip()
-            if stripped and not stripped.startswith("#") and "=" in stripped:
-                k, _, _ = stripped.partition("=")
-                k = k.strip()
-                lines.append(f"{k}={values.get(k, '')}")
-                written.add(k)
-            else:
-                lines.append(line)
+    try:
+        template = _parse_env_template(str(template_path), template_path.stat().st_mtime)
+    except FileNotFoundError:
+        template = []
+    for k, line in template:
+        if k is None:
+            lines.append(line)
+        else:
+            lines.append(f"{k}={values.get(k, '')}")
+            written.add(k)
 
     for k, v in values.items():
         if k not in written:
             lines.append(f"{k}={v}")
 
     env_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    _read_env_file.clear()
+
+
+@st.cache_data(show_spinner=False)
+def _read_profile(path: str, mtime: float) -> dict | None:
+    """Parse profile YAML; cached per (path, mtime) so reruns skip the parse."""
+    with open(path) as f:
+        return yaml.load(f, Loader=_YLoader)
 
 
 def _load_profile() -> dict | None:
-    if not PROFILE_PATH.exists():
+    try:
+        mtime = PROFILE_PATH.stat().st_mtime
+    except FileNotFoundError:
         return None
-    import yaml
+    return _read_profile(str(PROFILE_PATH), mtime)
 
-    with open(PROFILE_PATH) as f:
-        return yaml.safe_load(f)
 
+_STATE_DEFAULTS: tuple[tuple[str, object], ...] = (
+    ("parsed", {}),
+    ("resume_feedback", []),
+    ("last_result", None),
+    ("_groq_key", ""),
+)
 
-def _groq_key() -> str:
-    return (
-        _load_env().get("GROQ_API_KEY", "")
-        or st.session_state.get("_groq_key", "")
-    )
 
+def _init_state() -> None:
+    """Seed session keys once so pages can index them directly."""
+    for key, default in _STATE_DEFAULTS:
+        if key not in st.session_state:
+            st.session_state[key] = copy.copy(default)
 
-def _status() -> dict[str, bool]:
+
+def _groq_key(env: dict[str, str] | None = None) -> str:
+    if env is None:
+        env = _load_env()
+    return env.get("GROQ_API_KEY", "") or st.session_state["_groq_key"]
+
+
+def _cached_resume_path() -> Path | None:
+    """Resume path memoized in session state; re-probed only when missing."""
+    cached = st.session_state.get("_resume_path")
+    if cached is not None and cached.exists():
+        return cached
+    path = get_resume_path()
+    if path is not None:
+        st.session_state["_resume_path"] = path
+    else:
+        st.session_state.pop("_resume_path", None)
+    return path
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
+
+
+@st.cache_data(show_spinner=False)
+def _status_snapshot(env_mtime: float, profile_mtime: float, resume_mtime: float) -> dict[str, bool]:
+    """Setup checklist; cached until .env, the profile or resume/ changes."""
     env = _load_env()
     has_search_key = bool(
         env.get("SERPAPI_KEY")
@@ -180,13 +238,71 @@ def _status() -> dict[str, bool]:
         or env.get("RAPIDAPI_KEY")
     )
     return {
-        "profile": PROFILE_PATH.exists(),
+        "profile": profile_mtime > 0,
         "resume": get_resume_path() is not None,
         "groq_key": bool(env.get("GROQ_API_KEY")),
         "api_keys": has_search_key,
     }
 
 
+def _status() -> dict[str, bool]:
+    return _status_snapshot(
+        _mtime(ROOT / ".env"), _mtime(PROFILE_PATH), _mtime(RESUME_DIR),
+    )
+
+
+@st.cache_data(show_spinner=False)
+def _merge_options(defaults: tuple[str, ...], base: tuple[str, ...]) -> list[str]:
+    """Order-preserving union of profile values and the built-in option list."""
+    return list(dict.fromkeys(defaults + base))
+
+
+# Heavy modules are imported on first use and pinned in the resource cache.
+
+
+@st.cache_resource(show_spinner=False)
+def _agent_run():
+    from src.agent import run
+
+    return run
+
+
+@st.cache_resource(show_spinner=False)
+def _resume_parser():
+    from src import resume_parser
+
+    return resume_parser
+
+
+@st.cache_resource(show_spinner=False)
+def _profile_generator():
+    from src import profile_generator
+
+    return profile_generator
+
+
+@st.cache_resource(show_spinner=False)
+def _secrets_manager():
+    from src import secrets_manager
+
+    return secrets_manager
+
+
+@st.cache_resource(show_spinner=False)
+def _groq_client(api_key: str):
+    """One Groq (OpenAI-compatible) client per key, sharing its HTTP pool."""
+    from src.groq_client import get_client
+
+    return get_client(api_key)
+
+
+@st.cache_resource(show_spinner=False)
+def _pandas():
+    import pandas
+
+    return pandas
+
+
 def _check(label: str, ok: bool) -> str:
     icon = "✅" if ok else "⬜"
     return f"{icon}  {label}"
@@ -199,6 +315,47 @@ def _setup_done() -> bool:
 # ── Page: Setup ──────────────────────────────────────────────────────────
 
 
+@st.fragment
+def _resume_review_fragment(resume_for_review: Path, groq_key: str) -> None:
+    if st.button("Review My Resume", use_container_width=True):
+        with st.spinner("Analyzing your resume for improvements…"):
+            try:
+                feedback = _resume_parser().review_resume(
+                    resume_for_review, api_key=groq_key,
+                    client=_groq_client(groq_key) if groq_key else None,
+                )
+                st.session_state["resume_feedback"] = feedback
+            except Exception as exc:
+                st.error(f"Review failed: {exc}")
+
+    feedback = st.session_state["resume_feedback"]
+    if feedback:
+        _CAT_ICONS = {
+            "Structure": "🏗️", "Metrics": "📊", "Keywords": "🔑",
+            "Skills Gap": "🧩", "Wording": "✏️", "Formatting": "📐",
+        }
+        for item in feedback:
+            cat = item.get("category", "Tip")
+            icon = _CAT_ICONS.get(cat, "💡")
+            original = item.get("original", "")
+            replacement = item.get("replacement", "")
+            reason = item.get("reason", "")
+
+            with st.expander(f"{icon}  **{cat}**", expanded=True):
+                if original and original != "[missing]":
+                    st.markdown("**Current text:**")
+                    st.markdown(f'<div class="review-original">{original}</div>', unsafe_allow_html=True)
+                elif original == "[missing]":
+                    st.markdown("**Missing from your resume**")
+
+                if replacement:
+                    st.markdown("**Replace with:**")
+                    st.markdown(f'<div class="review-replacement">{replacement}</div>', unsafe_allow_html=True)
+
+                if reason:
+                    st.caption(reason)
+
+
 def page_setup() -> None:
     st.header("Autonomous Job Search Agent")
     st.write("Get started — add your API key, upload your resume, review your profile.")
@@ -284,7 +441,7 @@ def page_setup() -> None:
             st.success("API keys saved!")
             st.rerun()
 
-    if not has_groq and not st.session_state.get("_groq_key"):
+    if not has_groq and not st.session_state["_groq_key"]:
         st.warning("Enter your Groq API key above to unlock resume parsing, role suggestions, and AI review.")
         return
 
@@ -300,26 +457,31 @@ def page_setup() -> None:
     if uploaded:
         ensure_dirs()
         dest = RESUME_DIR / uploaded.name
-        dest.write_bytes(uploaded.getvalue())
+        uploaded.seek(0)
+        with open(dest, "wb") as f:
+            shutil.copyfileobj(uploaded, f, length=1 << 20)
+        st.session_state.pop("_resume_path", None)
         st.success(f"Saved to `resume/{uploaded.name}`")
 
         with st.spinner("Analyzing your resume…"):
             try:
-                from src.resume_parser import parse_resume
-
-                parsed = parse_resume(dest, api_key=_groq_key() or None)
+                key = _groq_key(env)
+                parsed = _resume_parser().parse_resume(
+                    dest, api_key=key or None,
+                    client=_groq_client(key) if key else None,
+                )
                 st.session_state["parsed"] = parsed
                 st.success("Resume parsed successfully!")
             except Exception as exc:
                 st.error(f"Parsing failed: {exc}")
                 st.session_state["parsed"] = {}
 
-    existing_resume = get_resume_path()
+    existing_resume = _cached_resume_path()
     if existing_resume and not uploaded:
         st.info(f"Current resume: **{existing_resume.name}**")
 
     # ── Parsed Profile Summary ───────────────────────────────────────────
-    parsed_data = st.session_state.get("parsed", {})
+    parsed_data = st.session_state["parsed"]
 
     if parsed_data and parsed_data.get("name"):
         st.divider()
@@ -341,18 +503,12 @@ def page_setup() -> None:
         st.divider()
         st.subheader("Role-Based Targets — Focus On")
 
-        roles_html = ""
-        for i, role in enumerate(suggested_roles, 1):
-            reason = role_reasons.get(role, "")
-            reason_html = f'<br><span style="color:#666;font-size:0.85rem">{reason}</span>' if reason else ""
-            roles_html += (
-                f'<div style="margin-bottom:0.6rem">'
-                f'<strong>{i}. {role}</strong>'
-                f'{reason_html}'
-                f'</div>'
-            )
-
-        st.markdown(f'<div class="role-card">{roles_html}</div>', unsafe_allow_html=True)
+        with st.container(border=True):
+            for i, role in enumerate(suggested_roles, 1):
+                st.markdown(f"**{i}. {role}**")
+                reason = role_reasons.get(role, "")
+                if reason:
+                    st.caption(reason)
 
     # ── Resume Review ────────────────────────────────────────────────────
     resume_for_review = existing_resume or (RESUME_DIR / uploaded.name if uploaded else None)
@@ -364,49 +520,13 @@ def page_setup() -> None:
             "Get specific improvement suggestions with exact before/after text "
             "you can paste back into your resume."
         )
-
-        if st.button("Review My Resume", use_container_width=True):
-            with st.spinner("Analyzing your resume for improvements…"):
-                try:
-                    from src.resume_parser import review_resume
-
-                    feedback = review_resume(resume_for_review, api_key=_groq_key())
-                    st.session_state["resume_feedback"] = feedback
-                except Exception as exc:
-                    st.error(f"Review failed: {exc}")
-
-        feedback = st.session_state.get("resume_feedback", [])
-        if feedback:
-            _CAT_ICONS = {
-                "Structure": "🏗️", "Metrics": "📊", "Keywords": "🔑",
-                "Skills Gap": "🧩", "Wording": "✏️", "Formatting": "📐",
-            }
-            for item in feedback:
-                cat = item.get("category", "Tip")
-                icon = _CAT_ICONS.get(cat, "💡")
-                original = item.get("original", "")
-                replacement = item.get("replacement", "")
-                reason = item.get("reason", "")
-
-                with st.expander(f"{icon}  **{cat}**", expanded=True):
-                    if original and original != "[missing]":
-                        st.markdown("**Current text:**")
-                        st.markdown(f'<div class="review-original">{original}</div>', unsafe_allow_html=True)
-                    elif original == "[missing]":
-                        st.markdown("**Missing from your resume**")
-
-                    if replacement:
-                        st.markdown("**Replace with:**")
-                        st.markdown(f'<div class="review-replacement">{replacement}</div>', unsafe_allow_html=True)
-
-                    if reason:
-                        st.caption(reason)
+        _resume_review_fragment(resume_for_review, _groq_key(env))
 
     # ── Step 3: Profile ──────────────────────────────────────────────────
     st.divider()
     st.subheader("3 — Review & Save Profile")
 
-    parsed = st.session_state.get("parsed", {})
+    parsed = st.session_state["parsed"]
     existing = _load_profile() or {}
     ep = existing.get("profile", {})
 
@@ -446,11 +566,12 @@ def page_setup() -> None:
                 )
 
         default_skills = parsed.get("skills") or ep.get("skills") or []
-        all_skill_opts = list(dict.fromkeys([s for s in default_skills] + COMMON_SKILLS))
+        all_skill_opts = _merge_options(tuple(default_skills), COMMON_SKILLS)
+        skill_opt_set = frozenset(all_skill_opts)
         skills = st.multiselect(
             "Skills",
             options=all_skill_opts,
-            default=[s for s in default_skills if s in all_skill_opts][:15],
+            default=[s for s in default_skills if s in skill_opt_set][:15],
             help="Select from the list or type to filter",
         )
 
@@ -486,11 +607,12 @@ def page_setup() -> None:
             )
 
         default_locs = parsed.get("locations") or existing.get("locations") or []
-        all_loc_opts = list(dict.fromkeys([l for l in default_locs] + CITIES))
+        all_loc_opts = _merge_options(tuple(default_locs), CITIES)
+        loc_opt_set = frozenset(all_loc_opts)
         locations = st.multiselect(
             "Target locations",
             options=all_loc_opts,
-            default=[l for l in default_locs if l in all_loc_opts],
+            default=[l for l in default_locs if l in loc_opt_set],
         )
 
         summary = st.text_area(
@@ -516,8 +638,7 @@ def page_setup() -> None:
         else:
             core_roles = [r.strip() for r in core_roles_text.splitlines() if r.strip()]
             stretch_roles = [r.strip() for r in stretch_roles_text.splitlines() if r.strip()]
-            from src.profile_generator import generate_profile, write_profile
-
+            profile_generator = _profile_generator()
             overrides = {
                 "name": name, "title": title,
                 "years_experience": years, "level": level,
@@ -526,9 +647,12 @@ def page_setup() -> None:
                 "locations": locations, "summary": summary,
                 "salary_min": min_sal, "salary_max": max_sal,
             }
-            write_profile(generate_profile(parsed or {}, overrides=overrides))
-            st.session_state.pop("last_result", None)
-            st.session_state.pop("resume_feedback", None)
+            profile_generator.write_profile(
+                profile_generator.generate_profile(parsed or {}, overrides=overrides)
+            )
+            _read_profile.clear()
+            st.session_state["last_result"] = None
+            st.session_state["resume_feedback"] = []
             st.success("Profile saved!")
             st.info("Head to **Dashboard** and click **Run Agent Now** to search jobs with your new profile.")
 
@@ -552,6 +676,14 @@ def page_dashboard() -> None:
     st.divider()
     st.subheader("Run Agent")
 
+    profile_data = _load_profile() or {}
+    has_roles = profile_data.get("core_roles") or profile_data.get("stretch_roles") or profile_data.get("preferred_roles")
+    _agent_fragment(bool(has_roles))
+
+
+@st.fragment
+def _agent_fragment(has_roles: bool) -> None:
+    """Run controls and the results card; widget changes rerun only this block."""
     c1, c2, c3, c4 = st.columns(4)
     with c1:
         max_jobs = st.number_input("Max jobs", 10, 100, 30)
@@ -562,8 +694,6 @@ def page_dashboard() -> None:
     with c4:
         auto_apply = st.checkbox("Auto-apply", value=False)
 
-    profile_data = _load_profile() or {}
-    has_roles = profile_data.get("core_roles") or profile_data.get("stretch_roles") or profile_data.get("preferred_roles")
     if not has_roles:
         st.warning("Your profile has no preferred roles. Go to **Setup**, upload a resume, and **Save Profile** first.")
 
@@ -571,9 +701,7 @@ def page_dashboard() -> None:
         with st.status("Running agent…", expanded=True) as sw:
             try:
                 sw.write("Searching job sources in parallel…")
-                from src.agent import run
-
-                result = run(
+                result = _agent_run()(
                     max_jobs=max_jobs,
                     min_score=min_score,
                     generate_letters=gen_letters,
@@ -585,7 +713,7 @@ def page_dashboard() -> None:
                 sw.update(label="Agent failed", state="error")
                 st.error(str(exc))
 
-    result = st.session_state.get("last_result")
+    result = st.session_state["last_result"]
     if result:
         st.divider()
         st.subheader("Latest Results")
@@ -610,6 +738,41 @@ def page_dashboard() -> None:
 # ── Page: Reports ────────────────────────────────────────────────────────
 
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _list_reports(dir_mtime: float) -> list[str]:
+    """Daily report paths, newest first; re-listed when the directory changes."""
+    return sorted((str(p) for p in REPORTS_DIR.glob("daily_*.md")), reverse=True)
+
+
+@st.cache_data(show_spinner=False)
+def _read_report(path: str, mtime: float) -> str:
+    return Path(path).read_text(encoding="utf-8")
+
+
+@st.cache_data(show_spinner=False)
+def _load_applications(path: str, mtime: float):
+    """Load the tracker CSV as a DataFrame; cached per (path, mtime)."""
+    pd = _pandas()
+
+    opts = {"dtype": str, "keep_default_na": False}
+    try:
+        df = pd.read_csv(path, engine="pyarrow", dtype_backend="pyarrow", **opts)
+    except pd.errors.EmptyDataError:
+        return pd.DataFrame(columns=["status"])
+    except (ImportError, ValueError):
+        # pyarrow missing, or rows it can't parse (e.g. quoted newlines)
+        df = pd.read_csv(path, **opts)
+    if "job_id" in df.columns:
+        # Status changes are appended: keep each job's latest row, but at
+        # its first appearance, as the tracker's own fold does.
+        order = df["job_id"].drop_duplicates()
+        latest = df.drop_duplicates("job_id", keep="last").set_index("job_id")
+        df = latest.reindex(order).reset_index()
+    if "score" in df.columns:
+        df["score"] = pd.to_numeric(df["score"], errors="coerce").astype("float32")
+    return df
+
+
 def page_reports() -> None:
     st.header("Reports & History")
 
@@ -617,7 +780,7 @@ def page_reports() -> None:
 
     with tab_reports:
         ensure_dirs()
-        reports = sorted(REPORTS_DIR.glob("daily_*.md"), reverse=True)
+        reports = [Path(p) for p in _list_reports(REPORTS_DIR.stat().st_mtime)]
         if not reports:
             st.info("No reports yet. Run the agent to generate your first report.")
         else:
@@ -627,7 +790,7 @@ def page_reports() -> None:
                 format_func=lambda p: p.stem.replace("daily_", ""),
             )
             if selected:
-                st.markdown(selected.read_text(encoding="utf-8"))
+                st.markdown(_read_report(str(selected), selected.stat().st_mtime))
 
     with tab_history:
         csv_path = DATA_DIR / "applications.csv"
@@ -635,27 +798,20 @@ def page_reports() -> None:
             st.info("No applications tracked yet.")
             return
 
-        with open(csv_path, encoding="utf-8") as f:
-            rows = list(csv.DictReader(f))
-
-        if not rows:
+        df = _load_applications(str(csv_path), csv_path.stat().st_mtime)
+        if df.empty:
             st.info("No applications tracked yet.")
             return
 
+        counts = df["status"].value_counts()
         c1, c2, c3 = st.columns(3)
-        c1.metric("Total Applications", len(rows))
-        c2.metric("Applied", sum(1 for r in rows if r.get("status") == "applied"))
-        c3.metric("Suggested", sum(1 for r in rows if r.get("status") == "suggested"))
+        c1.metric("Total Applications", len(df))
+        c2.metric("Applied", int(counts.get("applied", 0)))
+        c3.metric("Suggested", int(counts.get("suggested", 0)))
 
-        import pandas as pd
-
-        df = pd.DataFrame(rows)
         display_cols = ["title", "company", "score", "status", "applied_at", "url"]
         display_cols = [c for c in display_cols if c in df.columns]
 
-        if "score" in df.columns:
-            df["score"] = pd.to_numeric(df["score"], errors="coerce")
-
         st.dataframe(
             df[display_cols],
             use_container_width=True,
@@ -769,9 +925,7 @@ def page_settings() -> None:
                         st.error("Passwords do not match.")
                     else:
                         try:
-                            from src.secrets_manager import encrypt_env
-
-                            encrypt_env(password=master)
+                            _secrets_manager().encrypt_env(password=master)
                             st.success("Encrypted → `.env.enc`")
                         except Exception as exc:
                             st.error(str(exc))
@@ -797,8 +951,30 @@ def page_settings() -> None:
 # ── Main ─────────────────────────────────────────────────────────────────
 
 
+@st.cache_resource(show_spinner=False)
+def _glass_css() -> str:
+    """The style block minified once; every rerun re-sends it to the browser."""
+    css = re.sub(r"/\*.*?\*/", "", _GLASS_CSS, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};:,>])\s*", r"\1", css).strip()
+
+
 def _inject_css() -> None:
-    st.markdown(_GLASS_CSS, unsafe_allow_html=True)
+    st.html(_glass_css())
+
+
+def _clear_dir(path: Path, keep: tuple[str, ...] = ()) -> None:
+    """Delete the files directly inside *path* (one scandir pass), sparing *keep*."""
+    try:
+        with os.scandir(path) as it:
+            targets = [e.path for e in it if e.name not in keep and not e.is_dir()]
+    except FileNotFoundError:
+        return
+    for p in targets:
+        try:
+            os.unlink(p)
+        except FileNotFoundError:
+            pass
 
 
 def _sidebar_status() -> None:
@@ -813,9 +989,7 @@ def _sidebar_status() -> None:
 
         st.divider()
         if st.button("🗑️ Reset Everything", use_container_width=True):
-            for p in RESUME_DIR.glob("*"):
-                if p.name != ".gitkeep":
-                    p.unlink(missing_ok=True)
+            _clear_dir(RESUME_DIR, keep=(".gitkeep",))
             PROFILE_PATH.write_text(
                 "profile:\n  name: \"\"\n  title: \"\"\n  years_experience: 0\n"
                 "  level: intermediate\n  skills: []\n  summary: \"\"\n"
@@ -825,16 +999,9 @@ def _sidebar_status() -> None:
                 "  compare_only_when_listed: true\nmin_score_auto_apply: 0.65\n",
                 encoding="utf-8",
             )
-            for f in DATA_DIR.glob("*"):
-                if f.name not in (".gitkeep", "applications.csv"):
-                    f.unlink(missing_ok=True)
-            for f in REPORTS_DIR.glob("*"):
-                if f.name != ".gitkeep":
-                    f.unlink(missing_ok=True)
-            log_dir = ROOT / "logs"
-            if log_dir.exists():
-                for f in log_dir.glob("*"):
-                    f.unlink(missing_ok=True)
+            _clear_dir(DATA_DIR, keep=(".gitkeep", "applications.csv"))
+            _clear_dir(REPORTS_DIR, keep=(".gitkeep",))
+            _clear_dir(ROOT / "logs")
             kept = st.session_state.get("_groq_key", "")
             for key in list(st.session_state.keys()):
                 del st.session_state[key]
@@ -845,24 +1012,28 @@ def _sidebar_status() -> None:
 
 
 def _wrap_setup():
+    _init_state()
     _inject_css()
     _sidebar_status()
     page_setup()
 
 
 def _wrap_dashboard():
+    _init_state()
     _inject_css()
     _sidebar_status()
     page_dashboard()
 
 
 def _wrap_reports():
+    _init_state()
     _inject_css()
     _sidebar_status()
     page_reports()
 
 
 def _wrap_settings():
+    _init_state()
     _inject_css()
     _sidebar_status()
     page_settings()
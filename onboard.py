@@ -25,21 +25,50 @@ log = get_logger(__name__)
 # ── Helpers ──────────────────────────────────────────────────────────────
 
 
+def _fast_input(prompt: str) -> str:
+    """input() without its stderr flush and per-call terminal setup.
+
+    Terminals still go through input() so line editing keeps working;
+    piped answers (scripted setup) are read straight from stdin.
+    """
+    if sys.stdin.isatty():
+        return input(prompt)
+    if prompt:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
 def _ask(prompt: str, default: str = "") -> str:
     hint = f" [{default}]" if default else ""
-    val = input(f"  {prompt}{hint}: ").strip()
+    val = _fast_input(f"  {prompt}{hint}: ").strip()
     return val or default
 
 
 def _ask_yn(prompt: str, default: bool = True) -> bool:
     hint = "Y/n" if default else "y/N"
-    val = input(f"  {prompt} ({hint}): ").strip().lower()
+    val = _fast_input(f"  {prompt} ({hint}): ").strip().lower()
     if not val:
         return default
     return val in ("y", "yes")
 
 
+def _parse_env_line(line: str) -> tuple[str, str] | None:
+    """(key, value) for a KEY=value line; None for comments and blanks."""
+    stripped = line.strip()
+    if not stripped or stripped.startswith("#") or "=" not in stripped:
+        return None
+    k, _, v = stripped.partition("=")
+    return k.strip(), v.strip()
+
+
 def _ask_password(prompt: str) -> str:
+    # getpass is kept for echo suppression; flush our own output first so the
+    # prompt never lands ahead of buffered text.
+    sys.stdout.flush()
     return getpass.getpass(f"  {prompt}: ")
 
 
@@ -78,7 +107,12 @@ def step_resume() -> Path | None:
 
     ensure_dirs()
     dest = RESUME_DIR / src.name
-    shutil.copy2(src, dest)
+    if dest.exists() and dest.samefile(src):
+        print(f"  ✓ Using resume/{src.name}")
+        return dest
+    # copyfile takes the kernel fast path (sendfile/copy_file_range) on Linux.
+    shutil.copyfile(src, dest)
+    shutil.copystat(src, dest)
     print(f"  ✓ Resume copied → resume/{src.name}")
     return dest
 
@@ -270,36 +304,32 @@ def step_protect_and_save(api_keys: dict[str, str], creds: dict[str, str]) -> No
     env_path = ROOT / ".env"
     env_example = ROOT / ".env.example"
 
+    # Parse each line once; template rows keep the original line for comments.
+    template: list[tuple[str | None, str]] = []
     existing: dict[str, str] = {}
-    template_lines: list[str] = []
     if env_example.exists():
         for line in env_example.read_text(encoding="utf-8").splitlines():
-            template_lines.append(line)
-            stripped = line.strip()
-            if stripped and not stripped.startswith("#") and "=" in stripped:
-                k, _, v = stripped.partition("=")
-                existing[k.strip()] = v.strip()
+            kv = _parse_env_line(line)
+            template.append((kv[0] if kv else None, line))
+            if kv:
+                existing[kv[0]] = kv[1]
 
     if env_path.exists():
         for line in env_path.read_text(encoding="utf-8").splitlines():
-            stripped = line.strip()
-            if stripped and not stripped.startswith("#") and "=" in stripped:
-                k, _, v = stripped.partition("=")
-                existing[k.strip()] = v.strip()
+            kv = _parse_env_line(line)
+            if kv:
+                existing[kv[0]] = kv[1]
 
     all_values = {**existing, **api_keys, **creds}
 
     env_lines: list[str] = []
     written_keys: set[str] = set()
-    for line in template_lines:
-        stripped = line.strip()
-        if stripped and not stripped.startswith("#") and "=" in stripped:
-            k, _, _ = stripped.partition("=")
-            k = k.strip()
+    for k, line in template:
+        if k is None:
+            env_lines.append(line)
+        else:
             env_lines.append(f"{k}={all_values.get(k, '')}")
             written_keys.add(k)
-        else:
-            env_lines.append(line)
 
     for k, v in all_values.items():
         if k not in written_keys:
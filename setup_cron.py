@@ -7,6 +7,7 @@ Run once: python setup_cron.py
 from __future__ import annotations
 
 import os
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -25,20 +26,25 @@ def main():
     if not venv_python.exists():
         print("Error: .venv not found. Run: python -m venv .venv && pip install -r requirements.txt")
         return 1
+    crontab = shutil.which("crontab")
+    if not crontab:
+        print("crontab not found. On Windows use Task Scheduler; on Mac/Linux ensure cron is available.")
+        _write_crontab_file(entry)
+        return 1
     try:
         out = subprocess.run(
-            ["crontab", "-l"],
+            [crontab, "-l"],
             capture_output=True,
             text=True,
             timeout=5,
         )
         existing = (out.stdout or "").strip() if out.returncode == 0 else ""
-        if entry in existing:
+        if entry in existing.splitlines():
             print("Cron entry already present. No change.")
             return 0
         new_crontab = (existing + "\n" + entry).strip() if existing else entry
         proc = subprocess.run(
-            ["crontab", "-"],
+            [crontab, "-"],
             input=new_crontab,
             capture_output=True,
             text=True,
@@ -57,10 +63,6 @@ def main():
         print("Crontab timed out. To install manually, run:")
         print(f"  crontab {ROOT / 'crontab.txt'}")
         return 1
-    except FileNotFoundError:
-        print("crontab not found. On Windows use Task Scheduler; on Mac/Linux ensure cron is available.")
-        _write_crontab_file(entry)
-        return 1
 
 
 def _write_crontab_file(content: str) -> None:
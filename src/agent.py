@@ -5,21 +5,29 @@ Runs: search → filter/score → cover letters → (optional) browser apply →
 """
 from __future__ import annotations
 
+import hashlib
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Any
 
 from src.config import load_profile, get_env, ensure_dirs, try_load_encrypted_env, DATA_DIR
 from src.log import get_logger
 from src.models import Job
-from src.sources import get_sources
-from src.scorer import filter_and_rank
-from src.cover_letter import generate_cover_letter, save_cover_letter
-from src.tracker import ensure_tracker, get_applied_job_ids, record_application
-from src.report import build_daily_report, write_daily_report
 
 log = get_logger(__name__)
 
+# Concurrent Groq requests for cover letters (the limiter in cover_letter
+# keeps the overall rate within the free-tier quota).
+_LETTER_WORKERS = 6
+
+# Cap on concurrent source searches; each one is a blocking HTTP client.
+_SEARCH_WORKERS = 10
+
+
+def _fingerprint(job_id: str) -> int:
+    """64-bit fingerprint of a job id for compact dedup sets."""
+    return int.from_bytes(hashlib.blake2b(job_id.encode(), digest_size=8).digest(), "little")
+
 
 def _search_source(source, query: str, locations: list[str], limit: int) -> list[Job]:
     """Wrapper for parallel source searching."""
@@ -33,6 +41,14 @@ def _search_source(source, query: str, locations: list[str], limit: int) -> list
         return []
 
 
+def _browser_apply(to_apply: list, cover_paths: dict[str, Future]) -> list[tuple[str, bool, str]]:
+    """Run the browser apply batch; meant for a background thread."""
+    from src.browser_apply import apply_via_browser
+
+    headless = os.environ.get("RUN_HEADLESS", "true").lower() in ("1", "true", "yes")
+    return apply_via_browser(to_apply, cover_paths, headless=headless)
+
+
 def run(
     *,
     max_jobs: int = 30,
@@ -41,10 +57,32 @@ def run(
     top_letters: int = 10,
     write_report: bool = True,
     auto_apply: bool = True,
+    batch_mode: bool = False,
 ) -> dict[str, Any]:
+    """Run the full pipeline once.
+
+    With *batch_mode*, cover letters not already cached are submitted to
+    Groq's Batch API and picked up by a later run instead of being
+    generated inline (see :mod:`src.cover_letter_batch`).
+    """
+    # Pipeline modules are imported here so that importing this module
+    # (Streamlit pages, entry-point setup checks) stays cheap.
+    from src.sources import get_sources
+    from src.scorer import filter_and_rank
+    from src.cover_letter import generate_cover_letter, is_fallback_letter, save_cover_letter
+    from src.letter_template_cache import (
+        learn as learn_template,
+        load_templates,
+        render as render_template,
+        save_templates,
+    )
+    from src.tracker import compact, ensure_tracker, get_applied_job_ids, record_application
+    from src.report import build_daily_report, report_date, write_daily_report
+
     try_load_encrypted_env()
     ensure_dirs()
     ensure_tracker()
+    compact()
     profile = load_profile()
 
     has_roles = profile.get("core_roles") or profile.get("stretch_roles") or profile.get("preferred_roles")
@@ -68,29 +106,47 @@ def run(
     query = " OR ".join(core_roles[:3]) if core_roles else " OR ".join(all_roles[:3])
     locations: list[str] = profile.get("locations", [])
     all_jobs: list[Job] = []
-    seen: set[str] = set()
+    seen: set[int] = set()
 
-    log.info("Searching %d source(s) in parallel...", len(sources))
-    with ThreadPoolExecutor(max_workers=len(sources)) as pool:
-        futures = {
-            pool.submit(_search_source, src, query, locations, limit=30): src
-            for src in sources
-        }
-        for future in as_completed(futures):
-            for job in future.result():
-                if job.id not in seen:
-                    seen.add(job.id)
-                    all_jobs.append(job)
+    # No single source needs to return more than the run will keep.
+    per_source = min(30, max_jobs)
+
+    def _collect(jobs: list[Job]) -> bool:
+        """Add unseen jobs; True once max_jobs have been collected."""
+        for job in jobs:
+            fp = _fingerprint(job.id)
+            if fp not in seen:
+                seen.add(fp)
+                all_jobs.append(job)
+                if len(all_jobs) >= max_jobs:
+                    return True
+        return False
+
+    if len(sources) == 1:
+        # No fan-out to do; skip the pool and its worker thread.
+        _collect(_search_source(sources[0], query, locations, limit=per_source))
+    else:
+        log.info("Searching %d source(s) in parallel...", len(sources))
+        pool = ThreadPoolExecutor(max_workers=min(len(sources), _SEARCH_WORKERS))
+        try:
+            futures = [
+                pool.submit(_search_source, src, query, locations, limit=per_source)
+                for src in sources
+            ]
+            for future in as_completed(futures):
+                if _collect(future.result()):
+                    log.info("Reached %d jobs — not waiting for remaining sources", max_jobs)
+                    break
+        finally:
+            # Drop sources that haven't started; don't block on stragglers.
+            pool.shutdown(wait=False, cancel_futures=True)
 
     log.info("Total unique jobs from APIs: %d", len(all_jobs))
     if not all_jobs:
         log.warning("Falling back to MockSource (no real jobs returned)")
         from src.sources.mock import MockSource
 
-        for job in MockSource(profile).search(query, locations, limit=15):
-            if job.id not in seen:
-                seen.add(job.id)
-                all_jobs.append(job)
+        _collect(MockSource(profile).search(query, locations, limit=min(15, max_jobs)))
     all_jobs = all_jobs[:max_jobs]
 
     # 2. Filter and rank
@@ -98,54 +154,104 @@ def run(
     new_jobs = [j for j in all_jobs if j.id not in applied_ids]
     scored = filter_and_rank(new_jobs, profile, min_score=list_min)
 
-    # 3. Cover letters for top matches; track as "suggested"
+    # 3. Cover letters for top matches (parallel LLM calls); track as "suggested".
+    #    Jobs below the auto-apply bar reuse a cluster template when one exists.
     cover_paths: dict[str, str] = {}
-    for s in scored[:top_letters]:
-        if s.job.id in applied_ids:
-            continue
-        if not generate_letters:
-            continue
-        content = generate_cover_letter(s, profile)
-        path = save_cover_letter(s, content)
-        cover_paths[s.job.id] = str(path)
-        record_application(s, cover_letter_path=str(path), status="suggested")
-        applied_ids.add(s.job.id)
-
-    # 4. Auto-apply via browser
+    letter_jobs = [s for s in scored[:top_letters] if s.job.id not in applied_ids] if generate_letters else []
+    templates = load_templates() if letter_jobs else {}
+    templated: dict[str, str] = {}
+    for s in letter_jobs:
+        if s.score < auto_apply_min:
+            letter = render_template(templates, s, profile)
+            if letter:
+                templated[s.job.id] = letter
+    llm_jobs = [s for s in letter_jobs if s.job.id not in templated]
+    deferred_ids: set[str] = set()
+    if llm_jobs and batch_mode:
+        from src.cover_letter_batch import defer_to_batch
+
+        ready_ids = {s.job.id for s in defer_to_batch(llm_jobs, profile)}
+        # Deferred jobs get no tracker row and aren't applied to this run, so
+        # a later run picks them up with their batch letter and applies once.
+        deferred_ids = {s.job.id for s in llm_jobs if s.job.id not in ready_ids}
+        llm_jobs = [s for s in llm_jobs if s.job.id in ready_ids]
+        letter_jobs = [s for s in letter_jobs if s.job.id in templated or s.job.id in ready_ids]
+
+    # 4. Auto-apply via browser, started now so page loads overlap letter
+    #    generation. Each apply waits on its letter's path future only once
+    #    its page is open; the future is resolved after the tracker row is
+    #    queued, and update_statuses flushes the queue, so it always finds it.
+    to_apply = (
+        [s for s in scored if s.score >= auto_apply_min and s.job.id not in deferred_ids]
+        if auto_apply and auto_apply_min > 0 else []
+    )
+    letter_ids = {s.job.id for s in letter_jobs}
+    pending: dict[str, Future] = {s.job.id: Future() for s in to_apply if s.job.id in letter_ids}
+    apply_future: Future | None = None
+    if to_apply:
+        apply_pool = ThreadPoolExecutor(max_workers=1)
+        apply_future = apply_pool.submit(_browser_apply, to_apply, pending)
+        apply_pool.shutdown(wait=False)
+
+    try:
+        if letter_jobs:
+            with ThreadPoolExecutor(max_workers=max(1, min(_LETTER_WORKERS, len(llm_jobs)))) as pool:
+                futures = {s.job.id: pool.submit(generate_cover_letter, s, profile) for s in llm_jobs}
+                # Collect in rank order; file and tracker writes stay on this thread.
+                for s in letter_jobs:
+                    content = templated.get(s.job.id)
+                    if content is None:
+                        content = futures[s.job.id].result()
+                        if s.score < auto_apply_min and not is_fallback_letter(s, profile, content):
+                            learn_template(templates, s, profile, content)
+                    path = save_cover_letter(s, content)
+                    cover_paths[s.job.id] = str(path)
+                    record_application(s, cover_letter_path=str(path), status="suggested")
+                    applied_ids.add(s.job.id)
+                    if s.job.id in pending:
+                        pending[s.job.id].set_result(str(path))
+            if templates:
+                save_templates(templates)
+            if templated:
+                log.info("Reused cluster templates for %d cover letter(s)", len(templated))
+    finally:
+        # Never leave the browser waiting on a letter that won't come.
+        for fut in pending.values():
+            if not fut.done():
+                fut.set_result(None)
+
     browser_applied = 0
     applied_job_ids: set[str] = set()
     apply_results: dict[str, str] = {}
-    if auto_apply and auto_apply_min > 0:
-        to_apply = [s for s in scored if s.score >= auto_apply_min]
-        if to_apply:
-            try:
-                from src.browser_apply import apply_via_browser
-
-                headless = os.environ.get("RUN_HEADLESS", "true").lower() in ("1", "true", "yes")
-                results = apply_via_browser(to_apply, cover_paths, headless=headless)
-                for jid, ok, msg in results:
-                    apply_results[jid] = msg
-                    if ok:
-                        applied_job_ids.add(jid)
-                        browser_applied += 1
-            except Exception as e:
-                log.error("Browser apply failed: %s", e)
-                for s in to_apply:
-                    apply_results[s.job.id] = str(e)[:150]
+    if apply_future is not None:
+        try:
+            for jid, ok, msg in apply_future.result():
+                apply_results[jid] = msg
+                if ok:
+                    applied_job_ids.add(jid)
+                    browser_applied += 1
+        except Exception as e:
+            log.error("Browser apply failed: %s", e)
+            for s in to_apply:
+                apply_results[s.job.id] = str(e)[:150]
+    for jid in deferred_ids:
+        apply_results[jid] = "Cover letter queued in a Groq batch; handled on a later run"
     for s in scored:
         if s.job.id not in apply_results:
             apply_results[s.job.id] = f"Below auto-apply threshold ({int(auto_apply_min*100)}%) or not in apply batch"
 
     # 5. Daily report
+    date = report_date()
     report_content = build_daily_report(
         scored,
         cover_paths,
         applied_job_ids=applied_job_ids,
         apply_results=apply_results,
+        date=date,
     )
     report_path = None
     if write_report:
-        report_path = write_daily_report(report_content)
+        report_path = write_daily_report(report_content, date)
 
     # 6. Send email report
     if write_report and report_content:
@@ -159,9 +265,11 @@ def run(
 
     # 7. Clean up cover letter files
     removed = 0
-    for f in DATA_DIR.glob("cover_*.txt"):
+    with os.scandir(DATA_DIR) as it:
+        targets = [e.path for e in it if e.name.startswith("cover_") and e.name.endswith(".txt")]
+    for p in targets:
         try:
-            f.unlink()
+            os.unlink(p)
             removed += 1
         except OSError:
             pass
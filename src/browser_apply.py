@@ -2,194 +2,398 @@
 Browser automation to submit applications (hybrid mode).
 Uses Playwright to open job URLs, detect the platform (LinkedIn, Naukri, Workday,
 Greenhouse, Lever, Indeed, aggregator, or generic), and attempt the apply flow.
+
+Jobs are applied to concurrently as separate pages of one shared browser
+context (async Playwright), at most APPLY_CONCURRENCY at a time.
 """
 from __future__ import annotations
 
+import asyncio
 import os
-import time
+import re
+from concurrent.futures import Future
 from pathlib import Path
+from urllib.parse import urlsplit
 
-from src.config import get_resume_path, get_env, load_profile
+from src.config import DATA_DIR, get_resume_path, get_env, load_profile
 from src.log import get_logger
 from src.models import ScoredJob
-from src.tracker import update_status
+from src.tracker import update_statuses
 
 log = get_logger(__name__)
 
+_DEFAULT_CONCURRENCY = 4
+
+# Longest cover letter pasted into an application textarea.
+_COVER_MAX_CHARS = 3000
+
+# Cookies/localStorage from the last successful LinkedIn/Naukri login, so
+# the next batch starts signed in. Holds session tokens: kept owner-only.
+BROWSER_STATE_PATH: Path = DATA_DIR / "browser_state.json"
+
+# A browsers path inherited from a sandboxed shell or editor points at a
+# location this process can't use; drop it so Playwright falls back to its
+# default install. Done once, before Playwright is imported.
+_pw_path = os.environ.get("PLAYWRIGHT_BROWSERS_PATH", "")
+if _pw_path and ("sandbox" in _pw_path or "cursor" in _pw_path.lower() or not Path(_pw_path).exists()):
+    os.environ.pop("PLAYWRIGHT_BROWSERS_PATH", None)
+del _pw_path
 
-def _visible(locator) -> bool:
-    """Safe visibility check that never throws."""
+try:
+    from playwright.async_api import async_playwright
+    _HAS_PLAYWRIGHT = True
+except ImportError:
+    async_playwright = None
+    _HAS_PLAYWRIGHT = False
+
+
+async def _visible(locator) -> bool:
+    """Safe visibility check that never throws.
+
+    ``is_visible`` answers immediately (an empty match is just False), so
+    this is one round trip; callers that need to wait use ``_wait_for``.
+    """
     try:
-        return locator.count() > 0 and locator.first.is_visible(timeout=2000)
+        return await locator.first.is_visible()
     except Exception:
         return False
 
 
-def _click_first_visible(page, selectors: list[str], *, timeout: int = 3000) -> bool:
+async def _click_first_visible(page, selectors: list[str]) -> bool:
     """Try clicking the first visible element matching any selector."""
     for sel in selectors:
         try:
             loc = page.locator(sel).first
-            if loc.is_visible(timeout=timeout):
-                loc.click()
+            if await loc.is_visible():
+                await loc.click()
                 return True
         except Exception:
             continue
     return False
 
 
+# Matched against the URL's hostname only (urlsplit lowercases it), so a
+# platform name in a path or query string can't misclassify the page.
+_PLATFORM_RE = re.compile(
+    r"(?:.+\.)?(?:"
+    r"(?P<linkedin>linkedin\.com)"
+    r"|(?P<naukri>naukri\.com)"
+    r"|(?P<workday>myworkdayjobs\.com|myworkdaysite\.com|(?:my)?workday\.com)"
+    r"|(?P<greenhouse>greenhouse\.io)"
+    r"|(?P<lever>lever\.co)"
+    r"|(?P<indeed>indeed\.com)"
+    r"|(?P<aggregator>simplyhired(?:\.[a-z]+)+|talent\.com|jobrapido(?:\.[a-z]+)+|bebee\.com"
+    r"|builtin\.com|remote\.co|talentify(?:\.[a-z]+)+)"
+    r")"
+)
+
+
 def _detect_platform(url: str) -> str:
-    """Classify the URL into a known platform type."""
-    u = url.lower()
-    if "linkedin.com" in u:
-        return "linkedin"
-    if "naukri.com" in u:
-        return "naukri"
-    if "myworkdayjobs.com" in u or "workday.com" in u or "wd1." in u or "wd3." in u or "wd5." in u:
-        return "workday"
-    if "greenhouse.io" in u or "boards.greenhouse" in u:
-        return "greenhouse"
-    if "lever.co" in u or "jobs.lever" in u:
-        return "lever"
-    if "indeed.com" in u:
-        return "indeed"
-    if any(agg in u for agg in ["simplyhired", "talent.com", "jobrapido", "bebee.com",
-                                  "builtin.com", "remote.co", "talentify"]):
-        return "aggregator"
-    return "generic"
+    """Classify the URL into a known platform type by its host."""
+    m = _PLATFORM_RE.fullmatch(urlsplit(url).hostname or "")
+    return m.lastgroup if m else "generic"
+
+
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+_TRACKER_RE = re.compile(
+    r"https?://(?:[^/?#]*\.)?(?:google-analytics\.com|googletagmanager\.com|doubleclick\.net"
+    r"|segment\.(?:io|com)|hotjar\.com|facebook\.net|connect\.facebook\.com|bat\.bing\.com"
+    r"|clarity\.ms|mixpanel\.com|fullstory\.com|newrelic\.com|nr-data\.net)[:/]"
+    r"|linkedin\.com/li/track|px\.ads\.linkedin\.com",
+    re.IGNORECASE,
+)
+
+
+async def _route_filter(route) -> None:
+    """Abort images, media, fonts and analytics beacons; apply forms don't need them."""
+    request = route.request
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or _TRACKER_RE.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class _Sessions:
+    """Login bookkeeping shared by every page of one apply batch.
+
+    Logins are serialized; a page that hits a login wall after another page
+    has signed in to the same platform reloads and picks up the shared
+    cookies instead of logging in again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+        self._signed_in: set[str] = set()
+
+    async def login(self, page, platform: str, do_login) -> None:
+        async with self._lock:
+            if platform in self._signed_in:
+                await page.reload(wait_until="domcontentloaded")
+                if "login" not in page.url:
+                    return
+            await do_login()
+            self._signed_in.add(platform)
+            await _save_state(page.context)
+
+
+async def _save_state(context) -> None:
+    try:
+        BROWSER_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        await context.storage_state(path=str(BROWSER_STATE_PATH))
+        os.chmod(BROWSER_STATE_PATH, 0o600)
+    except Exception as e:
+        log.debug("Could not save browser session: %s", e)
+
+
+def _concurrency() -> int:
+    try:
+        return max(1, int(get_env("APPLY_CONCURRENCY", str(_DEFAULT_CONCURRENCY))))
+    except ValueError:
+        return _DEFAULT_CONCURRENCY
 
 
 def apply_via_browser(
     scored_jobs: list[ScoredJob],
-    cover_letter_paths: dict[str, str],
+    cover_letter_paths: dict[str, str | Future],
     *,
     headless: bool = False,
 ) -> list[tuple[str, bool, str]]:
-    results: list[tuple[str, bool, str]] = []
-    resume_path = get_resume_path()
-    linkedin_user = get_env("LINKEDIN_EMAIL")
-    linkedin_pass = get_env("LINKEDIN_PASSWORD")
-    naukri_user = get_env("NAUKRI_EMAIL")
-    naukri_pass = get_env("NAUKRI_PASSWORD")
-    apply_email = get_env("APPLY_EMAIL")
-    apply_pass = get_env("APPLY_PASSWORD")
+    """Apply to *scored_jobs*; returns ``(job_id, ok, message)`` in input order.
 
-    try:
-        _pw = os.environ.get("PLAYWRIGHT_BROWSERS_PATH", "")
-        if _pw and ("sandbox" in _pw or "cursor" in _pw.lower() or not Path(_pw).exists()):
-            os.environ.pop("PLAYWRIGHT_BROWSERS_PATH", None)
-        from playwright.sync_api import sync_playwright
-    except ImportError:
-        for s in scored_jobs:
-            results.append((s.job.id, False, "Playwright not installed"))
-        return results
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=headless, args=["--incognito"])
-        context = browser.new_context(
-            viewport={"width": 1280, "height": 900},
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
-        )
-        page = context.new_page()
-        page.set_default_timeout(20_000)
-
-        for scored in scored_jobs:
-            job_id = scored.job.id
-            url = scored.job.url
-            if not url:
-                results.append((job_id, False, "No URL for this job"))
-                continue
-
-            cover_path = cover_letter_paths.get(job_id)
-            cover_text = ""
-            if cover_path and Path(cover_path).exists():
-                cover_text = Path(cover_path).read_text(encoding="utf-8", errors="ignore")
-
-            platform = _detect_platform(url)
-            log.info("Applying: %s @ %s → %s", scored.job.title, scored.job.company, platform)
+    Values of *cover_letter_paths* may be paths or futures resolving to a
+    path (or None), so letters can still be generating while pages load.
+    """
+    if not _HAS_PLAYWRIGHT:
+        return [(s.job.id, False, "Playwright not installed") for s in scored_jobs]
+
+    results = asyncio.run(_apply_all(async_playwright, scored_jobs, cover_letter_paths, headless))
+    # One tracker pass for the whole batch, off the event loop.
+    update_statuses({job_id: "applied" for job_id, ok, _ in results if ok})
+    return results
 
+
+async def _apply_all(
+    async_playwright,
+    scored_jobs: list[ScoredJob],
+    cover_letter_paths: dict[str, str | Future],
+    headless: bool,
+) -> list[tuple[str, bool, str]]:
+    creds = {
+        "resume_path": get_resume_path(),
+        "linkedin_user": get_env("LINKEDIN_EMAIL"),
+        "linkedin_pass": get_env("LINKEDIN_PASSWORD"),
+        "naukri_user": get_env("NAUKRI_EMAIL"),
+        "naukri_pass": get_env("NAUKRI_PASSWORD"),
+        "apply_email": get_env("APPLY_EMAIL"),
+        "apply_pass": get_env("APPLY_PASSWORD"),
+        "names": _get_candidate_names(),
+        "sessions": _Sessions(),
+    }
+    slots = asyncio.Semaphore(_concurrency())
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless, args=["--incognito"])
+        context_opts = {
+            "viewport": {"width": 1280, "height": 900},
+            "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36",
+        }
+        context = None
+        if BROWSER_STATE_PATH.exists():
             try:
-                page.goto(url, wait_until="domcontentloaded", timeout=25000)
-                time.sleep(2)
-
-                if platform == "linkedin":
-                    ok, msg = _try_linkedin(page, linkedin_user, linkedin_pass, resume_path, cover_text)
-                elif platform == "naukri":
-                    ok, msg = _try_naukri(page, naukri_user, naukri_pass, resume_path, cover_text)
-                elif platform == "workday":
-                    ok, msg = _try_workday(page, apply_email, resume_path)
-                elif platform == "greenhouse":
-                    ok, msg = _try_greenhouse(page, apply_email, resume_path, cover_text)
-                elif platform == "lever":
-                    ok, msg = _try_lever(page, apply_email, resume_path, cover_text)
-                elif platform == "indeed":
-                    ok, msg = _try_indeed(page, apply_email, resume_path)
-                elif platform == "aggregator":
-                    ok, msg = _try_aggregator(page, apply_email, resume_path, cover_text)
-                else:
-                    ok, msg = _try_generic(page, apply_email, apply_pass, resume_path, cover_text)
-
-                results.append((job_id, ok, msg))
-                if ok:
-                    update_status(job_id, "applied")
-                    log.info("  ✓ %s", msg)
-                else:
-                    log.warning("  ✗ %s", msg)
+                context = await browser.new_context(storage_state=str(BROWSER_STATE_PATH), **context_opts)
             except Exception as e:
-                err = str(e)[:150].split("\n")[0]
-                results.append((job_id, False, err))
-                log.error("  ✗ %s", err)
+                log.debug("Ignoring saved browser session: %s", e)
+        if context is None:
+            context = await browser.new_context(**context_opts)
+        context.set_default_timeout(20_000)
+        await context.route("**/*", _route_filter)
 
-        browser.close()
-    return results
+        async def _bounded(scored: ScoredJob) -> tuple[str, bool, str]:
+            async with slots:
+                return await _apply_one(context, scored, cover_letter_paths, creds)
+
+        try:
+            results = await asyncio.gather(*(_bounded(s) for s in scored_jobs))
+        finally:
+            await browser.close()
+    return list(results)
+
+
+async def _cover_text(entry: str | Future | None) -> str:
+    """Letter text for a path, or for a path future once it resolves.
+
+    Cut to the longest text any handler writes into a form, once per job.
+    """
+    cover_path = await asyncio.wrap_future(entry) if isinstance(entry, Future) else entry
+    if cover_path and Path(cover_path).exists():
+        return Path(cover_path).read_text(encoding="utf-8", errors="ignore")[:_COVER_MAX_CHARS]
+    return ""
+
+
+async def _apply_one(
+    context,
+    scored: ScoredJob,
+    cover_letter_paths: dict[str, str | Future],
+    creds: dict,
+) -> tuple[str, bool, str]:
+    job_id = scored.job.id
+    url = scored.job.url
+    if not url:
+        return job_id, False, "No URL for this job"
+
+    platform = _detect_platform(url)
+    log.info("Applying: %s @ %s → %s", scored.job.title, scored.job.company, platform)
+
+    resume_path = creds["resume_path"]
+    apply_email = creds["apply_email"]
+    page = await context.new_page()
+    try:
+        await page.goto(url, wait_until="domcontentloaded", timeout=25000)
+        cover_text = await _cover_text(cover_letter_paths.get(job_id))
+
+        if platform == "linkedin":
+            ok, msg = await _try_linkedin(page, creds["linkedin_user"], creds["linkedin_pass"], resume_path, cover_text, creds["sessions"])
+        elif platform == "naukri":
+            ok, msg = await _try_naukri(page, creds["naukri_user"], creds["naukri_pass"], resume_path, cover_text, creds["sessions"])
+        elif platform == "workday":
+            ok, msg = await _try_workday(page, apply_email, resume_path)
+        elif platform == "greenhouse":
+            ok, msg = await _try_greenhouse(page, apply_email, resume_path, cover_text, creds["names"])
+        elif platform == "lever":
+            ok, msg = await _try_lever(page, apply_email, resume_path, cover_text, creds["names"])
+        elif platform == "indeed":
+            ok, msg = await _try_indeed(page, apply_email, resume_path)
+        elif platform == "aggregator":
+            ok, msg = await _try_aggregator(page, apply_email, resume_path, cover_text)
+        else:
+            ok, msg = await _try_generic(page, apply_email, creds["apply_pass"], resume_path, cover_text)
+
+        if ok:
+            log.info("  ✓ %s", msg)
+        else:
+            log.warning("  ✗ %s", msg)
+        return job_id, ok, msg
+    except Exception as e:
+        err = str(e)[:150].split("\n")[0]
+        log.error("  ✗ %s", err)
+        return job_id, False, err
+    finally:
+        try:
+            await page.close()
+        except Exception:
+            pass
 
 
 # ---------------------------------------------------------------------------
 # Platform-specific handlers
 # ---------------------------------------------------------------------------
 
-def _try_linkedin(page, email: str, password: str, resume_path: Path | None, cover_text: str) -> tuple[bool, str]:
+# Confirmation banners shown by most ATSs after a successful submit.
+_SUCCESS_SEL = "text=/application (sent|submitted|received)/i"
+
+# Selector strings shared across handlers; passing the same string lets
+# Playwright reuse its parsed selector.
+_FILE_SEL = 'input[type="file"]'
+_TEXTAREA_SEL = "textarea"
+_SUBMIT_SEL = 'button:has-text("Submit"), input[type="submit"]'
+
+
+async def _wait_for(page, selector: str, timeout: int = 10_000) -> bool:
+    """Wait until *selector* is visible; False on timeout instead of raising."""
+    try:
+        await page.wait_for_selector(selector, state="visible", timeout=timeout)
+        return True
+    except Exception:
+        return False
+
+
+# Fills several form fields in one round trip. Each field is a list of CSS
+# selectors tried in order (first visible match wins) and a value. The value
+# goes through the native setter so React/Vue-controlled inputs see it, then
+# input/change events fire as if typed. Returns the number of fields filled.
+_FILL_JS = """(fields) => {
+  let filled = 0;
+  for (const [selectors, value] of fields) {
+    for (const sel of selectors) {
+      const el = Array.from(document.querySelectorAll(sel)).find(e => e.getClientRects().length);
+      if (!el) continue;
+      const proto = Object.getPrototypeOf(el);
+      const setter = Object.getOwnPropertyDescriptor(proto, "value")?.set;
+      if (setter) setter.call(el, value); else el.value = value;
+      el.dispatchEvent(new Event("input", {bubbles: true}));
+      el.dispatchEvent(new Event("change", {bubbles: true}));
+      filled++;
+      break;
+    }
+  }
+  return filled;
+}"""
+
+
+async def _upload_resume(page, resume_path: Path | None) -> None:
+    """Attach the resume to the page's first visible file input, if any."""
+    if resume_path:
+        fi = page.locator(_FILE_SEL)
+        if await _visible(fi):
+            await fi.first.set_input_files(str(resume_path))
+
+
+async def _fill_fields(page, fields: list[tuple[list[str], str]]) -> int:
+    """Fill every ``(selectors, value)`` field with a single page.evaluate."""
+    fields = [(sels, value) for sels, value in fields if value]
+    if not fields:
+        return 0
+    return await page.evaluate(_FILL_JS, fields)
+
+
+async def _try_linkedin(
+    page, email: str, password: str, resume_path: Path | None, cover_text: str, sessions: _Sessions,
+) -> tuple[bool, str]:
     if not email or not password:
         return False, "LinkedIn credentials not set"
     if "login" in page.url:
+        async def _login() -> None:
+            await page.get_by_label("Email or phone").fill(email)
+            await page.get_by_label("Password").fill(password)
+            await page.get_by_role("button", name="Sign in").click()
+            await _wait_for(page, 'button:has-text("Easy Apply"), input[name="session_key"]', 15_000)
+
         try:
-            page.get_by_label("Email or phone").fill(email)
-            page.get_by_label("Password").fill(password)
-            page.get_by_role("button", name="Sign in").click()
-            page.wait_for_load_state("networkidle", timeout=15000)
-            time.sleep(2)
+            await sessions.login(page, "linkedin", _login)
         except Exception as e:
             return False, f"LinkedIn login failed: {str(e)[:80]}"
 
+    step_sel = (
+        f'{_FILE_SEL}, {_TEXTAREA_SEL}, button:has-text("Submit application"), '
+        'button:has-text("Next"), button:has-text("Review")'
+    )
     try:
+        await _wait_for(page, 'button:has-text("Easy Apply")')
         easy = page.get_by_role("button", name="Easy Apply")
-        if not _visible(easy):
+        if not await _visible(easy):
             return False, "Easy Apply button not found"
-        easy.first.click()
-        time.sleep(2)
+        await easy.first.click()
+        await _wait_for(page, step_sel)
     except Exception:
         return False, "Easy Apply button not found"
 
     try:
         for _ in range(10):
-            if resume_path:
-                fi = page.locator('input[type="file"]')
-                if _visible(fi):
-                    fi.first.set_input_files(str(resume_path))
-                    time.sleep(1)
+            await _upload_resume(page, resume_path)
             if cover_text:
-                ta = page.locator("textarea")
-                if _visible(ta):
-                    ta.first.fill(cover_text[:3000])
+                ta = page.locator(_TEXTAREA_SEL)
+                if await _visible(ta):
+                    await ta.first.fill(cover_text)
             submit = page.get_by_role("button", name="Submit application")
-            if _visible(submit):
-                submit.first.click()
-                time.sleep(2)
+            if await _visible(submit):
+                await submit.first.click()
+                await _wait_for(page, _SUCCESS_SEL)
                 return True, "Submitted via Easy Apply"
             nxt = page.get_by_role("button", name="Next").or_(page.get_by_role("button", name="Review"))
-            if _visible(nxt):
-                nxt.first.click()
-                time.sleep(2)
+            if await _visible(nxt):
+                await nxt.first.click()
+                await _wait_for(page, step_sel)
             else:
                 break
         return False, "Easy Apply form incomplete"
@@ -197,31 +401,33 @@ def _try_linkedin(page, email: str, password: str, resume_path: Path | None, cov
         return False, f"Easy Apply error: {str(e)[:80]}"
 
 
-def _try_naukri(page, email: str, password: str, resume_path: Path | None, cover_text: str) -> tuple[bool, str]:
+async def _try_naukri(
+    page, email: str, password: str, resume_path: Path | None, cover_text: str, sessions: _Sessions,
+) -> tuple[bool, str]:
     if not email or not password:
         return False, "Naukri credentials not set"
+    apply_sel = 'button:has-text("Apply"), a:has-text("Apply")'
     if "login" in page.url:
+        async def _login() -> None:
+            await page.get_by_placeholder("Enter your active Email ID").fill(email)
+            await page.get_by_placeholder("Enter your password").fill(password)
+            await page.get_by_role("button", name="Login").click()
+
         try:
-            page.get_by_placeholder("Enter your active Email ID").fill(email)
-            page.get_by_placeholder("Enter your password").fill(password)
-            page.get_by_role("button", name="Login").click()
-            page.wait_for_load_state("networkidle", timeout=15000)
-            time.sleep(2)
+            await sessions.login(page, "naukri", _login)
         except Exception as e:
             return False, f"Naukri login failed: {str(e)[:80]}"
     try:
-        apply_btn = page.locator('button:has-text("Apply"), a:has-text("Apply")').first
-        if _visible(apply_btn):
-            apply_btn.click()
-            time.sleep(3)
-            if resume_path:
-                fi = page.locator('input[type="file"]')
-                if _visible(fi):
-                    fi.first.set_input_files(str(resume_path))
+        await _wait_for(page, apply_sel, 15_000)
+        apply_btn = page.locator(apply_sel).first
+        if await _visible(apply_btn):
+            await apply_btn.click()
+            await _wait_for(page, f'{_FILE_SEL}, button:has-text("Submit")')
+            await _upload_resume(page, resume_path)
             sub = page.locator('button:has-text("Submit")')
-            if _visible(sub):
-                sub.first.click()
-                time.sleep(2)
+            if await _visible(sub):
+                await sub.first.click()
+                await _wait_for(page, _SUCCESS_SEL)
                 return True, "Applied on Naukri"
             return True, "Apply clicked on Naukri"
         return False, "Apply button not found on Naukri"
@@ -229,44 +435,39 @@ def _try_naukri(page, email: str, password: str, resume_path: Path | None, cover
         return False, f"Naukri error: {str(e)[:80]}"
 
 
-def _try_workday(page, email: str, resume_path: Path | None) -> tuple[bool, str]:
+async def _try_workday(page, email: str, resume_path: Path | None) -> tuple[bool, str]:
+    apply_sels = [
+        'a[data-automation-id="jobPostingApplyButton"]',
+        'button[data-automation-id="jobPostingApplyButton"]',
+        'a:has-text("Apply")',
+        'button:has-text("Apply")',
+    ]
     try:
-        time.sleep(2)
-        applied = _click_first_visible(page, [
-            'a[data-automation-id="jobPostingApplyButton"]',
-            'button[data-automation-id="jobPostingApplyButton"]',
-            'a:has-text("Apply")',
-            'button:has-text("Apply")',
-        ])
+        await _wait_for(page, ", ".join(apply_sels))
+        applied = await _click_first_visible(page, apply_sels)
         if not applied:
             return False, "Workday Apply button not found"
-        time.sleep(3)
+        await _wait_for(page, 'input[data-automation-id="email"], input[type="email"], input[type="file"]')
 
-        if email:
-            email_field = page.locator('input[data-automation-id="email"], input[type="email"], input[name="email"]').first
-            if _visible(email_field):
-                email_field.fill(email)
-                time.sleep(1)
-
-        if resume_path:
-            fi = page.locator('input[type="file"]')
-            if _visible(fi):
-                fi.first.set_input_files(str(resume_path))
-                time.sleep(2)
-
-        _click_first_visible(page, [
+        await _fill_fields(page, [
+            (['input[data-automation-id="email"]', 'input[type="email"]', 'input[name="email"]'], email),
+        ])
+
+        await _upload_resume(page, resume_path)
+
+        await _click_first_visible(page, [
             'button[data-automation-id="bottom-navigation-next-button"]',
             'button:has-text("Submit")',
             'button:has-text("Next")',
             'button:has-text("Continue")',
         ])
-        time.sleep(2)
         return True, "Applied on Workday (form started)"
     except Exception as e:
         return False, f"Workday error: {str(e)[:80]}"
 
 
 def _get_candidate_names() -> tuple[str, str]:
+    """(first, last) from the profile; resolved once per apply run."""
     try:
         profile = load_profile()
         full = profile.get("profile", {}).get("name", "")
@@ -276,173 +477,141 @@ def _get_candidate_names() -> tuple[str, str]:
     return (parts[0] if parts else "", parts[1] if len(parts) > 1 else "")
 
 
-def _try_greenhouse(page, email: str, resume_path: Path | None, cover_text: str) -> tuple[bool, str]:
+async def _try_greenhouse(
+    page, email: str, resume_path: Path | None, cover_text: str, names: tuple[str, str],
+) -> tuple[bool, str]:
     try:
-        time.sleep(2)
-        first, last = _get_candidate_names()
+        await _wait_for(page, '#first_name, input[name="first_name"], input[type="email"], input[type="file"]')
+        first, last = names
+        fields: list[tuple[list[str], str]] = []
         if email:
-            if first:
-                for sel in ['#first_name', 'input[name="first_name"]']:
-                    loc = page.locator(sel).first
-                    if _visible(loc):
-                        loc.fill(first)
-                        break
-            if last:
-                for sel in ['#last_name', 'input[name="last_name"]']:
-                    loc = page.locator(sel).first
-                    if _visible(loc):
-                        loc.fill(last)
-                        break
-            for sel in ['#email', 'input[name="email"]', 'input[type="email"]']:
-                loc = page.locator(sel).first
-                if _visible(loc):
-                    loc.fill(email)
-                    break
-
-        if resume_path:
-            fi = page.locator('input[type="file"]')
-            if _visible(fi):
-                fi.first.set_input_files(str(resume_path))
-                time.sleep(2)
-
-        if cover_text:
-            ta = page.locator('textarea[name*="cover"], textarea')
-            if _visible(ta):
-                ta.first.fill(cover_text[:3000])
+            fields += [
+                (['#first_name', 'input[name="first_name"]'], first),
+                (['#last_name', 'input[name="last_name"]'], last),
+                (['#email', 'input[name="email"]', 'input[type="email"]'], email),
+            ]
+        fields.append((['textarea[name*="cover"]', 'textarea'], cover_text))
+        await _fill_fields(page, fields)
+
+        await _upload_resume(page, resume_path)
 
         sub = page.locator('input[type="submit"], button[type="submit"], button:has-text("Submit")')
-        if _visible(sub):
-            sub.first.click()
-            time.sleep(3)
+        if await _visible(sub):
+            await sub.first.click()
+            await _wait_for(page, _SUCCESS_SEL)
             return True, "Applied on Greenhouse"
         return False, "Greenhouse submit button not found"
     except Exception as e:
         return False, f"Greenhouse error: {str(e)[:80]}"
 
 
-def _try_lever(page, email: str, resume_path: Path | None, cover_text: str) -> tuple[bool, str]:
+async def _try_lever(
+    page, email: str, resume_path: Path | None, cover_text: str, names: tuple[str, str],
+) -> tuple[bool, str]:
+    form_sel = 'input[name="name"], input[name="email"], input[type="file"]'
     try:
         apply_btn = page.locator('a.postings-btn, a:has-text("Apply for this job"), a:has-text("Apply")')
-        if _visible(apply_btn):
-            apply_btn.first.click()
-            time.sleep(3)
+        await _wait_for(page, f'a.postings-btn, a:has-text("Apply"), {form_sel}')
+        if await _visible(apply_btn):
+            await apply_btn.first.click()
+            await _wait_for(page, form_sel)
 
+        fields: list[tuple[list[str], str]] = []
         if email:
-            first, last = _get_candidate_names()
-            full_name = f"{first} {last}".strip()
-            if full_name:
-                for sel in ['input[name="name"]']:
-                    loc = page.locator(sel).first
-                    if _visible(loc):
-                        loc.fill(full_name)
-                        break
-            for sel in ['input[name="email"], input[type="email"]']:
-                loc = page.locator(sel).first
-                if _visible(loc):
-                    loc.fill(email)
-                    break
-
-        if resume_path:
-            fi = page.locator('input[type="file"]')
-            if _visible(fi):
-                fi.first.set_input_files(str(resume_path))
-                time.sleep(2)
-
-        if cover_text:
-            ta = page.locator('textarea[name="comments"], textarea')
-            if _visible(ta):
-                ta.first.fill(cover_text[:3000])
+            first, last = names
+            fields += [
+                (['input[name="name"]'], f"{first} {last}".strip()),
+                (['input[name="email"]', 'input[type="email"]'], email),
+            ]
+        fields.append((['textarea[name="comments"]', 'textarea'], cover_text))
+        await _fill_fields(page, fields)
+
+        await _upload_resume(page, resume_path)
 
         sub = page.locator('button[type="submit"], button:has-text("Submit application")')
-        if _visible(sub):
-            sub.first.click()
-            time.sleep(3)
+        if await _visible(sub):
+            await sub.first.click()
+            await _wait_for(page, _SUCCESS_SEL)
             return True, "Applied on Lever"
         return False, "Lever submit button not found"
     except Exception as e:
         return False, f"Lever error: {str(e)[:80]}"
 
 
-def _try_indeed(page, email: str, resume_path: Path | None) -> tuple[bool, str]:
+async def _try_indeed(page, email: str, resume_path: Path | None) -> tuple[bool, str]:
+    apply_sels = [
+        'button[id*="apply"], button:has-text("Apply now")',
+        'a:has-text("Apply now")',
+        'button:has-text("Apply on company site")',
+        'a:has-text("Apply on company site")',
+        '#applyButtonLinkContainer a',
+    ]
     try:
-        time.sleep(2)
-        applied = _click_first_visible(page, [
-            'button[id*="apply"], button:has-text("Apply now")',
-            'a:has-text("Apply now")',
-            'button:has-text("Apply on company site")',
-            'a:has-text("Apply on company site")',
-            '#applyButtonLinkContainer a',
-        ])
+        await _wait_for(page, ", ".join(apply_sels))
+        applied = await _click_first_visible(page, apply_sels)
         if applied:
-            time.sleep(3)
+            await _wait_for(page, f'{_FILE_SEL}, button:has-text("Continue"), button:has-text("Submit"), form')
             current = page.url.lower()
             if "indeed.com" not in current:
-                return _try_generic(page, email, None, resume_path, "")
-            if resume_path:
-                fi = page.locator('input[type="file"]')
-                if _visible(fi):
-                    fi.first.set_input_files(str(resume_path))
-                    time.sleep(1)
+                return await _try_generic(page, email, None, resume_path, "")
+            await _upload_resume(page, resume_path)
             cont = page.locator('button:has-text("Continue"), button:has-text("Submit"), button[id*="continue"]')
-            if _visible(cont):
-                cont.first.click()
-                time.sleep(2)
+            if await _visible(cont):
+                await cont.first.click()
             return True, "Apply clicked on Indeed"
         return False, "Indeed Apply button not found"
     except Exception as e:
         return False, f"Indeed error: {str(e)[:80]}"
 
 
-def _try_aggregator(page, email: str, resume_path: Path | None, cover_text: str) -> tuple[bool, str]:
+async def _try_aggregator(page, email: str, resume_path: Path | None, cover_text: str) -> tuple[bool, str]:
+    apply_sels = [
+        'a:has-text("Apply")',
+        'button:has-text("Apply")',
+        'a:has-text("Apply Now")',
+        'button:has-text("Apply Now")',
+        'a:has-text("Apply on company site")',
+        'a[class*="apply"]',
+    ]
     try:
-        time.sleep(2)
-        applied = _click_first_visible(page, [
-            'a:has-text("Apply")',
-            'button:has-text("Apply")',
-            'a:has-text("Apply Now")',
-            'button:has-text("Apply Now")',
-            'a:has-text("Apply on company site")',
-            'a[class*="apply"]',
-        ])
+        await _wait_for(page, ", ".join(apply_sels))
+        applied = await _click_first_visible(page, apply_sels)
         if applied:
-            time.sleep(4)
             return True, "Apply clicked on aggregator"
         return False, "No Apply button on aggregator"
     except Exception as e:
         return False, f"Aggregator error: {str(e)[:80]}"
 
 
-def _try_generic(page, email: str, password: str | None, resume_path: Path | None, cover_text: str) -> tuple[bool, str]:
+async def _try_generic(page, email: str, password: str | None, resume_path: Path | None, cover_text: str) -> tuple[bool, str]:
+    apply_sel = 'button:has-text("Apply"), a:has-text("Apply"), button:has-text("Submit"), a:has-text("Submit")'
     try:
+        await _wait_for(page, f'input[type="email"], input[type="password"], {apply_sel}')
         email_input = page.locator('input[type="email"], input[name="email"], input[placeholder*="mail" i]').first
         pass_input = page.locator('input[type="password"]').first
-        if email and password and _visible(email_input) and _visible(pass_input):
-            email_input.fill(email)
-            pass_input.fill(password)
-            _click_first_visible(page, [
+        if email and password and await _visible(email_input) and await _visible(pass_input):
+            await email_input.fill(email)
+            await pass_input.fill(password)
+            await _click_first_visible(page, [
                 'button:has-text("Login")', 'button:has-text("Sign in")',
                 'button[type="submit"]', 'input[type="submit"]',
             ])
-            time.sleep(3)
+            await _wait_for(page, apply_sel)
 
         for label in ["Apply", "Apply Now", "Apply for this job", "Submit Application", "Submit"]:
             btn = page.locator(f'button:has-text("{label}"), a:has-text("{label}")').first
-            if _visible(btn):
-                btn.click()
-                time.sleep(3)
-                if resume_path:
-                    fi = page.locator('input[type="file"]')
-                    if _visible(fi):
-                        fi.first.set_input_files(str(resume_path))
-                        time.sleep(1)
+            if await _visible(btn):
+                await btn.click()
+                await _wait_for(page, f"{_FILE_SEL}, {_TEXTAREA_SEL}, {_SUBMIT_SEL}")
+                await _upload_resume(page, resume_path)
                 if cover_text:
-                    ta = page.locator("textarea")
-                    if _visible(ta):
-                        ta.first.fill(cover_text[:3000])
-                sub = page.locator('button:has-text("Submit"), input[type="submit"]')
-                if _visible(sub):
-                    sub.first.click()
-                    time.sleep(2)
+                    ta = page.locator(_TEXTAREA_SEL)
+                    if await _visible(ta):
+                        await ta.first.fill(cover_text)
+                sub = page.locator(_SUBMIT_SEL)
+                if await _visible(sub):
+                    await sub.first.click()
+                    await _wait_for(page, _SUCCESS_SEL)
                     return True, "Applied (generic form)"
                 return True, "Apply clicked on career page"
         return False, "No Apply button found on page"
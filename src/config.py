@@ -1,6 +1,8 @@
 """Load profile and env configuration."""
 from __future__ import annotations
 
+import copy
+import functools
 import os
 from pathlib import Path
 from typing import Any
@@ -8,6 +10,11 @@ from typing import Any
 import yaml
 from dotenv import load_dotenv
 
+try:
+    from yaml import CSafeLoader as _YLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YLoader
+
 from src.log import get_logger
 
 log = get_logger(__name__)
@@ -22,8 +29,21 @@ RESUME_DIR: Path = Path(__file__).resolve().parent.parent / "resume"
 
 
 def load_profile() -> dict[str, Any]:
-    with open(PROFILE_PATH, "r") as f:
-        data = yaml.safe_load(f)
+    """Parsed profile; re-read only when profile.yaml changes on disk."""
+    mtime_ns = PROFILE_PATH.stat().st_mtime_ns
+    return copy.deepcopy(_parse_profile(str(PROFILE_PATH), mtime_ns))
+
+
+def clear_profile_cache() -> None:
+    """Drop the cached profile and resume lookup (e.g. after editing files in place)."""
+    _parse_profile.cache_clear()
+    _find_resume.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_profile(path: str, mtime_ns: int) -> dict[str, Any]:
+    with open(path, "r") as f:
+        data = yaml.load(f, Loader=_YLoader)
 
     # Backward compat: migrate flat preferred_roles → core_roles + stretch_roles
     if "preferred_roles" in data and "core_roles" not in data:
@@ -50,26 +70,45 @@ def ensure_dirs() -> None:
 
 
 def get_resume_path() -> Path | None:
-    """First PDF or DOCX in resume folder."""
-    if not RESUME_DIR.exists():
+    """First PDF or DOCX in resume folder; rescanned only when the folder changes."""
+    try:
+        mtime_ns = RESUME_DIR.stat().st_mtime_ns
+    except FileNotFoundError:
         return None
+    return _find_resume(str(RESUME_DIR), mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
+def _find_resume(path: str, mtime_ns: int) -> Path | None:
+    entries = [p for p in Path(path).iterdir() if p.is_file()]
     for ext in (".pdf", ".docx", ".doc"):
-        for p in RESUME_DIR.iterdir():
-            if p.suffix.lower() == ext and p.is_file():
+        for p in entries:
+            if p.suffix.lower() == ext:
                 return p
     return None
 
 
+_enc_loaded_mtime: int | None = None
+
+
 def try_load_encrypted_env() -> None:
-    """If .env.enc exists, attempt to load it (prompts for password)."""
+    """If .env.enc exists, attempt to load it (prompts for password).
+
+    Skipped when the same .env.enc was already loaded in this process.
+    """
+    global _enc_loaded_mtime
     enc_path = Path(__file__).resolve().parent.parent / ".env.enc"
     if not enc_path.exists():
         return
+    mtime_ns = enc_path.stat().st_mtime_ns
+    if mtime_ns == _enc_loaded_mtime:
+        return
     try:
         from src.secrets_manager import load_encrypted_env
 
         master_pw = os.environ.get("MASTER_PASSWORD")
         if load_encrypted_env(password=master_pw):
+            _enc_loaded_mtime = mtime_ns
             log.info("Loaded encrypted credentials from .env.enc")
     except Exception as exc:
         log.warning("Failed to load encrypted env: %s", exc)
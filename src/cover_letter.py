@@ -1,16 +1,46 @@
 """Generate tailored cover letters using Groq (or fallback template)."""
 from __future__ import annotations
 
+import functools
 import os
+import threading
+from string import Template
 from pathlib import Path
 
+from src import llm_cache
 from src.config import DATA_DIR
+from src.groq_client import get_client
 from src.log import get_logger
 from src.models import ScoredJob
+from src.ratelimit import RateLimiter
 from src.retry import retry
 
 log = get_logger(__name__)
 
+# Bump whenever the prompt below changes so cached letters are not reused.
+PROMPT_VERSION = "v1"
+MAX_TOKENS = 400
+
+# Groq free tier allows 30 requests/minute; shared by all letter threads.
+_DEFAULT_RPM = 30
+_limiter: RateLimiter | None = None
+_limiter_lock = threading.Lock()
+
+
+def _groq_limiter() -> RateLimiter:
+    """Shared limiter, built on first use so GROQ_RPM from .env.enc applies."""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                try:
+                    rpm = int(os.environ.get("GROQ_RPM", "") or _DEFAULT_RPM)
+                except ValueError:
+                    log.warning("Ignoring invalid GROQ_RPM; using %d", _DEFAULT_RPM)
+                    rpm = _DEFAULT_RPM
+                _limiter = RateLimiter(rpm)
+    return _limiter
+
 
 def _candidate_name(profile: dict) -> str:
     return (
@@ -20,17 +50,80 @@ def _candidate_name(profile: dict) -> str:
     )
 
 
-@retry(max_attempts=2, base_delay=2.0, retryable=(Exception,))
-def _call_groq(api_key: str, model: str, prompt: str) -> str:
-    from openai import OpenAI
+def groq_model() -> str:
+    return os.environ.get("GROQ_LLM_MODEL", "llama-3.3-70b-versatile").strip()
+
+
+_SIGN_OFF = "Best regards,"
+
 
-    client = OpenAI(api_key=api_key, base_url="https://api.groq.com/openai/v1")
-    r = client.chat.completions.create(
+@retry(max_attempts=2, base_delay=2.0, retryable=(Exception,))
+def call_groq(api_key: str, model: str, prompt: str, *, signer: str | None = None) -> str:
+    """Stream a completion for *prompt*, capped at MAX_TOKENS.
+
+    With *signer*, the stream is closed as soon as the "Best regards,"
+    sign-off followed by that name has arrived, instead of waiting for
+    whatever the model appends after the letter.
+    """
+    _groq_limiter().acquire()
+    stream = get_client(api_key).chat.completions.create(
         model=model,
         messages=[{"role": "user", "content": prompt}],
-        max_tokens=400,
+        max_tokens=MAX_TOKENS,
+        stream=True,
+    )
+    text = ""
+    try:
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            text += chunk.choices[0].delta.content or ""
+            if signer:
+                at = text.rfind(_SIGN_OFF)
+                if at >= 0 and signer in text[at + len(_SIGN_OFF):]:
+                    break
+    finally:
+        stream.close()
+    return text.strip()
+
+
+@functools.lru_cache(maxsize=8)
+def _prompt_template(candidate_name: str, summary: str, skills: tuple[str, ...]) -> Template:
+    """Prompt with the candidate fields baked in; only job fields remain."""
+    def lit(s: str) -> str:
+        return s.replace("$", "$$")
+
+    name = lit(candidate_name)
+    return Template(f"""Write a short, professional cover letter (under 200 words) for this role.
+Candidate name: {name}
+Candidate summary: {lit(summary)}
+Key skills: {lit(', '.join(skills))}
+Job title: $title
+Company: $company
+Job description (excerpt): $description
+
+Match the tone to the company and role. Mention 2–3 relevant skills. End with a clear one-line CTA.
+Use "I" and "my" for the candidate. End the letter with "Best regards," followed by the candidate name: {name}. Do not use placeholders like [Your Name].""")
+
+
+def build_prompt(scored: ScoredJob, profile: dict) -> str:
+    p = profile.get("profile", {})
+    tmpl = _prompt_template(
+        _candidate_name(profile), p.get("summary", ""), tuple(p.get("skills", [])[:8]),
+    )
+    job = scored.job
+    return tmpl.substitute(
+        title=job.title, company=job.company, description=job.description[:1500],
     )
-    return (r.choices[0].message.content or "").strip()
+
+
+def cache_key(prompt: str, model: str) -> str:
+    return llm_cache.make_key(PROMPT_VERSION, model, prompt)
+
+
+def cached_cover_letter(scored: ScoredJob, profile: dict) -> str | None:
+    """Return a previously generated letter for this job, if one is cached."""
+    return llm_cache.get(cache_key(build_prompt(scored, profile), groq_model()))
 
 
 def generate_cover_letter(scored: ScoredJob, profile: dict) -> str:
@@ -39,25 +132,20 @@ def generate_cover_letter(scored: ScoredJob, profile: dict) -> str:
         log.debug("No GROQ_API_KEY — using template cover letter")
         return _fallback_letter(scored, profile)
 
-    model = os.environ.get("GROQ_LLM_MODEL", "llama-3.3-70b-versatile").strip()
-    candidate_name = _candidate_name(profile)
+    model = groq_model()
 
     try:
         job = scored.job
-        summary = profile.get("profile", {}).get("summary", "")
-        skills = profile.get("profile", {}).get("skills", [])
-        prompt = f"""Write a short, professional cover letter (under 200 words) for this role.
-Candidate name: {candidate_name}
-Candidate summary: {summary}
-Key skills: {', '.join(skills[:8])}
-Job title: {job.title}
-Company: {job.company}
-Job description (excerpt): {job.description[:1500]}
-
-Match the tone to the company and role. Mention 2–3 relevant skills. End with a clear one-line CTA.
-Use "I" and "my" for the candidate. End the letter with "Best regards," followed by the candidate name: {candidate_name}. Do not use placeholders like [Your Name]."""
-
-        result = _call_groq(api_key, model, prompt)
+        prompt = build_prompt(scored, profile)
+        key = cache_key(prompt, model)
+        cached = llm_cache.get(key)
+        if cached:
+            log.info("Cover letter cache hit for %s @ %s", job.title, job.company)
+            return cached
+
+        result = call_groq(api_key, model, prompt, signer=_candidate_name(profile))
+        if result:
+            llm_cache.put(key, result, prompt_version=PROMPT_VERSION, model=model)
         log.info("Cover letter generated for %s @ %s", job.title, job.company)
         return result
     except Exception as exc:
@@ -65,6 +153,10 @@ Use "I" and "my" for the candidate. End the letter with "Best regards," followed
         return _fallback_letter(scored, profile)
 
 
+def is_fallback_letter(scored: ScoredJob, profile: dict, content: str) -> bool:
+    return content == _fallback_letter(scored, profile)
+
+
 def _fallback_letter(scored: ScoredJob, profile: dict) -> str:
     job = scored.job
     summary = profile.get("profile", {}).get("summary", "")
@@ -84,9 +176,25 @@ Best regards,
 {name}"""
 
 
+class _FilenameTable(dict):
+    """str.translate table: keep alphanumerics and " -_", map the rest to "_".
+
+    Code points are classified on first sight and memoized.
+    """
+
+    def __missing__(self, cp: int) -> str:
+        ch = chr(cp)
+        out = ch if ch.isalnum() or ch in " -_" else "_"
+        self[cp] = out
+        return out
+
+
+_FILENAME_CHARS = _FilenameTable()
+
+
 def save_cover_letter(scored: ScoredJob, content: str) -> Path:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    safe = "".join(c if c.isalnum() or c in " -_" else "_" for c in scored.job.company)[:40]
+    safe = scored.job.company[:40].translate(_FILENAME_CHARS)
     path = DATA_DIR / f"cover_{scored.job.id}_{safe}.txt"
     path.write_text(content, encoding="utf-8")
     return path
@@ -0,0 +1,224 @@
+"""Generate cover letters through Groq's Batch API for unattended runs.
+
+Batch jobs are cheaper and sit outside the per-minute rate limit, but
+finish asynchronously. A run submits the letters it doesn't have yet and
+records the batch in ``data/pending_batches.json``; a later run polls it
+and copies the finished letters into the LLM cache, where the normal
+``generate_cover_letter`` path picks them up.
+"""
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import Any
+
+from src import llm_cache
+from src.config import DATA_DIR
+from src.groq_client import get_client
+from src.cover_letter import (
+    MAX_TOKENS,
+    PROMPT_VERSION,
+    build_prompt,
+    cache_key,
+    call_groq,
+    cached_cover_letter,
+    groq_model,
+)
+from src.log import get_logger
+from src.models import ScoredJob
+
+log = get_logger(__name__)
+
+PENDING_PATH = DATA_DIR / "pending_batches.json"
+
+# Batches still unfinished after this long are cancelled and their
+# remaining letters generated one request at a time.
+DEFAULT_MAX_WAIT_MINUTES = 720
+
+
+def _max_wait_minutes() -> float:
+    """GROQ_BATCH_MAX_WAIT_MIN, read at poll time so values from .env.enc apply."""
+    try:
+        return float(os.environ.get("GROQ_BATCH_MAX_WAIT_MIN", "") or DEFAULT_MAX_WAIT_MINUTES)
+    except ValueError:
+        log.warning("Ignoring invalid GROQ_BATCH_MAX_WAIT_MIN; using %d", DEFAULT_MAX_WAIT_MINUTES)
+        return DEFAULT_MAX_WAIT_MINUTES
+
+_DONE = {"completed", "expired", "cancelled", "failed"}
+
+
+def _load_pending() -> list[dict[str, Any]]:
+    if not PENDING_PATH.exists():
+        return []
+    try:
+        return json.loads(PENDING_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        log.warning("Ignoring unreadable %s: %s", PENDING_PATH.name, exc)
+        return []
+
+
+def _save_pending(batches: list[dict[str, Any]]) -> None:
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    PENDING_PATH.write_text(json.dumps(batches, indent=2), encoding="utf-8")
+
+
+def _ingest_output(client: Any, batch: Any, requests: dict[str, dict[str, str]], model: str) -> set[str]:
+    """Cache every successful result in the batch output; return their custom_ids."""
+    done: set[str] = set()
+    if not getattr(batch, "output_file_id", None):
+        return done
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        item = json.loads(line)
+        req = requests.get(item.get("custom_id", ""))
+        resp = item.get("response") or {}
+        if not req or resp.get("status_code") != 200:
+            continue
+        choices = (resp.get("body") or {}).get("choices") or []
+        text = ((choices[0].get("message") or {}).get("content") or "").strip() if choices else ""
+        if text:
+            llm_cache.put(req["key"], text, prompt_version=PROMPT_VERSION, model=model)
+            done.add(item["custom_id"])
+    return done
+
+
+def ingest_pending(api_key: str) -> int:
+    """Poll recorded batches; cache finished letters, fall back on stale ones.
+
+    Returns the number of letters added to the cache.
+    """
+    batches = _load_pending()
+    if not batches:
+        return 0
+
+    client = get_client(api_key)
+    max_wait = _max_wait_minutes()
+    still_pending: list[dict[str, Any]] = []
+    ingested = 0
+    for rec in batches:
+        requests: dict[str, dict[str, str]] = rec.get("requests", {})
+        model = rec.get("model") or groq_model()
+        try:
+            batch = client.batches.retrieve(rec["batch_id"])
+        except Exception as exc:
+            log.warning("Batch %s: poll failed (%s), will retry next run", rec.get("batch_id"), exc)
+            still_pending.append(rec)
+            continue
+
+        age_min = (time.time() - rec.get("submitted_at", 0)) / 60
+        if batch.status not in _DONE and age_min < max_wait:
+            log.info("Batch %s still %s (%.0f min old)", rec["batch_id"], batch.status, age_min)
+            still_pending.append(rec)
+            continue
+
+        if batch.status not in _DONE:
+            log.warning("Batch %s not done after %.0f min — cancelling", rec["batch_id"], age_min)
+            try:
+                batch = client.batches.cancel(rec["batch_id"])
+            except Exception as exc:
+                log.warning("Batch %s: cancel failed (%s)", rec["batch_id"], exc)
+
+        try:
+            done = _ingest_output(client, batch, requests, model)
+        except Exception as exc:
+            log.warning("Batch %s: could not read output (%s)", rec["batch_id"], exc)
+            done = set()
+        ingested += len(done)
+
+        # Anything the batch didn't deliver goes through the regular path.
+        for custom_id, req in requests.items():
+            if custom_id in done:
+                continue
+            try:
+                text = call_groq(api_key, model, req["prompt"])
+            except Exception as exc:
+                log.warning("Fallback letter for %s failed: %s", custom_id, exc)
+                continue
+            if text:
+                llm_cache.put(req["key"], text, prompt_version=PROMPT_VERSION, model=model)
+                ingested += 1
+        log.info("Batch %s (%s): %d/%d letters delivered", rec["batch_id"], batch.status, len(done), len(requests))
+
+    _save_pending(still_pending)
+    return ingested
+
+
+def submit_batch(scored_list: list[ScoredJob], profile: dict, api_key: str) -> str | None:
+    """Submit one batch for *scored_list*; returns the batch id (None if nothing to send)."""
+    model = groq_model()
+    pending = _load_pending()
+    in_flight = {req["key"] for rec in pending for req in rec.get("requests", {}).values()}
+
+    requests: dict[str, dict[str, str]] = {}
+    lines: list[str] = []
+    for s in scored_list:
+        prompt = build_prompt(s, profile)
+        key = cache_key(prompt, model)
+        if key in in_flight or s.job.id in requests:
+            continue
+        requests[s.job.id] = {"key": key, "prompt": prompt}
+        lines.append(json.dumps({
+            "custom_id": s.job.id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {
+                "model": model,
+                "messages": [{"role": "user", "content": prompt}],
+                "max_tokens": MAX_TOKENS,
+            },
+        }))
+    if not lines:
+        return None
+
+    client = get_client(api_key)
+    upload = client.files.create(
+        file=("cover_letters.jsonl", ("\n".join(lines) + "\n").encode("utf-8")),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=upload.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+    )
+    pending.append({
+        "batch_id": batch.id,
+        "submitted_at": int(time.time()),
+        "model": model,
+        "requests": requests,
+    })
+    _save_pending(pending)
+    log.info("Submitted batch %s with %d cover letter(s)", batch.id, len(requests))
+    return batch.id
+
+
+def defer_to_batch(scored_list: list[ScoredJob], profile: dict) -> list[ScoredJob]:
+    """Ingest finished batches, batch up uncached letters, return jobs ready now.
+
+    Jobs whose letter is already cached are returned for immediate use.
+    The rest are submitted as a batch and left out of this run. Without a
+    Groq key, or if submission fails, every job is returned unchanged so
+    the caller generates letters as usual.
+    """
+    api_key = os.environ.get("GROQ_API_KEY", "").strip()
+    if not api_key or not scored_list:
+        return scored_list
+
+    try:
+        ingest_pending(api_key)
+    except Exception as exc:
+        log.warning("Could not ingest pending batches: %s", exc)
+
+    ready: list[ScoredJob] = []
+    missing: list[ScoredJob] = []
+    for s in scored_list:
+        (ready if cached_cover_letter(s, profile) else missing).append(s)
+    if not missing:
+        return ready
+    try:
+        submit_batch(missing, profile, api_key)
+    except Exception as exc:
+        log.warning("Batch submission failed (%s), generating letters directly", exc)
+        return scored_list
+    return ready
@@ -1,12 +1,12 @@
 """Send daily job report by email (HTML-formatted)."""
 from __future__ import annotations
 
+import functools
 import os
 import re
 import smtplib
 from datetime import datetime, timezone
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+from email.message import EmailMessage
 
 from src.log import get_logger
 from src.retry import retry
@@ -14,92 +14,162 @@ from src.retry import retry
 log = get_logger(__name__)
 
 
+_BLOCK_RE = re.compile(
+    r"(?P<h3>### )|(?P<h2>## )|(?P<h1># )|(?P<hr>---$)"
+    r"|(?P<row>\|(?:.*\|)?$)|(?P<li>- )|(?P<fence>```)"
+)
+
+# One pass for all inline markup; the first alternative to match at a
+# position wins, so code spans and link URLs are never re-styled.
+_INLINE_RE = re.compile(
+    r"\*\*(?P<bold>.+?)\*\*"
+    r"|`(?P<code>.+?)`"
+    r"|\[(?P<label>[^\]]+)\]\((?P<href>[^)]+)\)"
+    r"|_(?P<em>.+?)_"
+)
+
+_H1 = '<h1 style="margin:0 0 8px;color:#2c3e50">{}</h1>'
+_H2 = '<h2 style="margin:18px 0 6px;color:#2c3e50;border-bottom:1px solid #ddd;padding-bottom:4px">{}</h2>'
+_H3 = '<h3 style="margin:12px 0 4px;color:#1a1a1a">{}</h3>'
+_HR = '<hr style="border:none;border-top:1px solid #e0e0e0;margin:16px 0">'
+_LI = '<div style="margin:2px 0 2px 16px">\u2022 {}</div>'
+_TABLE = '<table style="border-collapse:collapse;width:100%;font-size:13px;margin:8px 0">'
+_TH = '<th style="border:1px solid #ddd;padding:6px 8px;background:#f5f7fa;text-align:left;white-space:nowrap">{}</th>'
+_TD = '<td style="border:1px solid #ddd;padding:5px 8px;background:{}">{}</td>'
+
+
 def _md_to_html(md: str) -> str:
     """Lightweight markdown-to-HTML for the report email."""
-    lines = md.split("\n")
     html_parts: list[str] = []
+    out = html_parts.append
     in_table = False
 
-    for line in lines:
+    for line in md.split("\n"):
         stripped = line.strip()
 
         if not stripped:
             if in_table:
-                html_parts.append("</table>")
+                out("</table>")
                 in_table = False
-            html_parts.append("<br>")
+            out("<br>")
             continue
 
-        if stripped.startswith("### "):
-            html_parts.append(f'<h3 style="margin:12px 0 4px;color:#1a1a1a">{_inline(stripped[4:])}</h3>')
-            continue
-        if stripped.startswith("## "):
-            html_parts.append(f'<h2 style="margin:18px 0 6px;color:#2c3e50;border-bottom:1px solid #ddd;padding-bottom:4px">{_inline(stripped[3:])}</h2>')
-            continue
-        if stripped.startswith("# "):
-            html_parts.append(f'<h1 style="margin:0 0 8px;color:#2c3e50">{_inline(stripped[2:])}</h1>')
-            continue
-
-        if stripped == "---":
-            html_parts.append('<hr style="border:none;border-top:1px solid #e0e0e0;margin:16px 0">')
-            continue
-
-        if stripped.startswith("|") and stripped.endswith("|"):
+        m = _BLOCK_RE.match(stripped)
+        kind = m.lastgroup if m else None
+
+        if kind == "h3":
+            out(_H3.format(_inline(stripped[4:])))
+        elif kind == "h2":
+            out(_H2.format(_inline(stripped[3:])))
+        elif kind == "h1":
+            out(_H1.format(_inline(stripped[2:])))
+        elif kind == "hr":
+            out(_HR)
+        elif kind == "row":
             cells = [c.strip() for c in stripped.split("|")[1:-1]]
             if all(set(c) <= {"-", " ", ":"} for c in cells):
                 continue
             if not in_table:
-                html_parts.append('<table style="border-collapse:collapse;width:100%;font-size:13px;margin:8px 0">')
-                html_parts.append("<tr>" + "".join(
-                    f'<th style="border:1px solid #ddd;padding:6px 8px;background:#f5f7fa;text-align:left;white-space:nowrap">{_inline(c)}</th>' for c in cells
-                ) + "</tr>")
+                out(_TABLE)
+                out("<tr>" + "".join(_TH.format(_inline(c)) for c in cells) + "</tr>")
                 in_table = True
                 continue
-            color = "#fff"
-            if any(c.strip() == "Applied" for c in cells):
-                color = "#e8f5e9"
-            html_parts.append("<tr>" + "".join(
-                f'<td style="border:1px solid #ddd;padding:5px 8px;background:{color}">{_inline(c)}</td>' for c in cells
-            ) + "</tr>")
-            continue
-
-        if stripped.startswith("- "):
-            html_parts.append(f'<div style="margin:2px 0 2px 16px">\u2022 {_inline(stripped[2:])}</div>')
-            continue
-
-        if stripped.startswith("```"):
+            color = "#e8f5e9" if "Applied" in cells else "#fff"
+            out("<tr>" + "".join(_TD.format(color, _inline(c)) for c in cells) + "</tr>")
+        elif kind == "li":
+            out(_LI.format(_inline(stripped[2:])))
+        elif kind == "fence":
             continue
-
-        html_parts.append(f"<p style='margin:4px 0'>{_inline(stripped)}</p>")
+        else:
+            out(f"<p style='margin:4px 0'>{_inline(stripped)}</p>")
 
     if in_table:
-        html_parts.append("</table>")
+        out("</table>")
 
     return "\n".join(html_parts)
 
 
+def _inline_sub(m: re.Match) -> str:
+    kind = m.lastgroup
+    if kind == "bold":
+        return f"<strong>{_inline(m['bold'])}</strong>"
+    if kind == "code":
+        return (
+            '<code style="background:#f0f0f0;padding:1px 4px;border-radius:3px;font-size:12px">'
+            f"{m['code']}</code>"
+        )
+    if kind == "em":
+        return f"<em>{_inline(m['em'])}</em>"
+    return f'<a href="{m["href"]}" style="color:#1a73e8">{_inline(m["label"])}</a>'
+
+
+@functools.lru_cache(maxsize=2048)
 def _inline(text: str) -> str:
     """Convert inline markdown (bold, italic, links, code) to HTML."""
-    text = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', text)
-    text = re.sub(r'_(.+?)_', r'<em>\1</em>', text)
-    text = re.sub(
-        r'`(.+?)`',
-        r'<code style="background:#f0f0f0;padding:1px 4px;border-radius:3px;font-size:12px">\1</code>',
-        text,
-    )
-    text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2" style="color:#1a73e8">\1</a>', text)
-    return text
-
-
-@retry(max_attempts=3, base_delay=3.0, retryable=(smtplib.SMTPException, OSError))
-def _smtp_send(
-    host: str, port: int, user: str, password: str,
-    from_addr: str, to_addr: str, msg: MIMEMultipart,
-) -> None:
-    with smtplib.SMTP(host, port) as server:
-        server.starttls()
-        server.login(user, password)
-        server.sendmail(from_addr, [to_addr], msg.as_string())
+    return _INLINE_RE.sub(_inline_sub, text)
+
+
+class _SmtpSession:
+    """One authenticated SMTP connection, kept across send retries.
+
+    Port 465 uses implicit TLS (SMTP_SSL); anything else connects in the
+    clear and upgrades with STARTTLS. The connection is reopened only when
+    the server drops it, so a retried send skips the TLS handshake.
+    """
+
+    def __init__(self, host: str, port: int, user: str, password: str) -> None:
+        self.host, self.port = host, port
+        self.user, self.password = user, password
+        self._server: smtplib.SMTP | None = None
+
+    def __enter__(self) -> _SmtpSession:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _connect(self) -> smtplib.SMTP:
+        implicit_tls = self.port == 465
+        server = (smtplib.SMTP_SSL if implicit_tls else smtplib.SMTP)(self.host, self.port)
+        try:
+            if not implicit_tls:
+                server.starttls()
+            server.login(self.user, self.password)
+        except BaseException:
+            # Each retry opens a new socket; don't leak this one.
+            server.close()
+            raise
+        return server
+
+    def close(self) -> None:
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except (smtplib.SMTPException, OSError):
+                self._server.close()
+            self._server = None
+
+    @retry(max_attempts=3, base_delay=3.0, retryable=(smtplib.SMTPException, OSError))
+    def send(self, msg: EmailMessage) -> None:
+        try:
+            if self._server is None:
+                self._server = self._connect()
+            self._server.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            self._drop()
+            raise
+        except smtplib.SMTPException:
+            # Server rejected this attempt; the session itself is still usable.
+            raise
+        except OSError:
+            self._drop()
+            raise
+
+    def _drop(self) -> None:
+        """Forget a dead connection so the next attempt reconnects."""
+        if self._server is not None:
+            self._server.close()
+            self._server = None
 
 
 def send_report_email(
@@ -131,15 +201,16 @@ def send_report_email(
 <p style="font-size:11px;color:#999">Sent by your Autonomous Job Search Agent</p>
 </div>"""
 
-    msg = MIMEMultipart("alternative")
+    msg = EmailMessage()
     msg["Subject"] = subject
     msg["From"] = from_addr
     msg["To"] = to_addr
-    msg.attach(MIMEText(body, "plain", "utf-8"))
-    msg.attach(MIMEText(html_body, "html", "utf-8"))
+    msg.set_content(body)
+    msg.add_alternative(html_body, subtype="html")
 
     try:
-        _smtp_send(host, port, user, password, from_addr, to_addr, msg)
+        with _SmtpSession(host, port, user, password) as session:
+            session.send(msg)
         log.info("Email sent to %s", to_addr)
         return True, "Email sent"
     except Exception as e:
@@ -0,0 +1,15 @@
+"""Shared Groq client (OpenAI-compatible endpoint)."""
+from __future__ import annotations
+
+import functools
+from typing import Any
+
+GROQ_BASE_URL = "https://api.groq.com/openai/v1"
+
+
+@functools.lru_cache(maxsize=2)
+def get_client(api_key: str) -> Any:
+    """One client per key, so every caller reuses the same HTTPS connection pool."""
+    from openai import OpenAI
+
+    return OpenAI(api_key=api_key, base_url=GROQ_BASE_URL)
@@ -0,0 +1,128 @@
+"""Reuse cover letters across near-identical jobs.
+
+Many postings differ only in company name ("Senior Python Engineer" at a
+dozen SaaS firms). For lower-ranked jobs, one LLM letter per cluster is
+enough: the letter is stored with the company and role swapped for
+placeholders, and later jobs with the same signature get it back with
+their own company and role filled in.
+
+Signature = (normalized role, seniority bucket, top matched skills,
+profile fingerprint). Templates live in ``data/letter_templates.json``,
+ordered by hit count.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from typing import Any
+
+from src.config import DATA_DIR
+from src.cover_letter import PROMPT_VERSION
+from src.log import get_logger
+from src.models import ScoredJob
+
+log = get_logger(__name__)
+
+TEMPLATES_PATH = DATA_DIR / "letter_templates.json"
+
+_COMPANY = "<<COMPANY>>"
+_ROLE = "<<ROLE>>"
+
+_SENIORITY: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("principal", ("principal", "staff", "architect")),
+    ("lead", ("lead", "manager", "head")),
+    ("senior", ("senior", "sr", "l4", "iii")),
+    ("junior", ("junior", "jr", "associate", "intern", "trainee")),
+)
+_SENIORITY_WORDS = frozenset(w for _, words in _SENIORITY for w in words)
+_WORD_RE = re.compile(r"[a-z0-9+#]+")
+_LEGAL_SUFFIX_RE = re.compile(
+    r"[\s,]+(?:inc|incorporated|llc|llp|ltd|limited|corp|corporation|co|gmbh|plc|pvt|private|"
+    r"s\.?a|ag|bv|pte)\.?(?:[\s,]+(?:ltd|limited)\.?)*$",
+    re.IGNORECASE,
+)
+
+
+def _seniority(words: list[str]) -> str:
+    for bucket, markers in _SENIORITY:
+        if any(w in markers for w in words):
+            return bucket
+    return "mid"
+
+
+def _profile_fingerprint(profile: dict) -> str:
+    p = profile.get("profile", {})
+    blob = json.dumps(
+        [PROMPT_VERSION, p.get("name", ""), p.get("summary", ""), p.get("skills", [])[:8]],
+        sort_keys=True,
+    )
+    return hashlib.blake2b(blob.encode("utf-8"), digest_size=6).hexdigest()
+
+
+def signature(scored: ScoredJob, profile: dict) -> str:
+    words = _WORD_RE.findall(scored.job.title.lower())
+    role = " ".join(w for w in words if w not in _SENIORITY_WORDS)
+    skills = ",".join(sorted(scored.keyword_suggestions[:5]))
+    return "|".join((role, _seniority(words), skills, _profile_fingerprint(profile)))
+
+
+def load_templates() -> dict[str, dict[str, Any]]:
+    if not TEMPLATES_PATH.exists():
+        return {}
+    try:
+        return json.loads(TEMPLATES_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        log.warning("Ignoring unreadable %s: %s", TEMPLATES_PATH.name, exc)
+        return {}
+
+
+def save_templates(templates: dict[str, dict[str, Any]]) -> None:
+    """Persist templates, hottest first so lookups and eyeballing favour them."""
+    ordered = dict(sorted(templates.items(), key=lambda kv: -kv[1].get("hit_count", 0)))
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    TEMPLATES_PATH.write_text(json.dumps(ordered, indent=2), encoding="utf-8")
+
+
+def render(templates: dict[str, dict[str, Any]], scored: ScoredJob, profile: dict) -> str | None:
+    """Letter for *scored* from a matching template, or None on a cluster miss."""
+    entry = templates.get(signature(scored, profile))
+    if not entry:
+        return None
+    entry["hit_count"] = entry.get("hit_count", 0) + 1
+    job = scored.job
+    return entry["template"].replace(_COMPANY, job.company).replace(_ROLE, job.title)
+
+
+def _company_base(company: str) -> str:
+    """*company* without a trailing legal suffix ("Acme Inc." -> "Acme")."""
+    return _LEGAL_SUFFIX_RE.sub("", company).strip(" ,.")
+
+
+def learn(
+    templates: dict[str, dict[str, Any]], scored: ScoredJob, profile: dict, letter: str,
+) -> None:
+    """Store *letter* as the template for its cluster (first letter wins).
+
+    Skipped unless the company was actually swapped for its placeholder
+    and nothing naming the company is left, so one employer's name can't
+    leak into letters for the rest of the cluster.
+    """
+    sig = signature(scored, profile)
+    job = scored.job
+    if sig in templates or not letter or not job.company:
+        return
+    template = letter.replace(job.company, _COMPANY)
+    base = _company_base(job.company)
+    if base:
+        template = re.sub(rf"(?<!\w){re.escape(base)}(?!\w)", _COMPANY, template, flags=re.IGNORECASE)
+    if job.title:
+        template = template.replace(job.title, _ROLE)
+    leftover = [
+        t for t in _WORD_RE.findall(base.lower())
+        if len(t) >= 3 and re.search(rf"(?<![a-z0-9]){re.escape(t)}(?![a-z0-9])", template.lower())
+    ]
+    if _COMPANY not in template or leftover:
+        log.debug("Not templating letter for %s: company name not cleanly replaced", job.company)
+        return
+    templates[sig] = {"template": template, "ref_job_id": job.id, "hit_count": 0}
@@ -0,0 +1,90 @@
+"""Persistent, content-addressed cache for LLM responses (stdlib sqlite3).
+
+Keys are 128-bit BLAKE2b digests of everything that shapes a response (prompt
+version, model, full prompt), so a hit is always safe to reuse. Entries
+expire after a TTL; expired rows are dropped lazily on read.
+"""
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+
+from src.config import DATA_DIR
+from src.log import get_logger
+
+log = get_logger(__name__)
+
+DB_PATH = DATA_DIR / "llm_cache.sqlite"
+DEFAULT_TTL = 7 * 24 * 3600  # one week
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    hash           TEXT PRIMARY KEY,
+    prompt_version TEXT NOT NULL,
+    model          TEXT NOT NULL,
+    response       TEXT NOT NULL,
+    created_at     INTEGER NOT NULL,
+    expires_at     INTEGER NOT NULL
+)
+"""
+
+_local = threading.local()
+
+
+def _conn() -> sqlite3.Connection:
+    """One connection per thread (sqlite3 connections are not shareable)."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(DB_PATH, timeout=10)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(_SCHEMA)
+        _local.conn = conn
+    return conn
+
+
+def make_key(*parts: str) -> str:
+    # 128-bit BLAKE2b: ample for cache keys and cheaper than SHA-256 on prompts.
+    return hashlib.blake2b("\x1f".join(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def get(key: str) -> str | None:
+    """Return the cached response for *key*, or None on miss/expiry/error."""
+    try:
+        conn = _conn()
+        row = conn.execute(
+            "SELECT response, expires_at FROM responses WHERE hash = ?", (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        if row[1] <= time.time():
+            with conn:
+                conn.execute("DELETE FROM responses WHERE hash = ?", (key,))
+            return None
+        return row[0]
+    except sqlite3.Error as exc:
+        log.debug("LLM cache read failed: %s", exc)
+        return None
+
+
+def put(
+    key: str,
+    value: str,
+    *,
+    prompt_version: str = "",
+    model: str = "",
+    ttl: int = DEFAULT_TTL,
+) -> None:
+    now = int(time.time())
+    try:
+        conn = _conn()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, prompt_version, model, value, now, now + ttl),
+            )
+    except sqlite3.Error as exc:
+        log.debug("LLM cache write failed: %s", exc)
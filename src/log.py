@@ -1,10 +1,14 @@
 """Centralized logging configuration — stdlib only."""
 from __future__ import annotations
 
+import atexit
 import logging
 import os
+import queue
 import sys
+import threading
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 _LOG_DIR = Path(__file__).resolve().parent.parent / "logs"
@@ -12,6 +16,40 @@ _FORMAT = "%(asctime)s  %(levelname)-8s  %(name)s  %(message)s"
 _DATE_FMT = "%Y-%m-%d %H:%M:%S"
 _configured = False
 
+# The log file is written through a 64 KiB buffer and flushed every couple
+# of seconds (and on errors / at exit) instead of after every record.
+_FILE_BUFFER = 64 * 1024
+_FLUSH_INTERVAL = 2.0
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that skips the per-record flush; see :meth:`sync`."""
+
+    def _open(self):
+        return open(
+            self.baseFilename, self.mode, buffering=_FILE_BUFFER,
+            encoding=self.encoding, errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if record.levelno >= logging.ERROR:
+            self.sync()
+
+    def flush(self) -> None:
+        pass
+
+    def sync(self) -> None:
+        """Push buffered records to the file."""
+        with self.lock:
+            if self.stream and not self.stream.closed:
+                self.stream.flush()
+
+
+def _flush_periodically(handler: _BufferedFileHandler, stop: threading.Event) -> None:
+    while not stop.wait(_FLUSH_INTERVAL):
+        handler.sync()
+
 
 def get_logger(name: str) -> logging.Logger:
     """Return a named logger; configures root handlers on first call."""
@@ -35,14 +73,33 @@ def _configure() -> None:
     console = logging.StreamHandler(sys.stdout)
     console.setLevel(level)
     console.setFormatter(logging.Formatter(_FORMAT, datefmt=_DATE_FMT))
-    root.addHandler(console)
+    handlers: list[logging.Handler] = [console]
 
     try:
         _LOG_DIR.mkdir(parents=True, exist_ok=True)
         log_file = _LOG_DIR / f"agent_{datetime.now().strftime('%Y-%m-%d')}.log"
-        fh = logging.FileHandler(log_file, encoding="utf-8")
+        fh = _BufferedFileHandler(log_file, encoding="utf-8")
         fh.setLevel(logging.DEBUG)
         fh.setFormatter(logging.Formatter(_FORMAT, datefmt=_DATE_FMT))
-        root.addHandler(fh)
+        handlers.append(fh)
     except OSError:
-        pass
+        fh = None
+
+    # Callers only enqueue; a listener thread does the console/file I/O.
+    # Stopping it at exit drains whatever is still queued.
+    q: queue.Queue[logging.LogRecord] = queue.Queue(-1)
+    listener = QueueListener(q, *handlers, respect_handler_level=True)
+    listener.start()
+    root.addHandler(QueueHandler(q))
+
+    stop = threading.Event()
+    if fh is not None:
+        threading.Thread(target=_flush_periodically, args=(fh, stop), daemon=True, name="log-flush").start()
+
+    def _shutdown() -> None:
+        listener.stop()
+        stop.set()
+        if fh is not None:
+            fh.sync()
+
+    atexit.register(_shutdown)
@@ -6,7 +6,12 @@ from typing import Any
 
 import yaml
 
-from src.config import CONFIG_DIR, PROFILE_PATH
+try:
+    from yaml import CSafeDumper as _YDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YDumper
+
+from src.config import CONFIG_DIR, PROFILE_PATH, clear_profile_cache
 from src.log import get_logger
 
 log = get_logger(__name__)
@@ -15,22 +20,23 @@ log = get_logger(__name__)
 def generate_profile(parsed: dict[str, Any], overrides: dict[str, Any] | None = None) -> dict[str, Any]:
     """Build a complete profile dict from parsed resume data + optional overrides."""
     ov = overrides or {}
+    # Non-empty overrides win over parsed values, key by key.
+    merged = {**parsed, **{k: v for k, v in ov.items() if v}}
 
-    name = ov.get("name") or parsed.get("name", "")
-    title = ov.get("title") or parsed.get("title", "")
-    years = ov.get("years_experience") or parsed.get("years_experience", 0)
-    level = ov.get("level") or parsed.get("level", "intermediate")
-    skills = ov.get("skills") or parsed.get("skills", [])
-    summary = ov.get("summary") or parsed.get("summary", "")
-    locations = ov.get("locations") or parsed.get("locations", ["Remote"])
+    name = merged.get("name", "")
+    title = merged.get("title", "")
+    years = merged.get("years_experience", 0)
+    level = merged.get("level", "intermediate")
+    skills = merged.get("skills", [])
+    summary = merged.get("summary", "")
+    locations = merged.get("locations", ["Remote"])
 
-    core_roles = ov.get("core_roles") or parsed.get("core_roles", [])
-    stretch_roles = ov.get("stretch_roles") or parsed.get("stretch_roles", [])
+    core_roles = merged.get("core_roles", [])
+    stretch_roles = merged.get("stretch_roles", [])
 
     # Backward compat: if caller only provides flat preferred_roles, treat as core
     if not core_roles and not stretch_roles:
-        flat = ov.get("preferred_roles") or parsed.get("preferred_roles", [])
-        core_roles = flat
+        core_roles = merged.get("preferred_roles", [])
         stretch_roles = []
 
     if not summary and title and skills:
@@ -84,7 +90,8 @@ def write_profile(profile: dict[str, Any], path: Path | None = None) -> Path:
         "# ============================================================\n\n"
     )
 
-    yaml_str = yaml.dump(profile, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    yaml_str = yaml.dump(profile, Dumper=_YDumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
     path.write_text(header + yaml_str, encoding="utf-8")
+    clear_profile_cache()
     log.info("Profile written → %s", path)
     return path
@@ -0,0 +1,34 @@
+"""Thread-safe token-bucket rate limiter — stdlib only."""
+from __future__ import annotations
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Allow at most *per_minute* acquisitions per rolling minute.
+
+    The bucket starts full, so short bursts up to the limit go straight
+    through; after that, callers block until a token refills.
+    """
+
+    def __init__(self, per_minute: int) -> None:
+        self.capacity = max(1, per_minute)
+        self._rate = self.capacity / 60.0
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self._rate,
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
@@ -1,7 +1,12 @@
 """Generate daily report of top job matches."""
 from __future__ import annotations
 
+import functools
+import io
+import os
 from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlsplit
 
 from src.config import REPORTS_DIR
 from src.log import get_logger
@@ -31,11 +36,10 @@ def _short_reason(reason: str) -> str:
     return reason[:80] + ("\u2026" if len(reason) > 80 else "")
 
 
+@functools.lru_cache(maxsize=4096)
 def _short_url_label(url: str) -> str:
     try:
-        from urllib.parse import urlparse
-
-        host = urlparse(url).hostname or ""
+        host = urlsplit(url).hostname or ""
         host = host.replace("www.", "")
         parts = host.split(".")
         return parts[0].capitalize() if parts else "Link"
@@ -43,15 +47,34 @@ def _short_url_label(url: str) -> str:
         return "Link"
 
 
+def report_date() -> str:
+    """Today's UTC date as ``YYYY-MM-DD``, the report's title and file name."""
+    return datetime.now(timezone.utc).date().isoformat()
+
+
 def _dedupe_apps(apps: list[dict]) -> list[dict]:
-    seen: set[tuple[str, str]] = set()
-    out: list[dict] = []
+    """Most recent application per (title, company), newest first."""
+    latest: dict[tuple[str, str], dict] = {}
     for a in reversed(apps):
-        k = (a.get("title", ""), a.get("company", ""))
-        if k not in seen:
-            seen.add(k)
-            out.append(a)
-    return out
+        latest.setdefault((a.get("title", ""), a.get("company", "")), a)
+    return list(latest.values())
+
+
+def _quick_reference(top: list[ScoredJob], applied_job_ids: set[str]) -> str:
+    """Markdown table of *top*, written row by row into one buffer."""
+    buf = io.StringIO()
+    w = buf.write
+    w("| # | Role | Company | Location | Score | Status | Apply |\n")
+    w("|--:|------|---------|----------|------:|--------|-------|\n")
+    for i, s in enumerate(top, 1):
+        job = s.job
+        title = job.title[:40] + ("\u2026" if len(job.title) > 40 else "")
+        company = job.company[:22] + ("\u2026" if len(job.company) > 22 else "")
+        loc = job.location.split(",")[0][:18]
+        status = "Applied" if job.id in applied_job_ids else "Pending"
+        link = f"[{_short_url_label(job.url)}]({job.url})" if job.url else "\u2014"
+        w(f"| {i} | {title} | {company} | {loc} | {s.score:.0%} | {status} | {link} |\n")
+    return buf.getvalue()
 
 
 def build_daily_report(
@@ -60,23 +83,24 @@ def build_daily_report(
     *,
     applied_job_ids: set[str] | None = None,
     apply_results: dict[str, str] | None = None,
+    date: str | None = None,
 ) -> str:
     applied_job_ids = applied_job_ids or set()
     apply_results = apply_results or {}
-    date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    lines: list[str] = [f"# Job Search Report \u2014 {date}", ""]
+    date = date or report_date()
+    buf = io.StringIO()
+    w = buf.write
+    w(f"# Job Search Report \u2014 {date}\n\n")
 
     top = scored_jobs[:15]
     applied_count = sum(1 for s in top if s.job.id in applied_job_ids)
     pending_count = len(top) - applied_count
 
-    lines.append(f"**{len(scored_jobs)}** jobs scored | **{applied_count}** auto-applied | **{pending_count}** pending")
-    lines.append("")
+    w(f"**{len(scored_jobs)}** jobs scored | **{applied_count}** auto-applied | **{pending_count}** pending\n\n")
 
     any_failed = False
     if top:
-        lines.append("## Top Matches")
-        lines.append("")
+        w("## Top Matches\n\n")
         for s in top:
             jid = s.job.id
             applied = jid in applied_job_ids
@@ -88,67 +112,74 @@ def build_daily_report(
             url = s.job.url
             link_label = _short_url_label(url)
 
-            lines.append(f"### {badge} {s.job.title} @ {s.job.company}")
-            lines.append(f"- **Score:** {s.score:.0%} \u2014 {status}")
-            lines.append(f"- **Location:** {s.job.location}")
-            lines.append(f"- **Why:** {', '.join(s.match_reasons[:4])}")
-            lines.append(f"- **Keywords:** {', '.join(s.keyword_suggestions[:4])}")
+            w(f"### {badge} {s.job.title} @ {s.job.company}\n")
+            w(f"- **Score:** {s.score:.0%} \u2014 {status}\n")
+            w(f"- **Location:** {s.job.location}\n")
+            w(f"- **Why:** {', '.join(s.match_reasons[:4])}\n")
+            w(f"- **Keywords:** {', '.join(s.keyword_suggestions[:4])}\n")
             if url:
-                lines.append(f"- **Apply:** [{link_label}]({url})")
+                w(f"- **Apply:** [{link_label}]({url})\n")
             if reason:
-                lines.append(f"- _Note: {reason}_")
-            lines.append("")
+                w(f"- _Note: {reason}_\n")
+            w("\n")
 
     if top:
-        lines.append("---")
-        lines.append("")
-        lines.append("## Quick Reference")
-        lines.append("")
-        lines.append("| # | Role | Company | Location | Score | Status | Apply |")
-        lines.append("|--:|------|---------|----------|------:|--------|-------|")
-        for i, s in enumerate(top, 1):
-            title = s.job.title[:40] + ("\u2026" if len(s.job.title) > 40 else "")
-            company = s.job.company[:22] + ("\u2026" if len(s.job.company) > 22 else "")
-            loc = s.job.location.split(",")[0][:18]
-            status = "Applied" if s.job.id in applied_job_ids else "Pending"
-            link = f"[{_short_url_label(s.job.url)}]({s.job.url})" if s.job.url else "\u2014"
-            lines.append(f"| {i} | {title} | {company} | {loc} | {s.score:.0%} | {status} | {link} |")
-        lines.append("")
-
-    all_apps = get_applications()
-    if all_apps:
-        lines.append("---")
-        lines.append("")
-        lines.append("## Application History")
-        lines.append("")
-        for a in _dedupe_apps(all_apps[-15:])[:10]:
+        w("---\n\n## Quick Reference\n\n")
+        w(_quick_reference(top, applied_job_ids))
+        w("\n")
+
+    recent_apps = get_applications(tail=15)
+    if recent_apps:
+        w("---\n\n## Application History\n\n")
+        for a in _dedupe_apps(recent_apps)[:10]:
             title, company = a.get("title", ""), a.get("company", "")
             url, status, at = a.get("url", ""), a.get("status", ""), a.get("applied_at", "")
             link = f"[Apply]({url})" if url else ""
-            lines.append(f"- **{title}** @ {company} \u2014 _{status}_ \u2014 {at} {link}")
-        lines.append("")
+            w(f"- **{title}** @ {company} \u2014 _{status}_ \u2014 {at} {link}\n")
+        w("\n")
 
     if any_failed:
-        lines.append("---")
-        lines.append("")
-        lines.append("## Troubleshooting")
-        lines.append("")
-        lines.append("If the agent couldn\u2019t apply to some jobs:")
-        lines.append("")
-        lines.append("1. **Browser:** `playwright install chromium` in the project folder")
-        lines.append("2. **Resume:** Place a PDF or DOCX in `resume/`")
-        lines.append("3. **Credentials:** Set `LINKEDIN_EMAIL`, `NAUKRI_EMAIL`, `APPLY_EMAIL` in `.env`")
-        lines.append("4. **Manual:** Use the Apply links above for jobs the agent couldn\u2019t reach")
-        lines.append("")
+        w(
+            "---\n\n## Troubleshooting\n\n"
+            "If the agent couldn\u2019t apply to some jobs:\n\n"
+            "1. **Browser:** `playwright install chromium` in the project folder\n"
+            "2. **Resume:** Place a PDF or DOCX in `resume/`\n"
+            "3. **Credentials:** Set `LINKEDIN_EMAIL`, `NAUKRI_EMAIL`, `APPLY_EMAIL` in `.env`\n"
+            "4. **Manual:** Use the Apply links above for jobs the agent couldn\u2019t reach\n"
+            "\n"
+        )
 
     log.info("Built daily report: %d jobs, %d applied", len(scored_jobs), applied_count)
-    return "\n".join(lines)
+    # Every line above ends in a newline; the report itself doesn't.
+    return buf.getvalue()[:-1]
+
+
+def _write_uncached(path: Path, data: bytes) -> None:
+    """Write *data* to *path* and drop it from the page cache.
+
+    Reports are written once a day and not read back by this process, so
+    there is no point keeping their pages cached. Falls back to a plain
+    write where posix_fadvise is unavailable (macOS).
+    """
+    if not hasattr(os, "posix_fadvise"):
+        path.write_bytes(data)
+        return
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        # Only clean pages can be dropped, so write them back first.
+        os.fdatasync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
 
 
-def write_daily_report(content: str) -> Path:
+def write_daily_report(content: str, date: str | None = None) -> Path:
     REPORTS_DIR.mkdir(parents=True, exist_ok=True)
-    date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    date = date or report_date()
     path = REPORTS_DIR / f"daily_{date}.md"
-    path.write_text(content, encoding="utf-8")
+    _write_uncached(path, content.encode("utf-8"))
     log.info("Report written → %s", path)
     return path
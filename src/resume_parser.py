@@ -3,9 +3,13 @@
 Supports PDF (via pypdf or pdftotext), DOCX (via stdlib zipfile), and TXT.
 If a Groq API key is available the raw text is sent to the LLM for
 structured extraction; otherwise a heuristic regex parser is used.
+Extracted text and LLM results are cached by file content in the LLM
+cache, so re-parsing an unchanged resume costs one local lookup.
 """
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import os
 import re
@@ -16,6 +20,17 @@ from pathlib import Path
 from typing import Any
 from xml.etree import ElementTree
 
+try:
+    import ahocorasick  # optional: pyahocorasick
+except ImportError:  # the compiled regexes below are used instead
+    ahocorasick = None
+
+try:
+    import tiktoken  # optional: token-exact prompt truncation
+except ImportError:  # falls back to a character budget
+    tiktoken = None
+
+from src import llm_cache
 from src.log import get_logger
 from src.retry import retry
 
@@ -25,7 +40,18 @@ log = get_logger(__name__)
 
 
 def extract_text(path: Path) -> str:
-    """Return plain text from a PDF, DOCX, or TXT file."""
+    """Return plain text from a PDF, DOCX, or TXT file.
+
+    Memoized in-process on (path, mtime, size), so a file that hasn't
+    changed is extracted once per process.
+    """
+    st = path.stat()
+    return _extract_text(str(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _extract_text(path_str: str, mtime_ns: int, size: int) -> str:
+    path = Path(path_str)
     suffix = path.suffix.lower()
     if suffix == ".txt":
         return path.read_text(encoding="utf-8", errors="ignore")
@@ -36,6 +62,34 @@ def extract_text(path: Path) -> str:
     raise ValueError(f"Unsupported resume format: {suffix}")
 
 
+def _file_digest(path: Path) -> str:
+    st = path.stat()
+    return _digest(str(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _digest(path_str: str, mtime_ns: int, size: int) -> str:
+    return hashlib.blake2b(Path(path_str).read_bytes(), digest_size=16).hexdigest()
+
+
+def _cached_text(path: Path, digest: str) -> str:
+    """:func:`extract_text`, memoized on the file's content digest."""
+    key = llm_cache.make_key("resume-text", digest)
+    text = llm_cache.get(key)
+    if text is None:
+        text = extract_text(path)
+        if text.strip():
+            llm_cache.put(key, text, prompt_version="resume-text")
+    return text
+
+
+_FIX_LC_UC = re.compile(r"([a-z])([A-Z])")
+# Letter→digit and digit→letter boundaries, both in one zero-width pass.
+_FIX_ALNUM = re.compile(r"(?<=[a-zA-Z])(?=\d)|(?<=\d)(?=[a-zA-Z])")
+_FIX_PUNCT = re.compile(r"([.!?,;:])([A-Za-z])")
+_FIX_DASH = re.compile(r"([a-z])(—|–|-\s)([A-Za-z])")
+
+
 def _fix_spacing(text: str) -> str:
     """Re-insert spaces when PDF extraction merges words together.
 
@@ -49,19 +103,21 @@ def _fix_spacing(text: str) -> str:
         return text
 
     log.debug("Low space ratio (%.2f%%) — applying spacing fix", space_ratio * 100)
-    fixed = re.sub(r"([a-z])([A-Z])", r"\1 \2", text)
-    fixed = re.sub(r"([a-zA-Z])(\d)", r"\1 \2", fixed)
-    fixed = re.sub(r"(\d)([a-zA-Z])", r"\1 \2", fixed)
-    fixed = re.sub(r"([.!?,;:])([A-Za-z])", r"\1 \2", fixed)
-    fixed = re.sub(r"([a-z])(—|–|-\s)([A-Za-z])", r"\1 \2 \3", fixed)
+    fixed = _FIX_LC_UC.sub(r"\1 \2", text)
+    fixed = _FIX_ALNUM.sub(" ", fixed)
+    fixed = _FIX_PUNCT.sub(r"\1 \2", fixed)
+    fixed = _FIX_DASH.sub(r"\1 \2 \3", fixed)
     return fixed
 
 
 def _extract_pdf(path: Path) -> str:
-    # Prefer pdftotext (better spacing) over pypdf
+    # Prefer pdftotext (better spacing) over pypdf. Its default reading-order
+    # mode is much cheaper than -layout, which rebuilds the page as a
+    # character grid that neither the LLM nor the line heuristics need;
+    # -nopgbrk drops the form feeds between pages.
     if shutil.which("pdftotext"):
         result = subprocess.run(
-            ["pdftotext", "-layout", str(path), "-"],
+            ["pdftotext", "-nopgbrk", str(path), "-"],
             capture_output=True,
             text=True,
             timeout=30,
@@ -88,16 +144,28 @@ def _extract_pdf(path: Path) -> str:
 
 
 def _extract_docx(path: Path) -> str:
-    """Parse DOCX using only stdlib (zipfile + xml)."""
+    """Parse DOCX using only stdlib (zipfile + xml).
+
+    Streams document.xml with iterparse, collecting ``<w:t>`` runs until
+    their ``<w:p>`` closes and clearing elements as they end, so memory
+    stays at about one paragraph rather than the whole tree.
+    """
     ns = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+    tag_t, tag_p = f"{ns}t", f"{ns}p"
     texts: list[str] = []
+    parts: list[str] = []
     with zipfile.ZipFile(path) as zf:
         with zf.open("word/document.xml") as f:
-            tree = ElementTree.parse(f)
-            for para in tree.iter(f"{ns}p"):
-                parts = [node.text for node in para.iter(f"{ns}t") if node.text]
-                if parts:
-                    texts.append("".join(parts))
+            for _, el in ElementTree.iterparse(f, events=("end",)):
+                tag = el.tag
+                if tag == tag_t:
+                    if el.text:
+                        parts.append(el.text)
+                elif tag == tag_p:
+                    if parts:
+                        texts.append("".join(parts))
+                        parts.clear()
+                el.clear()
     return "\n".join(texts)
 
 
@@ -137,26 +205,6 @@ Resume text:
 """
 
 
-@retry(max_attempts=2, base_delay=2.0, retryable=(Exception,))
-def _llm_parse(resume_text: str, api_key: str, model: str) -> dict[str, Any]:
-    from openai import OpenAI
-
-    client = OpenAI(api_key=api_key, base_url="https://api.groq.com/openai/v1")
-    prompt = _PARSE_PROMPT.format(resume_text=resume_text[:6000])
-    resp = client.chat.completions.create(
-        model=model,
-        messages=[{"role": "user", "content": prompt}],
-        max_tokens=800,
-        temperature=0.1,
-    )
-    raw = (resp.choices[0].message.content or "").strip()
-    start = raw.find("{")
-    end = raw.rfind("}") + 1
-    if start == -1 or end == 0:
-        raise ValueError("LLM did not return valid JSON")
-    return json.loads(raw[start:end])
-
-
 # ── Heuristic fallback ──────────────────────────────────────────────────
 
 _SECTION_RE = re.compile(
@@ -189,16 +237,92 @@ _INDIAN_CITIES = [
     "jaipur", "lucknow", "chandigarh", "kochi", "indore", "remote",
 ]
 
+_TITLE_KEYWORDS = (
+    "engineer", "manager", "developer", "analyst", "designer", "consultant",
+    "lead", "director", "specialist", "coordinator", "executive",
+    "architect", "scientist", "officer",
+)
+
+
+def _alternation(words) -> re.Pattern[str]:
+    """Whole-word, case-insensitive match for any of *words* (longest first)."""
+    alts = "|".join(re.escape(w) for w in sorted(words, key=len, reverse=True))
+    return re.compile(rf"(?<!\w)(?:{alts})(?!\w)", re.IGNORECASE)
+
+
+_SKILLS_RE = _alternation(_COMMON_SKILLS)
+_CITIES_RE = _alternation(_INDIAN_CITIES)
+_TITLE_KW_RE = re.compile("|".join(_TITLE_KEYWORDS), re.IGNORECASE)
+
+
+def _found_in(pattern: re.Pattern[str], text: str, vocab: list[str]) -> list[str]:
+    """Entries of *vocab* that *pattern* finds in *text*, in vocabulary order."""
+    hits = {m.group(0).lower() for m in pattern.finditer(text)}
+    return [w for w in vocab if w in hits]
+
+
+def _build_automaton():
+    ac = ahocorasick.Automaton()
+    for kind, words in (("skill", _COMMON_SKILLS), ("city", _INDIAN_CITIES)):
+        for word in words:
+            ac.add_word(word, (kind, word))
+    ac.make_automaton()
+    return ac
+
+
+# Skills and cities in one Aho-Corasick pass when pyahocorasick is available.
+_VOCAB_AC = _build_automaton() if ahocorasick is not None else None
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _skills_and_cities(text: str) -> tuple[list[str], list[str]]:
+    """Whole-word skill and city hits in *text*, each in vocabulary order."""
+    if _VOCAB_AC is None:
+        return _found_in(_SKILLS_RE, text, _COMMON_SKILLS), _found_in(_CITIES_RE, text, _INDIAN_CITIES)
+
+    low = text.lower()
+    n = len(low)
+    found: dict[str, set[str]] = {"skill": set(), "city": set()}
+    for end, (kind, word) in _VOCAB_AC.iter(low):
+        start = end - len(word) + 1
+        if (start > 0 and _is_word_char(low[start - 1])) or (end + 1 < n and _is_word_char(low[end + 1])):
+            continue
+        found[kind].add(word)
+    return (
+        [w for w in _COMMON_SKILLS if w in found["skill"]],
+        [w for w in _INDIAN_CITIES if w in found["city"]],
+    )
+
+
+def _title_candidates(block: list[str]) -> list[str]:
+    """Stripped lines of *block* short enough to be a title and not contact info."""
+    return [
+        stripped for stripped in map(str.strip, block)
+        if 3 < len(stripped) < 80 and not _EMAIL_RE.search(stripped) and not _PHONE_RE.search(stripped)
+    ]
+
 
 def _heuristic_parse(text: str) -> dict[str, Any]:
-    """Best-effort extraction without an LLM."""
-    lines = text.strip().splitlines()
+    """Best-effort extraction without an LLM.
+
+    Name, title and contact details are looked for in the header — the
+    text before the first section heading. Contact details fall back to
+    the whole resume, and the title to its first ~20 lines when the
+    header is just the name.
+    """
+    text = text.strip()
+    section = _SECTION_RE.search(text)
+    head = text[:section.start()] if section else text
+    lines = text.splitlines()
     name = lines[0].strip() if lines else ""
     if len(name) > 60 or not name:
         name = ""
 
-    email_match = _EMAIL_RE.search(text)
-    phone_match = _PHONE_RE.search(text)
+    email_match = _EMAIL_RE.search(head) or _EMAIL_RE.search(text)
+    phone_match = _PHONE_RE.search(head) or _PHONE_RE.search(text)
 
     years = 0
     for m in _YEARS_RE.finditer(text):
@@ -206,14 +330,8 @@ def _heuristic_parse(text: str) -> dict[str, Any]:
         if y > years:
             years = y
 
-    low = text.lower()
-    skills = [s for s in _COMMON_SKILLS if s in low]
-
-    locations: list[str] = []
-    for city in _INDIAN_CITIES:
-        if city in low:
-            locations.append(city.capitalize())
-    locations = list(dict.fromkeys(locations))
+    skills, cities = _skills_and_cities(text)
+    locations = [city.capitalize() for city in cities]
 
     level = "junior"
     if years >= 7:
@@ -221,16 +339,10 @@ def _heuristic_parse(text: str) -> dict[str, Any]:
     elif years >= 3:
         level = "intermediate"
 
-    title = ""
-    for line in lines[1:20]:
-        stripped = line.strip()
-        if 3 < len(stripped) < 80 and not _EMAIL_RE.search(stripped) and not _PHONE_RE.search(stripped):
-            if any(kw in stripped.lower() for kw in ["engineer", "manager", "developer", "analyst",
-                                                      "designer", "consultant", "lead", "director",
-                                                      "specialist", "coordinator", "executive",
-                                                      "architect", "scientist", "officer"]):
-                title = stripped
-                break
+    # A heading right after the name ("Jane Doe\nSUMMARY\n...") leaves no
+    # header to search; look in the opening lines of the body instead.
+    candidates = _title_candidates(head.splitlines()[1:]) or _title_candidates(lines[1:20])
+    title = next((c for c in candidates if _TITLE_KW_RE.search(c)), "")
 
     return {
         "name": name,
@@ -250,13 +362,17 @@ def _heuristic_parse(text: str) -> dict[str, Any]:
 # ── Public API ───────────────────────────────────────────────────────────
 
 
-def parse_resume(path: Path, api_key: str | None = None) -> dict[str, Any]:
+def parse_resume(
+    path: Path, api_key: str | None = None, *, client: Any = None,
+) -> dict[str, Any]:
     """Extract structured profile data from a resume file.
 
     Uses Groq LLM if *api_key* is provided, otherwise heuristic fallback.
+    Pass a shared OpenAI-compatible *client* to reuse its connection pool.
     """
     log.info("Extracting text from %s", path.name)
-    text = extract_text(path)
+    digest = _file_digest(path)
+    text = _cached_text(path, digest)
     if not text.strip():
         raise ValueError(f"Could not extract any text from {path.name}")
 
@@ -264,10 +380,13 @@ def parse_resume(path: Path, api_key: str | None = None) -> dict[str, Any]:
     model = os.environ.get("GROQ_LLM_MODEL", "llama-3.3-70b-versatile").strip()
 
     if api_key:
-        log.info("Parsing resume with LLM (%s)", model)
+        cached = llm_cache.get(_llm_keys(model, digest)[0])
+        if cached is not None:
+            log.info("Resume unchanged — reusing cached LLM extraction")
+            return json.loads(cached)
+        log.info("Parsing and reviewing resume with LLM (%s)", model)
         try:
-            data = _llm_parse(text, api_key, model)
-            data.setdefault("role_reasons", {})
+            data, _ = _parse_and_review(text, digest, api_key, model, client)
             log.info("LLM extraction complete — name=%s, skills=%d", data.get("name"), len(data.get("skills", [])))
             return data
         except Exception as exc:
@@ -322,33 +441,130 @@ Resume text:
 """
 
 
+_COMBINED_PROMPT = """\
+You are a resume parser and senior career coach. Read the resume below once
+and do two jobs with it. Return ONLY a JSON object with exactly two keys:
+
+{{{{
+  "parsed": {{{{ ...structured profile, schema A... }}}},
+  "review": [ ...improvement suggestions, schema B... ]
+}}}}
+
+Schema A — "parsed" (use empty string or empty list if unknown):
+
+{parse_schema}
+
+Schema B — "review" is an array of objects (aim for 10-15), each with:
+{review_schema}
+
+Resume text:
+{{resume_text}}
+"""
+
+
+def _prompt_body(prompt: str, marker: str) -> str:
+    """*prompt* between *marker* and its trailing ``Resume text:`` block."""
+    return prompt[prompt.index(marker) + len(marker):prompt.rindex("Resume text:")].strip("\n")
+
+
+_PARSE_AND_REVIEW_PROMPT = _COMBINED_PROMPT.format(
+    parse_schema=_prompt_body(_PARSE_PROMPT, "(use empty string or empty list if unknown):"),
+    review_schema=_prompt_body(_REVIEW_PROMPT, "(aim for 10-15), each with:"),
+)
+
+
+# Resume budget in the prompt: ~2400 tokens, or ~8000 chars without tiktoken.
+_PROMPT_TOKENS = 2400
+_PROMPT_CHARS = 8000
+_HSPACE_RE = re.compile(r"[ \t\u00a0]+")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+
+
+@functools.lru_cache(maxsize=1)
+def _encoding():
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def _prompt_text(text: str) -> str:
+    """*text* with runs of whitespace collapsed, cut to the prompt budget.
+
+    Columned PDFs spend many tokens on padding; collapsing it first lets
+    more of the resume fit. Cuts on a token boundary when tiktoken is
+    installed.
+    """
+    text = _BLANK_LINES_RE.sub("\n", _HSPACE_RE.sub(" ", text)).strip()
+    if tiktoken is not None:
+        try:
+            enc = _encoding()
+        except Exception as exc:  # the BPE file is fetched on first use
+            log.debug("tiktoken unavailable (%s), truncating by characters", exc)
+        else:
+            tokens = enc.encode(text)
+            return text if len(tokens) <= _PROMPT_TOKENS else enc.decode(tokens[:_PROMPT_TOKENS])
+    return text[:_PROMPT_CHARS]
+
+
 @retry(max_attempts=2, base_delay=2.0, retryable=(Exception,))
-def _llm_review(resume_text: str, api_key: str, model: str) -> list[dict[str, str]]:
-    from openai import OpenAI
+def _llm_parse_and_review(
+    resume_text: str, api_key: str, model: str, client: Any = None,
+) -> tuple[dict[str, Any], list[dict[str, str]]]:
+    """One structured-output call returning ``(parsed, review)``.
 
-    client = OpenAI(api_key=api_key, base_url="https://api.groq.com/openai/v1")
-    prompt = _REVIEW_PROMPT.format(resume_text=resume_text[:8000])
+    Parsing and review read the same resume text, so one request amortizes
+    the prompt and the round-trip over both.
+    """
+    if client is None:
+        from src.groq_client import get_client
+
+        client = get_client(api_key)
+    prompt = _PARSE_AND_REVIEW_PROMPT.format(resume_text=_prompt_text(resume_text))
     resp = client.chat.completions.create(
         model=model,
         messages=[{"role": "user", "content": prompt}],
-        max_tokens=4000,
-        temperature=0.3,
+        response_format={"type": "json_object"},
+        max_tokens=4800,
+        temperature=0.2,
+    )
+    data = json.loads(resp.choices[0].message.content or "")
+    parsed, review = data.get("parsed"), data.get("review")
+    if not isinstance(parsed, dict) or not isinstance(review, list):
+        raise ValueError("LLM response is missing 'parsed' or 'review'")
+    parsed.setdefault("role_reasons", {})
+    return parsed, review
+
+
+def _llm_keys(model: str, digest: str) -> tuple[str, str]:
+    return (
+        llm_cache.make_key(_PARSE_AND_REVIEW_PROMPT, "parsed", model, digest),
+        llm_cache.make_key(_PARSE_AND_REVIEW_PROMPT, "review", model, digest),
     )
-    raw = (resp.choices[0].message.content or "").strip()
-    start = raw.find("[")
-    end = raw.rfind("]") + 1
-    if start == -1 or end == 0:
-        raise ValueError("LLM did not return a valid JSON array")
-    return json.loads(raw[start:end])
 
 
-def review_resume(path: Path, api_key: str | None = None) -> list[dict[str, str]]:
+def _parse_and_review(
+    text: str, digest: str, api_key: str, model: str, client: Any,
+) -> tuple[dict[str, Any], list[dict[str, str]]]:
+    """Run the combined LLM call and cache both halves.
+
+    Whichever of :func:`parse_resume` / :func:`review_resume` runs second
+    finds its result already in the LLM cache.
+    """
+    parsed, review = _llm_parse_and_review(text, api_key, model, client)
+    parse_key, review_key = _llm_keys(model, digest)
+    llm_cache.put(parse_key, json.dumps(parsed), prompt_version="resume-parse", model=model)
+    llm_cache.put(review_key, json.dumps(review), prompt_version="resume-review", model=model)
+    return parsed, review
+
+
+def review_resume(
+    path: Path, api_key: str | None = None, *, client: Any = None,
+) -> list[dict[str, str]]:
     """Return 10-15 improvement suggestions covering the entire resume.
 
     Each item has keys: category, original, replacement, reason.
-    Requires a Groq API key.
+    Requires a Groq API key; *client* works as in :func:`parse_resume`.
     """
-    text = extract_text(path)
+    digest = _file_digest(path)
+    text = _cached_text(path, digest)
     if not text.strip():
         raise ValueError(f"Could not extract text from {path.name}")
 
@@ -357,7 +573,11 @@ def review_resume(path: Path, api_key: str | None = None) -> list[dict[str, str]
         raise ValueError("Groq API key required for resume review")
 
     model = os.environ.get("GROQ_LLM_MODEL", "llama-3.3-70b-versatile").strip()
-    log.info("Reviewing resume with LLM (%s)", model)
-    suggestions = _llm_review(text, api_key, model)
+    cached = llm_cache.get(_llm_keys(model, digest)[1])
+    if cached is not None:
+        log.info("Resume unchanged — reusing cached review")
+        return json.loads(cached)
+    log.info("Parsing and reviewing resume with LLM (%s)", model)
+    _, suggestions = _parse_and_review(text, digest, api_key, model, client)
     log.info("Resume review complete — %d suggestions", len(suggestions))
     return suggestions
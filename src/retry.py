@@ -22,6 +22,12 @@ def retry(
     """Decorator: retries the wrapped function with exponential backoff."""
 
     def decorator(fn: Callable) -> Callable:
+        # Backoff before retry n (1-based) is delays[n - 1], before jitter.
+        delays = tuple(
+            min(base_delay * backoff_factor**i, max_delay)
+            for i in range(max_attempts - 1)
+        )
+
         @functools.wraps(fn)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             last_exc: BaseException | None = None
@@ -38,19 +44,18 @@ def retry(
                             exc,
                         )
                         raise
-                    delay = min(
-                        base_delay * (backoff_factor ** (attempt - 1)), max_delay
-                    )
+                    delay = delays[attempt - 1]
                     if jitter:
                         delay *= 0.5 + random.random()
-                    logger.warning(
-                        "%s attempt %d/%d failed (%s), retrying in %.1fs",
-                        fn.__qualname__,
-                        attempt,
-                        max_attempts,
-                        exc,
-                        delay,
-                    )
+                    if logger.isEnabledFor(logging.WARNING):
+                        logger.warning(
+                            "%s attempt %d/%d failed (%s), retrying in %.1fs",
+                            fn.__qualname__,
+                            attempt,
+                            max_attempts,
+                            exc,
+                            delay,
+                        )
                     time.sleep(delay)
             raise last_exc  # type: ignore[misc]
 
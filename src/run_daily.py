@@ -9,8 +9,9 @@ Usage:
 from __future__ import annotations
 
 import os
+import signal
 import sys
-import time
+import threading
 from datetime import datetime, timedelta
 
 _script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -46,6 +47,7 @@ def run_once_and_email() -> dict:
         top_letters=10,
         write_report=True,
         auto_apply=True,
+        batch_mode=os.environ.get("GROQ_BATCH_MODE", "").lower() in ("1", "true", "yes"),
     )
     body = result.get("report_preview", "") or ""
     body += f"\n\n---\nSummary: Jobs found: {result.get('jobs_found', 0)} | Scored (\u226575%): {result.get('scored_count', 0)} | Applied via browser: {result.get('browser_applied', 0)}"
@@ -69,26 +71,45 @@ def next_run_ist() -> datetime:
     return target
 
 
+# Longest single wait; the remaining time is re-derived from the wall clock
+# after each one, so clock corrections (NTP, suspend) are picked up.
+_MAX_WAIT_SECS = 3600
+# A run that would start later than this after its slot (e.g. the machine
+# was asleep) is skipped rather than fired late.
+_LATE_GRACE = timedelta(minutes=30)
+
+
 def main() -> None:
+    stop = threading.Event()
+    for sig in (signal.SIGTERM, getattr(signal, "SIGHUP", None)):
+        if sig is not None:
+            signal.signal(sig, lambda *_: stop.set())
+
     log.info("Scheduler: run daily at %d:%02d IST", TARGET_HOUR_IST, TARGET_MINUTE)
-    while True:
+    while not stop.is_set():
         if IST is None:
-            time.sleep(86400)
+            if stop.wait(86400):
+                break
             log.info("Running agent...")
             run_once_and_email()
             continue
         target = next_run_ist()
-        now = datetime.now(IST)
-        wait_secs = (target - now).total_seconds()
-        if wait_secs < 0:
-            wait_secs = 86400 + wait_secs
-        log.info("Next run at %s IST (in %.1f hours)", target, wait_secs / 3600)
-        time.sleep(min(wait_secs, 86400))
-        now = datetime.now(IST)
-        if now.hour == TARGET_HOUR_IST and now.minute < 30:
-            log.info("Running agent...")
-            run_once_and_email()
-            log.info("Done. Next run tomorrow.")
+        log.info(
+            "Next run at %s IST (in %.1f hours)",
+            target, (target - datetime.now(IST)).total_seconds() / 3600,
+        )
+        while (remaining := (target - datetime.now(IST)).total_seconds()) > 0:
+            if stop.wait(min(remaining, _MAX_WAIT_SECS)):
+                break
+        if stop.is_set():
+            break
+        if datetime.now(IST) - target > _LATE_GRACE:
+            log.warning("Missed the %s IST slot; waiting for the next one", target)
+            continue
+        log.info("Running agent...")
+        run_once_and_email()
+        log.info("Done. Next run tomorrow.")
+    log.info("Scheduler stopped.")
 
 
 if __name__ == "__main__":
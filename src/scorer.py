@@ -1,7 +1,19 @@
 """Score and filter jobs against profile with role-aware matching."""
 from __future__ import annotations
 
+import functools
+import hashlib
+import heapq
+import itertools
 import re
+from operator import attrgetter
+from dataclasses import dataclass
+from typing import Any
+
+try:
+    import ahocorasick  # optional: pyahocorasick
+except ImportError:  # per-pattern substring scans are used instead
+    ahocorasick = None
 
 from src.log import get_logger
 from src.models import Job, ScoredJob
@@ -13,34 +25,37 @@ def _normalize(s: str) -> str:
     return (s or "").lower().strip()
 
 
-LOCATION_ALIASES: dict[str, list[str]] = {
-    "bangalore": ["bangalore", "bengaluru", "bengalore"],
-    "gurgaon": ["gurgaon", "gurugram"],
-    "noida": ["noida"],
-    "hyderabad": ["hyderabad"],
-    "pune": ["pune"],
-    "remote": ["remote", "anywhere", "work from home", "wfh"],
+LOCATION_ALIASES: dict[str, tuple[str, ...]] = {
+    "bangalore": ("bangalore", "bengaluru", "bengalore"),
+    "gurgaon": ("gurgaon", "gurugram"),
+    "noida": ("noida",),
+    "hyderabad": ("hyderabad",),
+    "pune": ("pune",),
+    "remote": ("remote", "anywhere", "work from home", "wfh"),
 }
 
-FRESHER_PHRASES: list[str] = [
+FRESHER_PHRASES: tuple[str, ...] = (
     "fresher", "0-2 years", "0-1 years", "0 - 2", "0 - 1",
     "entry level", "entry-level", "no experience", "fresh graduate",
     "recent graduate", "freshers only", "0 years",
-]
+)
 
 # Titles that signal a level well above "senior" individual contributor
-OVER_LEVEL_TITLES: list[str] = [
+OVER_LEVEL_TITLES: tuple[str, ...] = (
     "director", "vice president", "vp ", "vp,", "chief ",
     "head of", "cto", "cfo", "coo", "ceo", "managing director",
     "general manager", "avp", "assistant vice president",
-]
+)
 
 # Minimum token length when expanding compound skills to avoid
 # tiny tokens like "ai", "api" that match everything.
 _MIN_SKILL_TOKEN_LEN = 4
 
+_SKILL_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[\s-][a-z0-9]+)*")
+
 
-def _expand_locations(locations: list[str]) -> list[str]:
+@functools.lru_cache(maxsize=32)
+def _expand_locations(locations: tuple[str, ...]) -> tuple[str, ...]:
     expanded: list[str] = []
     for loc in locations:
         key = loc.lower().strip()
@@ -48,49 +63,61 @@ def _expand_locations(locations: list[str]) -> list[str]:
             expanded.extend(LOCATION_ALIASES[key])
         else:
             expanded.append(key)
-    return expanded
+    return tuple(expanded)
+
 
+@functools.lru_cache(maxsize=32)
+def _expand_skills(raw_skills: tuple[str, ...]) -> tuple[str, ...]:
+    """Break compound skills into matchable tokens, filtering short noise.
 
-def _expand_skills(raw_skills: list[str]) -> list[str]:
-    """Break compound skills into matchable tokens, filtering short noise."""
+    Memoized on the raw skill list, which is the same for every batch
+    scored against one profile.
+    """
+    seen: set[str] = set()
     tokens: list[str] = []
     for s in raw_skills:
         low = s.lower()
-        tokens.append(low)
-        inner = re.findall(r"[a-z0-9]+(?:[\s-][a-z0-9]+)*", low)
-        for part in inner:
+        if low not in seen:
+            seen.add(low)
+            tokens.append(low)
+        for part in _SKILL_TOKEN_RE.findall(low):
             part = part.strip()
-            if part and part != low and len(part) >= _MIN_SKILL_TOKEN_LEN:
+            if part and part != low and len(part) >= _MIN_SKILL_TOKEN_LEN and part not in seen:
+                seen.add(part)
                 tokens.append(part)
-    return list(dict.fromkeys(tokens))
+    return tuple(tokens)
 
 
-def _is_fresher_only(desc: str, title: str) -> bool:
-    text = _normalize(desc) + " " + _normalize(title)
-    for phrase in FRESHER_PHRASES:
-        if phrase in text:
-            if any(x in text for x in ["senior", "experience", "8+", "10+", "years exp", "l3", "l4"]):
-                continue
-            return True
-    return False
+def _substring_re(phrases) -> re.Pattern[str]:
+    """Plain-substring match for any of *phrases* in a single regex sweep."""
+    return re.compile("|".join(re.escape(p) for p in phrases))
+
+
+_FRESHER_RE = _substring_re(FRESHER_PHRASES)
+# Any of these alongside a fresher phrase means the post isn't fresher-only.
+_FRESHER_NEG_RE = _substring_re(("senior", "experience", "8+", "10+", "years exp", "l3", "l4"))
+_OVER_LEVEL_RE = _substring_re(OVER_LEVEL_TITLES)
+_CAPPED_LEVELS = frozenset({"junior", "intermediate", "senior"})
+
 
+def _is_fresher_only(text: str) -> bool:
+    """*text* is the normalized description and title, space-joined."""
+    return _FRESHER_RE.search(text) is not None and _FRESHER_NEG_RE.search(text) is None
 
-def _is_over_level(title: str, profile_level: str) -> bool:
+
+def _is_over_level(title_norm: str, profile_level: str) -> bool:
     """Return True if the job title implies a level clearly above the profile."""
-    if profile_level not in ("junior", "intermediate", "senior"):
+    if profile_level not in _CAPPED_LEVELS:
         return False
-    t = _normalize(title)
-    return any(tag in t for tag in OVER_LEVEL_TITLES)
+    return _OVER_LEVEL_RE.search(title_norm) is not None
 
 
-def _word_overlap_ratio(role: str, text: str) -> float:
-    """Fraction of words in *role* that appear in *text*.
+def _word_overlap_ratio(role_words: frozenset[str], text_words: set[str]) -> float:
+    """Fraction of *role_words* that appear in *text_words*.
 
     Requires at least 2 overlapping words to be non-zero, preventing
     single-word false positives like "product" matching everything.
     """
-    role_words = set(role.lower().split())
-    text_words = set(text.lower().split())
     overlap = role_words & text_words
     if len(overlap) < 2 and len(role_words) > 1:
         return 0.0
@@ -99,14 +126,47 @@ def _word_overlap_ratio(role: str, text: str) -> float:
     return len(overlap) / len(role_words)
 
 
+def _role_regex(roles: list[str]) -> re.Pattern[str] | None:
+    """Lookahead alternation with one group per role, in priority order.
+
+    At each position the alternation picks the first listed role starting
+    there, so the smallest ``lastindex`` over all matches is the first
+    listed role occurring anywhere in the text, even when roles overlap.
+    """
+    if not roles:
+        return None
+    return re.compile("(?=(?:" + "|".join(f"({re.escape(r)})" for r in roles) + "))")
+
+
+def _first_role(role_re: re.Pattern[str] | None, text: str) -> int:
+    """Index of the first listed role found in *text*, or -1."""
+    if role_re is None:
+        return -1
+    best = -1
+    for m in role_re.finditer(text):
+        k = m.lastindex - 1
+        if best < 0 or k < best:
+            best = k
+            if best == 0:
+                break
+    return best
+
+
+def _first_overlap(role_words: tuple[frozenset[str], ...], title_words: set[str]) -> int:
+    for k, words in enumerate(role_words):
+        if _word_overlap_ratio(words, title_words) >= 0.6:
+            return k
+    return -1
+
+
 def _best_role_match(
-    title: str,
-    desc: str,
-    core_roles: list[str],
-    stretch_roles: list[str],
+    title_norm: str, desc_norm: str, prepared: PreparedProfile,
 ) -> tuple[float, str, str]:
     """Find the best matching role and return (score_contribution, role, tier).
 
+    *title_norm* and *desc_norm* are already normalized. Ties within a
+    tier go to the role listed first.
+
     Scoring hierarchy:
       - Core role in job TITLE (exact substring)         → 0.40
       - Core role in title (word overlap >= 60%)          → 0.35
@@ -114,153 +174,383 @@ def _best_role_match(
       - Stretch role in title (word overlap >= 60%)       → 0.18
       - Core role in description only (exact substring)   → 0.15
       - Stretch role in description only                  → 0.08
+
+    Substring hits come from one regex sweep over the title (and over the
+    description only when the title decides nothing); word overlap is
+    checked only for roles that did not hit.
     """
-    title_norm = _normalize(title)
-    desc_norm = _normalize(desc)
-    best_score = 0.0
-    best_role = ""
-    best_tier = ""
-
-    for role_raw in core_roles:
-        role = role_raw.lower()
-        if role in title_norm:
-            if 0.40 > best_score:
-                best_score, best_role, best_tier = 0.40, role_raw, "core"
-            continue
-        overlap = _word_overlap_ratio(role, title_norm)
-        if overlap >= 0.6 and 0.35 > best_score:
-            best_score, best_role, best_tier = 0.35, role_raw, "core"
-            continue
-        if role in desc_norm and 0.15 > best_score:
-            best_score, best_role, best_tier = 0.15, role_raw, "core"
-
-    for role_raw in stretch_roles:
-        role = role_raw.lower()
-        if role in title_norm:
-            if 0.20 > best_score:
-                best_score, best_role, best_tier = 0.20, role_raw, "stretch"
-            continue
-        overlap = _word_overlap_ratio(role, title_norm)
-        if overlap >= 0.6 and 0.18 > best_score:
-            best_score, best_role, best_tier = 0.18, role_raw, "stretch"
-            continue
-        if role in desc_norm and 0.08 > best_score:
-            best_score, best_role, best_tier = 0.08, role_raw, "stretch"
+    core, stretch = prepared.core_roles, prepared.stretch_roles
+    n_core = len(core)
+
+    k = _first_role(prepared.role_re, title_norm)
+    if 0 <= k < n_core:
+        return 0.40, core[k][0], "core"
+    title_words = set(title_norm.split())
+    j = _first_overlap(prepared.core_role_words, title_words)
+    if j >= 0:
+        return 0.35, core[j][0], "core"
+    if k >= n_core:
+        return 0.20, stretch[k - n_core][0], "stretch"
+    j = _first_overlap(prepared.stretch_role_words, title_words)
+    if j >= 0:
+        return 0.18, stretch[j][0], "stretch"
+
+    k = _first_role(prepared.role_re, desc_norm)
+    if 0 <= k < n_core:
+        return 0.15, core[k][0], "core"
+    if k >= n_core:
+        return 0.08, stretch[k - n_core][0], "stretch"
+    return 0.0, "", ""
+
+
+SENIORITY_TERMS: tuple[str, ...] = (
+    "senior", "lead", "principal", "l3", "l4", "staff", "10+", "8+", "5+",
+    "experience", "mid-level", "mid level", "experienced",
+)
+
+_SALARY_MARKERS: tuple[str, ...] = ("lpa", "lakh", "salary", "ctc", "inr")
+
+
+@functools.lru_cache(maxsize=8)
+def _skill_covers(skills: tuple[str, ...]) -> tuple[int, ...]:
+    """Bit *j* of ``covers[k]`` is set when ``skills[j]`` is inside ``skills[k]``.
+
+    A hit on a compound token such as "python pandas" implies hits on
+    "python" and "pandas"; the covers let reasons and keywords list only
+    the compound.
+    """
+    return tuple(
+        sum(1 << j for j, part in enumerate(skills) if j != k and part in whole)
+        for k, whole in enumerate(skills)
+    )
 
-    return best_score, best_role, best_tier
 
+def _skill_mask(text: str, skills: tuple[str, ...]) -> int:
+    """Bitmask with bit *k* set when ``skills[k]`` occurs in *text*."""
+    mask = 0
+    for k, s in enumerate(skills):
+        if s in text:
+            mask |= 1 << k
+    return mask
 
-def score_job(job: Job, profile: dict) -> ScoredJob:
-    reasons: list[str] = []
-    keywords: list[str] = []
-    desc = _normalize(job.description)
-    title_norm = _normalize(job.title)
-    full_text = desc + " " + title_norm
-
-    skills = _expand_skills(profile.get("profile", {}).get("skills", []))
-    core_roles = [r for r in profile.get("core_roles", [])]
-    stretch_roles = [r for r in profile.get("stretch_roles", [])]
-    locations = _expand_locations(profile.get("locations", []))
-    salary_cfg = profile.get("salary_lpa", {})
-    compare_salary_only_when_listed = salary_cfg.get("compare_only_when_listed", True)
-    profile_level = profile.get("profile", {}).get("level", "senior")
-
-    # Hard filter: fresher-only jobs
-    if _is_fresher_only(job.description, job.title):
-        return ScoredJob(job=job, score=0.0, match_reasons=[], keyword_suggestions=[])
-
-    # Hard filter: over-level jobs (Director/VP/C-suite) for non-director candidates
-    if _is_over_level(job.title, profile_level):
-        return ScoredJob(
-            job=job, score=0.0,
-            match_reasons=["Filtered: seniority above profile level"],
-            keyword_suggestions=[],
+
+def _first_seniority_term(text: str) -> str:
+    for term in SENIORITY_TERMS:
+        if term in text:
+            return term
+    return ""
+
+
+def _salary_listed(text: str) -> bool:
+    return any(m in text for m in _SALARY_MARKERS)
+
+
+_NUM_RE = re.compile(r"\d+")
+
+
+def _salary_in_range(description: str, min_lpa: int, max_lpa: int) -> bool:
+    """True at the first number in *description* that falls in the range."""
+    for m in _NUM_RE.finditer(description):
+        if min_lpa <= int(m.group()) <= max_lpa:
+            return True
+    return False
+
+
+@functools.lru_cache(maxsize=8)
+def _build_text_automaton(skills: tuple[str, ...]):
+    """One automaton over skills, seniority terms and salary markers.
+
+    A pattern can belong to several categories (say, a skill that is also
+    a seniority term), so each word maps to a tuple of ``(category, index)``
+    tags.
+    """
+    tags: dict[str, list[tuple[str, int]]] = {}
+    for k, s in enumerate(skills):
+        if s:
+            tags.setdefault(s, []).append(("skill", k))
+    for rank, term in enumerate(SENIORITY_TERMS):
+        tags.setdefault(term, []).append(("seniority", rank))
+    for m in _SALARY_MARKERS:
+        tags.setdefault(m, []).append(("salary", 0))
+    ac = ahocorasick.Automaton()
+    for word, word_tags in tags.items():
+        ac.add_word(word, tuple(word_tags))
+    ac.make_automaton()
+    return ac
+
+
+def _scan_text(ac, text: str) -> tuple[int, str, bool]:
+    """(skill mask, first seniority term, salary listed) in one pass over *text*."""
+    mask = 0
+    rank = len(SENIORITY_TERMS)
+    salary = False
+    for _, word_tags in ac.iter(text):
+        for cat, k in word_tags:
+            if cat == "skill":
+                mask |= 1 << k
+            elif cat == "seniority":
+                if k < rank:
+                    rank = k
+            else:
+                salary = True
+    return mask, SENIORITY_TERMS[rank] if rank < len(SENIORITY_TERMS) else "", salary
+
+
+@dataclass(slots=True)
+class PreparedProfile:
+    """Everything the scorer needs from a profile, derived once per batch."""
+
+    skills: tuple[str, ...]
+    core_roles: tuple[tuple[str, str], ...]       # (raw, lowercased)
+    stretch_roles: tuple[tuple[str, str], ...]
+    core_role_words: tuple[frozenset[str], ...]
+    stretch_role_words: tuple[frozenset[str], ...]
+    role_re: re.Pattern[str] | None               # core roles, then stretch
+    locations: tuple[str, ...]
+    skill_covers: tuple[int, ...]                 # see _skill_covers
+    salary_min: int | None
+    salary_max: int | None
+    check_salary: bool
+    profile_level: str
+    automaton: Any = None  # skills + seniority + salary markers, if available
+
+    @classmethod
+    def from_profile(cls, profile: dict) -> PreparedProfile:
+        candidate = profile.get("profile", {})
+        salary_cfg = profile.get("salary_lpa", {})
+        min_lpa = salary_cfg.get("min")
+        max_lpa = salary_cfg.get("max")
+        skills = _expand_skills(tuple(candidate.get("skills", [])))
+        # Legacy flat profiles list only preferred_roles; score them as core,
+        # the same migration load_profile applies.
+        core_raw = profile.get("core_roles")
+        if core_raw is None:
+            core_raw = profile.get("preferred_roles", [])
+        core = tuple((r, r.lower()) for r in core_raw)
+        stretch = tuple((r, r.lower()) for r in profile.get("stretch_roles", []))
+        return cls(
+            skills=skills,
+            core_roles=core,
+            stretch_roles=stretch,
+            core_role_words=tuple(frozenset(low.split()) for _, low in core),
+            stretch_role_words=tuple(frozenset(low.split()) for _, low in stretch),
+            role_re=_role_regex([low for _, low in core + stretch]),
+            locations=_expand_locations(tuple(profile.get("locations", []))),
+            skill_covers=_skill_covers(skills),
+            salary_min=min_lpa,
+            salary_max=max_lpa,
+            check_salary=bool(
+                salary_cfg.get("compare_only_when_listed", True)
+                and min_lpa is not None and max_lpa is not None
+            ),
+            profile_level=candidate.get("level", "senior"),
+            automaton=_build_text_automaton(skills) if ahocorasick is not None else None,
         )
 
-    # --- Role match (graduated, title-first) ---
-    role_score, matched_role, role_tier = _best_role_match(
-        job.title, job.description, core_roles, stretch_roles,
-    )
-    if matched_role:
-        label = f"Role match ({role_tier}): {matched_role}"
-        reasons.append(label)
-
-    # --- Skills overlap ---
-    matched_skills = [s for s in skills if s in full_text]
-    unique_matched = list(dict.fromkeys(matched_skills))
-    for s in unique_matched[:5]:
-        reasons.append(f"Skill: {s}")
-    if len(unique_matched) >= 3:
-        reasons.append("Strong skill overlap")
-    keywords.extend(unique_matched)
-
-    # --- Seniority fit ---
-    has_seniority = False
-    for term in ["senior", "lead", "principal", "l3", "l4", "staff", "10+", "8+", "5+",
-                 "experience", "mid-level", "mid level", "experienced"]:
-        if term in full_text:
-            reasons.append("Seniority level fit")
-            has_seniority = True
-            if term not in keywords:
-                keywords.append(term)
-            break
-
-    # --- Location match ---
-    job_loc = _normalize(job.location)
-    has_location = any(alias in job_loc for alias in locations)
-    if has_location:
-        reasons.append("Location match")
-
-    # --- Salary match ---
-    has_salary = False
-    min_lpa = salary_cfg.get("min")
-    max_lpa = salary_cfg.get("max")
-    if compare_salary_only_when_listed and min_lpa is not None and max_lpa is not None:
-        salary_markers = ["lpa", "lakh", "salary", "ctc", "inr"]
-        if any(m in full_text for m in salary_markers):
-            for n in re.findall(r"\d+", job.description):
-                try:
-                    v = int(n)
-                    if min_lpa <= v <= max_lpa:
-                        reasons.append("Salary in range (listed)")
-                        has_salary = True
-                        break
-                except ValueError:
-                    pass
-
-    # --- Composite score ---
-    score = 0.0
-    score += role_score                                          # 0 – 0.40
-    score += min(0.05 * len(unique_matched), 0.25)               # 0 – 0.25
-    if has_seniority:
-        score += 0.10                                            # 0.10
-    if has_location:
-        score += 0.15                                            # 0.15
-    if has_salary:
-        score += 0.10                                            # 0.10
 
+def _composite(
+    role_score: float,
+    n_skills: int,
+    has_seniority: bool,
+    has_location: bool,
+    has_salary: bool,
+    is_core: bool,
+    has_roles: bool,
+) -> float:
+    """Combine one job's signals into its 0–1 match score."""
+    score = (
+        role_score                                           # 0 – 0.40
+        + min(0.05 * n_skills, 0.25)                         # 0 – 0.25
+        + (0.10 if has_seniority else 0.0)
+        + (0.15 if has_location else 0.0)
+        + (0.10 if has_salary else 0.0)
+    )
     # Bonus for strong skill match alongside a core role
-    if len(unique_matched) >= 3 and role_tier == "core":
+    if n_skills >= 3 and is_core:
         score += 0.05
-
     score = min(score, 1.0)
-
     # Fallback floor: if no structured score but there are some signals
-    if not score and (unique_matched or core_roles or stretch_roles):
+    if not score and (n_skills or has_roles):
         score = 0.10
+    return score
 
-    return ScoredJob(
-        job=job,
-        score=round(score, 2),
-        match_reasons=reasons,
-        keyword_suggestions=list(dict.fromkeys(keywords))[:10],
+
+def _score_batch(
+    jobs: list[Job], prepared: PreparedProfile, min_score: float | None = None,
+) -> list[ScoredJob]:
+    """Score *jobs* column by column.
+
+    Profile-derived inputs come from *prepared*, built once per batch
+    rather than once per job. Each signal is then computed as a parallel
+    list over the jobs that survive the hard filters, with skill hits
+    stored as one int bitmask per job so the match count is a popcount.
+    With pyahocorasick installed the skill, seniority and salary-marker
+    columns come from a single Aho-Corasick pass over each job's text.
+
+    Scores are computed for every job first. Reasons and keywords are only
+    assembled for jobs scoring at least *min_score*, when given; jobs whose
+    role and location already rule that out skip the text scans and score
+    0.
+    """
+    skills = prepared.skills
+    min_lpa, max_lpa = prepared.salary_min, prepared.salary_max
+    check_salary = prepared.check_salary
+    locations = prepared.locations
+    has_roles = bool(prepared.core_roles or prepared.stretch_roles)
+
+    # Each field is normalized once; every check below reads these.
+    all_titles = [_normalize(j.title) for j in jobs]
+    all_descs = [_normalize(j.description) for j in jobs]
+    all_texts = [d + " " + t for d, t in zip(all_descs, all_titles)]
+
+    results: list[ScoredJob | None] = [None] * len(jobs)
+    live: list[int] = []
+    for i, job in enumerate(jobs):
+        # Hard filters: fresher-only jobs, and over-level titles
+        # (Director/VP/C-suite) for non-director candidates.
+        if _is_fresher_only(all_texts[i]):
+            results[i] = ScoredJob(job=job, score=0.0, match_reasons=[], keyword_suggestions=[])
+        elif _is_over_level(all_titles[i], prepared.profile_level):
+            results[i] = ScoredJob(
+                job=job, score=0.0,
+                match_reasons=["Filtered: seniority above profile level"],
+                keyword_suggestions=[],
+            )
+        else:
+            live.append(i)
+
+    # Cheap columns first: location, then role.
+    located = [any(a in _normalize(jobs[i].location) for a in locations) for i in live]
+    roles = [_best_role_match(all_titles[i], all_descs[i], prepared) for i in live]
+
+    if min_score is not None:
+        # Skip the text scans for jobs that can't reach min_score even with
+        # full skill, seniority and salary credit.
+        ceiling = 0.25 + 0.10 + (0.10 if check_salary else 0.0)
+        keep: list[int] = []
+        for n, (i, (role_score, _, role_tier), has_location) in enumerate(zip(live, roles, located)):
+            bound = max(
+                role_score + ceiling + (0.15 if has_location else 0.0) + (0.05 if role_tier == "core" else 0.0),
+                0.10,
+            )
+            if bound + 0.005 >= min_score:  # slack for rounding to 2 places
+                keep.append(n)
+            else:
+                results[i] = ScoredJob(job=jobs[i], score=0.0, match_reasons=[], keyword_suggestions=[])
+        if len(keep) < len(live):
+            live = [live[n] for n in keep]
+            roles = [roles[n] for n in keep]
+            located = [located[n] for n in keep]
+
+    texts = [all_texts[i] for i in live]
+    ac = prepared.automaton
+    if ac is not None and texts:
+        # Skills, seniority terms and salary markers in one pass per job.
+        empty = _skill_mask("", skills)  # "" is a substring of everything
+        scans = [_scan_text(ac, t) for t in texts]
+        masks = [m | empty for m, _, _ in scans]
+        seniority = [term for _, term, _ in scans]
+        listed = [sal for _, _, sal in scans]
+    else:
+        masks = [_skill_mask(t, skills) for t in texts]
+        seniority = [_first_seniority_term(t) for t in texts]
+        listed = [_salary_listed(t) for t in texts] if check_salary else []
+    salaried = (
+        [ok and _salary_in_range(jobs[i].description, min_lpa, max_lpa) for i, ok in zip(live, listed)]
+        if check_salary else [False] * len(live)
     )
 
+    n_matched = [m.bit_count() for m in masks]
+    scores = [
+        round(_composite(r[0], n, bool(term), loc, sal, r[2] == "core", has_roles), 2)
+        for r, n, term, loc, sal in zip(roles, n_matched, seniority, located, salaried)
+    ]
+
+    for i, score, (_, matched_role, role_tier), mask, n_skills, term, has_location, has_salary in zip(
+        live, scores, roles, masks, n_matched, seniority, located, salaried,
+    ):
+        if min_score is not None and score < min_score:
+            # Dropped by the caller; skip assembling reasons and keywords.
+            results[i] = ScoredJob(job=jobs[i], score=score, match_reasons=[], keyword_suggestions=[])
+            continue
+
+        # Report a compound skill rather than the parts it contains; the
+        # score above still counts every hit. Only the first 10 keywords
+        # are kept, so stop collecting there.
+        implied = 0
+        for k, cover in enumerate(prepared.skill_covers):
+            if mask >> k & 1:
+                implied |= cover
+        shown = mask & ~implied
+        matched = list(itertools.islice((s for k, s in enumerate(skills) if shown >> k & 1), 10))
+        reasons: list[str] = []
+        if matched_role:
+            reasons.append(f"Role match ({role_tier}): {matched_role}")
+        reasons.extend(f"Skill: {s}" for s in matched[:5])
+        if n_skills >= 3:
+            reasons.append("Strong skill overlap")
+        keywords = matched
+        if term:
+            reasons.append("Seniority level fit")
+            if term not in keywords:
+                keywords.append(term)
+        if has_location:
+            reasons.append("Location match")
+        if has_salary:
+            reasons.append("Salary in range (listed)")
+
+        results[i] = ScoredJob(
+            job=jobs[i],
+            score=score,
+            match_reasons=reasons,
+            keyword_suggestions=keywords[:10],
+        )
+    return results  # type: ignore[return-value]
+
+
+def score_job(job: Job, profile: dict) -> ScoredJob:
+    return _score_batch([job], PreparedProfile.from_profile(profile))[0]
+
+
+def _dedupe_jobs(jobs: list[Job]) -> list[Job]:
+    """Drop repeat postings of the same job, keeping the first.
+
+    Sources assign their own ids, so the same posting found by two of them
+    survives id-based dedup; it is matched here by title, company and the
+    start of the description.
+    """
+    seen: set[tuple[str, str, bytes]] = set()
+    unique: list[Job] = []
+    for j in jobs:
+        key = (
+            _normalize(j.title),
+            _normalize(j.company),
+            hashlib.blake2b((j.description or "")[:256].encode("utf-8"), digest_size=8).digest(),
+        )
+        if key not in seen:
+            seen.add(key)
+            unique.append(j)
+    return unique
+
+
+_by_score = attrgetter("score")
+
 
 def filter_and_rank(
-    jobs: list[Job], profile: dict, min_score: float = 0.2
+    jobs: list[Job], profile: dict, min_score: float = 0.2, top_k: int | None = None,
 ) -> list[ScoredJob]:
-    scored = [score_job(j, profile) for j in jobs]
-    result = sorted([s for s in scored if s.score >= min_score], key=lambda s: -s.score)
-    log.info("Scored %d jobs → %d above %.0f%% threshold", len(jobs), len(result), min_score * 100)
-    return result
+    """Jobs scoring at least *min_score*, best first (ties keep input order).
+
+    With *top_k*, only the best *top_k* are returned.
+    """
+    unique = _dedupe_jobs(jobs)
+    if len(unique) < len(jobs):
+        log.info("Dropped %d duplicate job(s) listed by more than one source", len(jobs) - len(unique))
+    jobs = unique
+    scored = _score_batch(jobs, PreparedProfile.from_profile(profile), min_score)
+    kept = [s for s in scored if s.score >= min_score]
+    log.info("Scored %d jobs → %d above %.0f%% threshold", len(jobs), len(kept), min_score * 100)
+    if top_k is not None:
+        return heapq.nlargest(top_k, kept, key=_by_score)
+    kept.sort(key=_by_score, reverse=True)
+    return kept
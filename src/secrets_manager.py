@@ -1,7 +1,10 @@
-"""Encrypt / decrypt .env credentials with a master password — stdlib only.
+"""Encrypt / decrypt .env credentials with a master password.
 
-Uses PBKDF2-HMAC-SHA256 for key derivation and XOR stream cipher.
-Protects credentials from casual reading of config files.
+With the optional ``cryptography`` package, values are sealed with
+AES-256-GCM under a scrypt-derived key; a wrong password or a tampered
+value fails the tag check. Without it, the legacy stdlib scheme
+(PBKDF2-HMAC-SHA256 and an XOR stream) is used, which only protects
+credentials from casual reading of config files. Both formats decrypt.
 """
 from __future__ import annotations
 
@@ -12,12 +15,20 @@ import json
 import os
 from pathlib import Path
 
+try:
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+except ImportError:  # legacy XOR scheme only
+    AESGCM = None
+
 from src.log import get_logger
 
 log = get_logger(__name__)
 
 _SALT_LEN = 16
 _ITERATIONS = 200_000
+_NONCE_LEN = 12
+_TAG_LEN = 16
+_GCM_PREFIX = "v2:"  # AES-GCM tokens; legacy XOR tokens are bare base64
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent
 _ENC_FILE = _PROJECT_ROOT / ".env.enc"
 
@@ -38,19 +49,47 @@ def _derive_key(password: str, salt: bytes, length: int = 32) -> bytes:
     )
 
 
+def _derive_key_scrypt(password: str, salt: bytes) -> bytes:
+    return hashlib.scrypt(password.encode("utf-8"), salt=salt, n=2**14, r=8, p=1, dklen=32)
+
+
 def _xor_bytes(data: bytes, key: bytes) -> bytes:
-    kl = len(key)
-    return bytes(d ^ key[i % kl] for i, d in enumerate(data))
+    """XOR *data* with *key* repeated to its length.
+
+    Done as one big-integer XOR, which runs in C over the whole buffer
+    instead of a Python-level loop per byte.
+    """
+    n = len(data)
+    if not n:
+        return b""
+    stream = (key * (n // len(key) + 1))[:n]
+    return (int.from_bytes(data, "little") ^ int.from_bytes(stream, "little")).to_bytes(n, "little")
 
 
 def encrypt_value(value: str, password: str) -> str:
     salt = os.urandom(_SALT_LEN)
+    if AESGCM is not None:
+        nonce = os.urandom(_NONCE_LEN)
+        sealed = AESGCM(_derive_key_scrypt(password, salt)).encrypt(nonce, value.encode("utf-8"), None)
+        ct, tag = sealed[:-_TAG_LEN], sealed[-_TAG_LEN:]
+        return _GCM_PREFIX + base64.b64encode(salt + nonce + tag + ct).decode("ascii")
     key = _derive_key(password, salt)
     encrypted = _xor_bytes(value.encode("utf-8"), key)
     return base64.b64encode(salt + encrypted).decode("ascii")
 
 
 def decrypt_value(token: str, password: str) -> str:
+    """Decrypt *token*; AES-GCM tokens raise on a wrong password."""
+    if token.startswith(_GCM_PREFIX):
+        if AESGCM is None:
+            raise RuntimeError("Value was encrypted with AES-GCM — `pip install cryptography`")
+        payload = base64.b64decode(token[len(_GCM_PREFIX):])
+        salt = payload[:_SALT_LEN]
+        nonce = payload[_SALT_LEN:_SALT_LEN + _NONCE_LEN]
+        tag = payload[_SALT_LEN + _NONCE_LEN:_SALT_LEN + _NONCE_LEN + _TAG_LEN]
+        ct = payload[_SALT_LEN + _NONCE_LEN + _TAG_LEN:]
+        key = _derive_key_scrypt(password, salt)
+        return AESGCM(key).decrypt(nonce, ct + tag, None).decode("utf-8")
     payload = base64.b64decode(token)
     salt, encrypted = payload[:_SALT_LEN], payload[_SALT_LEN:]
     key = _derive_key(password, salt)
@@ -71,23 +110,28 @@ def encrypt_env(
         if password != confirm:
             raise ValueError("Passwords do not match")
 
+    if AESGCM is None:
+        log.warning("cryptography not installed — using the legacy XOR scheme for .env.enc")
+
     entries: dict[str, str] = {}
-    for line in env_path.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
-            continue
-        key, _, value = line.partition("=")
-        key, value = key.strip(), value.strip()
-        if key in SENSITIVE_KEYS and value:
-            entries[key] = encrypt_value(value, password)
-        else:
-            entries[key] = value
+    with env_path.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if "=" not in line:
+                continue
+            key, _, value = line.partition("=")
+            key, value = key.strip(), value.strip()
+            if key in SENSITIVE_KEYS and value:
+                entries[key] = encrypt_value(value, password)
+            else:
+                entries[key] = value
 
     encrypted_keys = sorted(SENSITIVE_KEYS & set(entries))
     data = {"encrypted_keys": encrypted_keys, "values": entries}
-    _ENC_FILE.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    with _ENC_FILE.open("w", encoding="utf-8") as fh:
+        json.dump(data, fh, indent=2)
     log.info("Credentials encrypted → %s (%d keys)", _ENC_FILE.name, len(encrypted_keys))
     return _ENC_FILE
 
@@ -6,12 +6,9 @@ from __future__ import annotations
 
 import hashlib
 
-import requests
-
 from src.log import get_logger
 from src.models import Job
-from src.retry import retry
-from src.sources.base import JobSearchBase
+from src.sources.base import JobSearchBase, decode_json, fetch_locations, http_session
 
 log = get_logger(__name__)
 
@@ -24,8 +21,8 @@ class AdzunaSource(JobSearchBase):
         self.profile = profile
         self.app_id: str = env_getter("ADZUNA_APP_ID")
         self.app_key: str = env_getter("ADZUNA_APP_KEY")
+        self._session = http_session()
 
-    @retry(max_attempts=3, base_delay=2.0, retryable=(requests.RequestException, OSError))
     def _fetch(self, query: str, location: str, page: int, per_page: int) -> list[Job]:
         params: dict = {
             "app_id": self.app_id,
@@ -37,9 +34,9 @@ class AdzunaSource(JobSearchBase):
         if location:
             params["where"] = location
 
-        r = requests.get(f"{BASE_URL}/{page}", params=params, timeout=15)
+        r = self._session.get(f"{BASE_URL}/{page}", params=params, timeout=15)
         r.raise_for_status()
-        data = r.json()
+        data = decode_json(r)
 
         jobs: list[Job] = []
         for hit in data.get("results", []):
@@ -78,22 +75,8 @@ class AdzunaSource(JobSearchBase):
         if core_roles:
             query = " OR ".join(core_roles[:3])
 
-        all_jobs: list[Job] = []
-        seen_ids: set[str] = set()
-
         search_locs = locations[:2] if locations else [""]
-        for loc in search_locs:
-            if len(all_jobs) >= limit:
-                break
-            try:
-                batch = self._fetch(query, loc, page=1, per_page=min(limit, 20))
-                for j in batch:
-                    if j.id not in seen_ids:
-                        seen_ids.add(j.id)
-                        all_jobs.append(j)
-                log.debug("Adzuna loc=%r returned %d jobs", loc, len(batch))
-            except Exception as exc:
-                log.warning("Adzuna loc=%r error: %s", loc, exc)
-                continue
-
-        return all_jobs[:limit]
+        per_page = min(limit, 20)
+        return fetch_locations(
+            "Adzuna", lambda loc: self._fetch(query, loc, page=1, per_page=per_page), search_locs, limit,
+        )
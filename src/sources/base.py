@@ -1,9 +1,129 @@
+from __future__ import annotations
+
+import json
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # optional: faster JSON encoding/decoding
+except ImportError:  # Response.json() (stdlib json) is used instead
+    orjson = None
 
+from src.log import get_logger
 from src.models import Job
 
+log = get_logger(__name__)
+
 
 class JobSearchBase(ABC):
     @abstractmethod
     def search(self, query: str, locations: list[str], limit: int = 20) -> list[Job]:
         pass
+
+
+# Longest wait between attempts, matching the old @retry max_delay. A
+# worker sleeping on a huge Retry-After would hold up interpreter exit.
+_MAX_RETRY_WAIT = 30.0
+
+
+class _CappedRetry(Retry):
+    """``Retry`` that honours Retry-After only up to ``_MAX_RETRY_WAIT``."""
+
+    def get_retry_after(self, response):
+        after = super().get_retry_after(response)
+        return None if after is None else min(after, _MAX_RETRY_WAIT)
+
+
+def http_session(retries: int = 2, backoff: float = 2.0) -> requests.Session:
+    """Keep-alive session whose pool covers one connection per concurrent fetch.
+
+    Connection errors and 429/5xx responses are retried by urllib3 up to
+    *retries* times with exponential *backoff* (honouring Retry-After, up
+    to 30s), so a retry reuses the pool instead of re-running the caller.
+    Once retries are spent the last response is returned for
+    ``raise_for_status()``.
+    """
+    retry = _CappedRetry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "POST"}),
+        raise_on_status=False,
+    )
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+    return session
+
+
+def decode_json(r: requests.Response) -> Any:
+    """Decode *r*'s JSON body, with orjson straight from the bytes if installed.
+
+    Bodies orjson rejects go through ``r.json()``, so errors (and retries
+    on them) are the same as without it.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(r.content)
+        except orjson.JSONDecodeError:
+            pass
+    return r.json()
+
+
+def encode_json(obj: Any) -> bytes:
+    """Serialise a request body, with orjson if installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), allow_nan=False).encode()
+
+
+def fetch_locations(
+    name: str,
+    fetch: Callable[[str], list[Job]],
+    locations: list[str],
+    limit: int,
+    *,
+    label: str = "loc",
+    max_workers: int | None = None,
+) -> list[Job]:
+    """Call ``fetch(loc)`` for every location concurrently; merge unique jobs.
+
+    Results are merged in location order, so output doesn't depend on
+    which request finishes first. Failed locations are logged and skipped.
+    Works for any list of fetch keys (e.g. queries); *label* names them in
+    logs. At most *max_workers* fetches are in flight, and the next one is
+    only submitted while fewer than *limit* jobs are in, so capping it
+    keeps metered APIs from spending calls that won't be needed.
+    """
+    jobs: list[Job] = []
+    seen_ids: set[str] = set()
+    workers = max(1, min(max_workers or len(locations), len(locations)))
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        pending = deque((loc, pool.submit(fetch, loc)) for loc in locations[:workers])
+        queued = iter(locations[workers:])
+        while pending and len(jobs) < limit:
+            loc, future = pending.popleft()
+            try:
+                batch = future.result()
+            except Exception as exc:
+                log.warning("%s %s=%r error: %s", name, label, loc, exc)
+                batch = []
+            else:
+                for j in batch:
+                    if j.id not in seen_ids:
+                        seen_ids.add(j.id)
+                        jobs.append(j)
+                log.debug("%s %s=%r returned %d jobs", name, label, loc, len(batch))
+            if len(jobs) < limit:
+                nxt = next(queued, None)
+                if nxt is not None:
+                    pending.append((nxt, pool.submit(fetch, nxt)))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return jobs[:limit]
@@ -3,12 +3,9 @@ from __future__ import annotations
 
 import hashlib
 
-import requests
-
 from src.log import get_logger
 from src.models import Job
-from src.retry import retry
-from src.sources.base import JobSearchBase
+from src.sources.base import JobSearchBase, decode_json, fetch_locations, http_session
 
 log = get_logger(__name__)
 
@@ -19,10 +16,10 @@ class JSearchSource(JobSearchBase):
     def __init__(self, profile: dict, env_getter) -> None:
         self.profile = profile
         self.api_key: str = env_getter("JSEARCH_API_KEY")
+        self._session = http_session()
 
-    @retry(max_attempts=3, base_delay=2.0, retryable=(requests.RequestException, OSError))
     def _fetch_location(self, query: str, loc: str, limit: int) -> list[Job]:
-        r = requests.get(
+        r = self._session.get(
             f"{self.BASE}/search",
             params={"query": f"{query} {loc}", "num_pages": "1"},
             headers={
@@ -35,7 +32,7 @@ class JSearchSource(JobSearchBase):
             log.warning("JSearch 403 — subscribe at https://rapidapi.com/letscrape-6bRDu3Sgupt/api/jsearch")
             return []
         r.raise_for_status()
-        data = r.json()
+        data = decode_json(r)
         jobs: list[Job] = []
         for hit in data.get("data", [])[:limit]:
             j = hit.get("job_id") or hit.get("job_title", "")
@@ -61,17 +58,6 @@ class JSearchSource(JobSearchBase):
         if core_roles:
             query = " OR ".join(core_roles[:3])
 
-        jobs: list[Job] = []
-        seen_ids: set[str] = set()
-        for loc in locations[:3]:
-            try:
-                batch = self._fetch_location(query, loc, limit)
-                for j in batch:
-                    if j.id not in seen_ids:
-                        seen_ids.add(j.id)
-                        jobs.append(j)
-                log.debug("JSearch loc=%r returned %d jobs", loc, len(batch))
-            except Exception as exc:
-                log.warning("JSearch loc=%r error: %s", loc, exc)
-                continue
-        return jobs[:limit]
+        return fetch_locations(
+            "JSearch", lambda loc: self._fetch_location(query, loc, limit), locations[:3], limit,
+        )
@@ -8,12 +8,9 @@ from __future__ import annotations
 
 import hashlib
 
-import requests
-
 from src.log import get_logger
 from src.models import Job
-from src.retry import retry
-from src.sources.base import JobSearchBase
+from src.sources.base import JobSearchBase, decode_json, encode_json, http_session
 
 log = get_logger(__name__)
 
@@ -25,26 +22,25 @@ class LinkedInRapidSource(JobSearchBase):
     def __init__(self, profile: dict, env_getter) -> None:
         self.profile = profile
         self.api_key: str = env_getter("RAPIDAPI_KEY")
+        self._session = http_session()
+        self._session.headers.update({
+            "X-RapidAPI-Key": self.api_key,
+            "X-RapidAPI-Host": API_HOST,
+            "Content-Type": "application/json",  # bodies come pre-encoded
+        })
 
-    @retry(max_attempts=3, base_delay=2.0, retryable=(requests.RequestException, OSError))
     def _fetch(self, keywords: str, location: str, limit: int) -> list[Job]:
         payload = {
             "search_terms": keywords,
             "location": location,
             "page": "1",
         }
-        headers = {
-            "X-RapidAPI-Key": self.api_key,
-            "X-RapidAPI-Host": API_HOST,
-            "Content-Type": "application/json",
-        }
-
-        r = requests.post(API_URL, json=payload, headers=headers, timeout=20)
+        r = self._session.post(API_URL, data=encode_json(payload), timeout=20)
         if r.status_code == 403:
             log.warning("LinkedIn RapidAPI 403 — check subscription at https://rapidapi.com")
             return []
         r.raise_for_status()
-        data = r.json()
+        data = decode_json(r)
 
         jobs: list[Job] = []
         results = data if isinstance(data, list) else data.get("results", data.get("jobs", []))
@@ -1,6 +1,7 @@
 """Mock job source for testing and fallback when APIs return no jobs."""
 from __future__ import annotations
 
+import functools
 from datetime import datetime, timezone
 
 from src.log import get_logger
@@ -10,9 +11,41 @@ from src.sources.base import JobSearchBase
 log = get_logger(__name__)
 
 
-def _mock_id(suffix: str) -> str:
-    """Date-based ID so fallback mock jobs are treated as new each day."""
-    return f"mock-{datetime.now(timezone.utc).strftime('%Y-%m-%d')}-{suffix}"
+@functools.lru_cache(maxsize=4)
+def _mock_jobs(day: str, first_title: str) -> tuple[Job, ...]:
+    """Sample jobs for *day*; ids are date-based so they're new each day."""
+    return (
+        Job(
+            id=f"mock-{day}-1",
+            title=first_title,
+            company="TechCorp India",
+            location="Bangalore",
+            url="https://example.com/job/1",
+            description="Kubernetes, cloud, incident response. 8+ years.",
+            posted_at="2 days ago",
+            source="mock",
+        ),
+        Job(
+            id=f"mock-{day}-2",
+            title="Customer Reliability Engineer",
+            company="CloudScale SaaS",
+            location="Hyderabad, Remote",
+            url="https://example.com/job/2",
+            description="SRE, distributed systems, customer-facing escalations.",
+            posted_at="1 week ago",
+            source="mock",
+        ),
+        Job(
+            id=f"mock-{day}-3",
+            title="Technical Support Engineer L4",
+            company="Enterprise Platform Inc",
+            location="Gurgaon",
+            url="https://example.com/job/3",
+            description="L4 support, root cause analysis, SaaS.",
+            posted_at="3 days ago",
+            source="mock",
+        ),
+    )
 
 
 class MockSource(JobSearchBase):
@@ -22,36 +55,5 @@ class MockSource(JobSearchBase):
     def search(self, query: str, locations: list[str], limit: int = 20) -> list[Job]:
         roles = (self.profile.get("core_roles") or self.profile.get("preferred_roles", []))[:3]
         log.info("MockSource generating sample jobs")
-        mock_jobs = [
-            Job(
-                id=_mock_id("1"),
-                title=roles[0] if roles else "Software Engineer",
-                company="TechCorp India",
-                location="Bangalore",
-                url="https://example.com/job/1",
-                description="Kubernetes, cloud, incident response. 8+ years.",
-                posted_at="2 days ago",
-                source="mock",
-            ),
-            Job(
-                id=_mock_id("2"),
-                title="Customer Reliability Engineer",
-                company="CloudScale SaaS",
-                location="Hyderabad, Remote",
-                url="https://example.com/job/2",
-                description="SRE, distributed systems, customer-facing escalations.",
-                posted_at="1 week ago",
-                source="mock",
-            ),
-            Job(
-                id=_mock_id("3"),
-                title="Technical Support Engineer L4",
-                company="Enterprise Platform Inc",
-                location="Gurgaon",
-                url="https://example.com/job/3",
-                description="L4 support, root cause analysis, SaaS.",
-                posted_at="3 days ago",
-                source="mock",
-            ),
-        ]
-        return mock_jobs[:limit]
+        day = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        return list(_mock_jobs(day, roles[0] if roles else "Software Engineer")[:limit])
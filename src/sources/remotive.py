@@ -5,13 +5,11 @@ Docs: https://remotive.com/api/remote-jobs
 from __future__ import annotations
 
 import hashlib
-
-import requests
+import re
 
 from src.log import get_logger
 from src.models import Job
-from src.retry import retry
-from src.sources.base import JobSearchBase
+from src.sources.base import JobSearchBase, decode_json, fetch_locations, http_session
 
 log = get_logger(__name__)
 
@@ -33,20 +31,32 @@ _CATEGORY_MAP: dict[str, str] = {
 }
 
 
+# Seniority/role words too common to narrow a Remotive search.
+_GENERIC: frozenset[str] = frozenset({
+    "senior", "junior", "lead", "staff", "principal", "manager",
+    "engineer", "specialist", "consultant", "ii", "iii", "iv",
+})
+
+# Lookahead so overlapping keywords are all seen; alternation follows map
+# order, so the first alternative at a position is also the best-ranked.
+_KW_RE = re.compile("(?=(" + "|".join(map(re.escape, _CATEGORY_MAP)) + "))")
+_KW_RANK: dict[str, int] = {kw: i for i, kw in enumerate(_CATEGORY_MAP)}
+
+
 def _guess_category(roles: list[str], skills: list[str]) -> str:
     """Pick the most relevant Remotive category from profile signals."""
     for text in roles + skills:
-        for keyword, category in _CATEGORY_MAP.items():
-            if keyword in text.lower():
-                return category
+        hits = _KW_RE.findall(text.lower())
+        if hits:
+            return _CATEGORY_MAP[min(hits, key=_KW_RANK.__getitem__)]
     return ""
 
 
 class RemotiveSource(JobSearchBase):
     def __init__(self, profile: dict, env_getter=None) -> None:
         self.profile = profile
+        self._session = http_session(retries=1, backoff=1.5)
 
-    @retry(max_attempts=2, base_delay=1.5, retryable=(requests.RequestException, OSError))
     def _fetch(self, search: str, category: str, limit: int) -> list[Job]:
         params: dict = {"limit": limit}
         if search:
@@ -54,9 +64,9 @@ class RemotiveSource(JobSearchBase):
         if category:
             params["category"] = category
 
-        r = requests.get(API_URL, params=params, timeout=15)
+        r = self._session.get(API_URL, params=params, timeout=15)
         r.raise_for_status()
-        data = r.json()
+        data = decode_json(r)
 
         jobs: list[Job] = []
         for hit in data.get("jobs", []):
@@ -93,13 +103,10 @@ class RemotiveSource(JobSearchBase):
         # Remotive works best with short, broad search terms — not full role titles.
         # Extract distinctive keywords from core roles.
         search_terms: list[str] = []
-        generic = {"senior", "junior", "lead", "staff", "principal", "manager",
-                    "engineer", "specialist", "consultant", "ii", "iii", "iv"}
         for role in core_roles[:2]:
-            words = role.lower().split()
-            distinctive = [w for w in words if w not in generic]
-            if distinctive:
-                search_terms.append(distinctive[0])
+            term = next((w for w in role.lower().split() if w not in _GENERIC), None)
+            if term:
+                search_terms.append(term)
         if not search_terms:
             search_terms.append(query.split()[0] if query else "engineer")
 
@@ -107,18 +114,11 @@ class RemotiveSource(JobSearchBase):
         # on Remotive's relatively small dataset).
         category = _guess_category(core_roles + stretch_roles, skills)
 
-        all_jobs: list[Job] = []
-        seen_ids: set[str] = set()
-        for term in search_terms:
-            try:
-                batch = self._fetch(term, category="", limit=limit)
-                for j in batch:
-                    if j.id not in seen_ids:
-                        seen_ids.add(j.id)
-                        all_jobs.append(j)
-                log.debug("Remotive search=%r returned %d jobs", term, len(batch))
-            except Exception as exc:
-                log.warning("Remotive search=%r error: %s", term, exc)
+        all_jobs = fetch_locations(
+            "Remotive", lambda term: self._fetch(term, category="", limit=limit), search_terms, limit,
+            label="search",
+        )
+        seen_ids = {j.id for j in all_jobs}
 
         # If keyword search yielded nothing, try category-only
         if not all_jobs and category:
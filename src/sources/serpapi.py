@@ -2,13 +2,16 @@
 from __future__ import annotations
 
 import hashlib
+import itertools
 
-import requests
+try:
+    import ijson  # optional: streaming JSON parser
+except ImportError:  # the full response is decoded with decode_json()
+    ijson = None
 
 from src.log import get_logger
 from src.models import Job
-from src.retry import retry
-from src.sources.base import JobSearchBase
+from src.sources.base import JobSearchBase, decode_json, fetch_locations, http_session
 
 log = get_logger(__name__)
 
@@ -28,43 +31,53 @@ class SerpApiSource(JobSearchBase):
     def __init__(self, profile: dict, env_getter) -> None:
         self.profile = profile
         self.api_key: str = env_getter("SERPAPI_KEY")
+        self._session = http_session()
+        self._base_params: dict[str, str] = {"engine": "google_jobs", "api_key": self.api_key}
 
-    @retry(max_attempts=3, base_delay=2.0, retryable=(requests.RequestException, OSError))
     def _fetch(self, query: str, location: str, limit: int) -> list[Job]:
         jobs: list[Job] = []
-        r = requests.get(
+        # With ijson, parse only the first *limit* hits straight off the
+        # socket instead of materialising the whole ~100 KB payload.
+        stream = ijson is not None
+        with self._session.get(
             "https://serpapi.com/search",
-            params={
-                "engine": "google_jobs",
-                "q": query,
-                "location": location,
-                "api_key": self.api_key,
-            },
+            params={**self._base_params, "q": query, "location": location},
             timeout=20,
-        )
-        r.raise_for_status()
-        data = r.json()
-        for hit in data.get("jobs_results", [])[:limit]:
-            title = hit.get("title", "")
-            company = hit.get("company_name", "")
-            job_id = hashlib.sha256(
-                (title + company + hit.get("location", "")).encode()
-            ).hexdigest()[:12]
-            jobs.append(
-                Job(
-                    id=job_id,
-                    title=title,
-                    company=company,
-                    location=hit.get("location", ""),
-                    url=_best_apply_link(hit),
-                    description=hit.get("description", ""),
-                    posted_at=hit.get("detected_extensions", {}).get("posted_at"),
-                    source="serpapi",
-                    raw=hit,
-                )
-            )
+            stream=stream,
+        ) as r:
+            r.raise_for_status()
+            if stream:
+                r.raw.decode_content = True
+                hits = itertools.islice(ijson.items(r.raw, "jobs_results.item", use_float=True), limit)
+            else:
+                hits = decode_json(r).get("jobs_results", [])[:limit]
+            for hit in hits:
+                jobs.append(self._to_job(hit))
+            if stream:
+                # Drain the unparsed tail so the keep-alive connection is reused.
+                for _ in r.iter_content(chunk_size=65536):
+                    pass
         return jobs
 
+    @staticmethod
+    def _to_job(hit: dict) -> Job:
+        title = hit.get("title", "")
+        company = hit.get("company_name", "")
+        job_id = hashlib.sha256(
+            (title + company + hit.get("location", "")).encode()
+        ).hexdigest()[:12]
+        return Job(
+            id=job_id,
+            title=title,
+            company=company,
+            location=hit.get("location", ""),
+            url=_best_apply_link(hit),
+            description=hit.get("description", ""),
+            posted_at=hit.get("detected_extensions", {}).get("posted_at"),
+            source="serpapi",
+            raw=hit,
+        )
+
     def search(self, query: str, locations: list[str], limit: int = 20) -> list[Job]:
         loc_str = (locations[0] + ", India") if locations else "India"
         core_roles = self.profile.get("core_roles", [])
@@ -80,21 +93,9 @@ class SerpApiSource(JobSearchBase):
         if not queries:
             queries.append(query)
 
-        all_jobs: list[Job] = []
-        seen_ids: set[str] = set()
-
-        for q in queries:
-            if len(all_jobs) >= limit:
-                break
-            try:
-                batch = self._fetch(q, loc_str, limit=10)
-                for j in batch:
-                    if j.id not in seen_ids:
-                        seen_ids.add(j.id)
-                        all_jobs.append(j)
-                log.debug("SerpAPI query=%r returned %d jobs", q, len(batch))
-            except Exception as exc:
-                log.warning("SerpAPI query=%r error: %s", q, exc)
-                continue
-
-        return all_jobs[:limit]
+        # SerpAPI is metered: run only as many queries at once as could
+        # fill *limit* (10 hits each); the rest start only if still needed.
+        return fetch_locations(
+            "SerpAPI", lambda q: self._fetch(q, loc_str, limit=10), queries, limit,
+            label="query", max_workers=-(-limit // 10),
+        )
@@ -1,8 +1,19 @@
-"""Track applications in a structured table (CSV) with file locking."""
+"""Track applications in a structured table (CSV) with file locking.
+
+The CSV is append-only: a status change appends a copy of the job's row
+with the new status, and readers fold the log so the latest row per
+job_id wins. ``compact()`` drops superseded rows once they pile up.
+"""
 from __future__ import annotations
 
+import atexit
 import csv
 import fcntl
+import functools
+import os
+import queue
+import re
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -17,6 +28,8 @@ HEADERS: list[str] = [
     "job_id", "title", "company", "url", "applied_at",
     "status", "cover_letter_path", "score",
 ]
+# Column positions in HEADERS; rows are handled as plain lists internally.
+I_JOB_ID, I_STATUS = 0, 5
 
 
 def _lock(f, exclusive: bool = True) -> None:
@@ -45,59 +58,208 @@ def ensure_tracker() -> None:
         log.info("Created application tracker → %s", APPLICATIONS_CSV.name)
 
 
+_NEEDS_QUOTES = re.compile(r'[,"\r\n]')
+
+
+def _format_row(values: tuple[str, ...]) -> str:
+    """One CSV line, quoted like ``csv.writer``'s default (QUOTE_MINIMAL) dialect."""
+    return ",".join(
+        '"' + v.replace('"', '""') + '"' if _NEEDS_QUOTES.search(v) else v
+        for v in values
+    ) + "\r\n"
+
+
 def record_application(
     scored: ScoredJob,
     cover_letter_path: str | None = None,
     status: str = "suggested",
 ) -> None:
     ensure_tracker()
-    row = {
-        "job_id": scored.job.id,
-        "title": scored.job.title,
-        "company": scored.job.company,
-        "url": scored.job.url,
-        "applied_at": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M"),
-        "status": status,
-        "cover_letter_path": cover_letter_path or "",
-        "score": f"{scored.score:.2f}",
-    }
-    with open(APPLICATIONS_CSV, "a", newline="", encoding="utf-8") as f:
-        _lock(f)
-        csv.DictWriter(f, fieldnames=HEADERS).writerow(row)
-        _unlock(f)
+    row = (
+        scored.job.id,
+        scored.job.title,
+        scored.job.company,
+        scored.job.url,
+        datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M"),
+        status,
+        cover_letter_path or "",
+        f"{scored.score:.2f}",
+    )
+    _start_writer()
+    _Q.put(_format_row(row))
     log.debug("Tracked: %s @ %s [%s]", scored.job.title, scored.job.company, status)
 
 
-def get_applications() -> list[dict[str, str]]:
-    ensure_tracker()
-    with open(APPLICATIONS_CSV, "r", encoding="utf-8") as f:
+# Appends go through one background writer so the agent's loop never waits
+# on open/flock; it takes the lock once per batch of queued rows. Readers
+# call flush() first, so they always see every recorded row.
+_Q: queue.Queue[str] = queue.Queue()
+_BATCH = 32
+_writer: threading.Thread | None = None
+_writer_lock = threading.Lock()
+
+
+def _start_writer() -> None:
+    global _writer
+    if _writer is not None:
+        return
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(target=_write_loop, name="tracker-writer", daemon=True)
+            _writer.start()
+            atexit.register(flush)
+
+
+def _write_loop() -> None:
+    while True:
+        rows = [_Q.get()]
+        while len(rows) < _BATCH:
+            try:
+                rows.append(_Q.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            with open(APPLICATIONS_CSV, "a", newline="", encoding="utf-8") as f:
+                _lock(f)
+                f.write("".join(rows))
+                _unlock(f)
+        except OSError as exc:
+            log.error("Could not write %d tracker row(s): %s", len(rows), exc)
+        finally:
+            for _ in rows:
+                _Q.task_done()
+
+
+def flush() -> None:
+    """Block until every recorded application is on disk."""
+    _Q.join()
+
+
+def _fold(rows) -> list[list[str]]:
+    """Latest non-empty row per job_id, in order of each job's first appearance."""
+    latest: dict[str, list[str]] = {}
+    for r in rows:
+        if r:
+            latest[r[I_JOB_ID]] = r
+    return list(latest.values())
+
+
+def _as_dict(row: list[str]) -> dict[str, str]:
+    return dict(zip(HEADERS, row))
+
+
+def _stamp() -> tuple[int, int, int]:
+    """Identity of the CSV's current contents: (inode, size, mtime_ns)."""
+    st = APPLICATIONS_CSV.stat()
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+@functools.lru_cache(maxsize=1)
+def _load(stamp: tuple[int, int, int]) -> tuple[list[str], ...]:
+    with open(APPLICATIONS_CSV, "r", newline="", encoding="utf-8") as f:
+        _lock(f, exclusive=False)
+        reader = csv.reader(f)
+        next(reader, None)
+        rows = _fold(reader)
+        _unlock(f)
+    return tuple(rows)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_ids(stamp: tuple[int, int, int]) -> frozenset[str]:
+    with open(APPLICATIONS_CSV, "r", newline="", encoding="utf-8") as f:
         _lock(f, exclusive=False)
-        rows = list(csv.DictReader(f))
+        reader = csv.reader(f)
+        next(reader, None)
+        ids = frozenset(row[I_JOB_ID] for row in reader if row)
         _unlock(f)
-    return rows
+    return ids
+
+
+def get_applications(tail: int | None = None) -> list[dict[str, str]]:
+    """All tracked applications (latest row per job), oldest first.
+
+    The read is memoised on the file's size and mtime, so repeated calls
+    within a run parse the CSV once. With *tail*, only the last *tail*
+    jobs are returned. Status changes append rows, so the last physical
+    rows don't map to the most recent jobs; the tail comes from the full
+    fold instead.
+    """
+    flush()
+    ensure_tracker()
+    rows = _load(_stamp())
+    if tail is not None:
+        rows = rows[-tail:] if tail > 0 else ()
+    return [_as_dict(r) for r in rows]
 
 
 def get_applied_job_ids() -> set[str]:
-    return {r["job_id"] for r in get_applications()}
+    """Job ids already in the tracker, read from the job_id column only.
+
+    Memoised like ``get_applications``; callers get their own mutable set.
+    """
+    flush()
+    ensure_tracker()
+    return set(_load_ids(_stamp()))
+
+
+def update_statuses(updates: dict[str, str]) -> int:
+    """Set the status of several applications in one pass; returns how many matched.
+
+    Reads the CSV once and appends a copy of each matched job's latest
+    row with its new status in a single write; the file is never rewritten.
+    """
+    if not updates:
+        return 0
+    flush()
+    ensure_tracker()
+    with open(APPLICATIONS_CSV, "r+", newline="", encoding="utf-8") as f:
+        _lock(f)
+        latest: dict[str, list[str]] = {}
+        for r in csv.reader(f):
+            if r and r[I_JOB_ID] in updates:
+                latest[r[I_JOB_ID]] = r
+        for job_id, r in latest.items():
+            r[I_STATUS] = updates[job_id]
+        if latest:
+            f.seek(0, os.SEEK_END)
+            f.write("".join(map(_format_row, latest.values())))
+        _unlock(f)
+    for job_id, status in updates.items():
+        if job_id in latest:
+            log.debug("Updated %s → %s", job_id, status)
+    return len(latest)
 
 
 def update_status(job_id: str, status: str) -> bool:
     """Update status of an existing application (e.g. suggested -> applied)."""
+    return update_statuses({job_id: status}) == 1
+
+
+def compact() -> int:
+    """Drop superseded rows once they outnumber the live ones.
+
+    Rewrites the CSV in place (under the exclusive lock) only when it holds
+    more than twice as many rows as distinct jobs. Returns rows dropped.
+    """
+    flush()
     ensure_tracker()
-    rows = list(get_applications())
-    found = False
-    for r in rows:
-        if r.get("job_id") == job_id:
-            r["status"] = status
-            found = True
-            break
-    if not found:
-        return False
-    with open(APPLICATIONS_CSV, "w", newline="", encoding="utf-8") as f:
+    with open(APPLICATIONS_CSV, "r+", newline="", encoding="utf-8") as f:
         _lock(f)
-        w = csv.DictWriter(f, fieldnames=HEADERS)
-        w.writeheader()
-        w.writerows(rows)
+        reader = csv.reader(f)
+        next(reader, None)
+        rows = [r for r in reader if r]
+        live = _fold(rows)
+        dropped = len(rows) - len(live)
+        if len(rows) > 2 * len(live):
+            f.seek(0)
+            w = csv.writer(f)
+            w.writerow(HEADERS)
+            w.writerows(live)
+            f.truncate()
+        else:
+            dropped = 0
         _unlock(f)
-    log.debug("Updated %s → %s", job_id, status)
-    return True
+    if dropped:
+        log.info("Compacted tracker: dropped %d superseded row(s)", dropped)
+    return dropped